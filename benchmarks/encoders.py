@@ -0,0 +1,245 @@
+import sys
+import os
+import json
+import time
+import platform
+import argparse
+import logging
+
+# --- Path Setup ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+# --- Core Imports ---
+import pysat
+from pysat.formula import And
+from core.encoding_context import EncodingContext
+from mra.agent import Agent
+from mra.problem import MRA
+from mra.generator import random_mra
+from utils.logging_helper import get_logger, set_log_level
+
+from encoding.SBMF_2021.definition_12 import encode_initial_state
+from encoding.SBMF_2021.definition_13 import encode_evolution
+from encoding.SBMF_2021.definition_14 import encode_goal_reachability_formula
+from encoding.SBMF_2021.definition_15 import encode_protocol, h_get_all_observed_resource_states
+from encoding.SBMF_2021.definition_17 import encode_resource_state_at_t
+from encoding.SBMF_2021.definition_18 import encode_state_observation_by_agent_at_t
+from encoding.SBMF_2021.definition_19 import encode_goal
+from encoding.SBMF_2021.definition_20 import encode_action
+from encoding.SBMF_2021.definition_21 import encode_strategic_decision
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+from encoding.EUMAS_2025.implementation_guide.definition_2 import encode_m_loop
+from encoding.EUMAS_2025.implementation_guide.definition_2_1 import encode_valid_states
+from encoding.EUMAS_2025.implementation_guide.definition_2_2 import encode_looped
+from encoding.EUMAS_2025.implementation_guide.definition_2_3 import encode_aux_loop_closed
+from encoding.EUMAS_2025.implementation_guide.definition_3 import encode_infinite_goal_reachability
+from encoding.EUMAS_2025.implementation_guide.definition_4 import encode_optimal_goal_reachability
+from encoding.EUMAS_2025.implementation_guide.definition_4_1 import encode_aux_loop_size
+from encoding.EUMAS_2025.implementation_guide.definition_4_2 import encode_aux_goal
+from encoding.SCP_2023.definition_33 import encode_frequency_optimisation
+
+logger = get_logger("encoder_benchmark")
+
+# Bump when the meaning of a field changes, so stale baselines are not compared.
+SCHEMA = "satmas-encoder-benchmark/1"
+
+# Scaling curves: every parameter is swept on its own while the others stay at
+# the base point.
+BASE_POINT = {'agents': 3, 'resources': 4, 'density': 0.5, 'demand': 1, 'k': 4}
+# The protocol (Definition 15) grows with the number of observations, i.e.
+# exponentially in the access degree, so resources and density stop where a
+# single point still encodes in seconds.
+SWEEPS = {
+    'agents': [2, 3, 4, 5],
+    'resources': [3, 4, 5, 6],
+    'density': [0.25, 0.5, 0.75],
+    'demand': [1, 2],
+    'k': [2, 4, 8, 12],
+}
+QUICK_SWEEPS = {
+    'agents': [2, 3],
+    'k': [2, 4],
+}
+
+def h_actions(agent: Agent) -> list:
+    return ["idle", "relall"] + [f"{action}{r}" for r in sorted(agent.acc) for action in ("req", "rel")]
+
+# Definition name -> encoder (mra, k) -> Formula. Definitions that encode a single
+# item (one resource state, one action, ...) are benchmarked over all items up to k.
+DEFINITIONS = {
+    "SBMF_2021.12": lambda mra, k: encode_initial_state(mra, mra.num_agents_plus()),
+    "SBMF_2021.13": lambda mra, k: And(*(encode_evolution(mra, t) for t in range(k))),
+    "SBMF_2021.14": lambda mra, k: encode_goal_reachability_formula(mra.agt, mra.num_agents_plus(), k),
+    "SBMF_2021.15": lambda mra, k: encode_protocol(mra.agt, mra.num_agents_plus(), mra.num_resources(), k),
+    "SBMF_2021.17": lambda mra, k: And(*(
+        encode_resource_state_at_t(r, a, t, mra.num_agents_plus())
+        for t in range(k + 1) for r in sorted(mra.res) for a in range(mra.num_agents_plus())
+    )),
+    "SBMF_2021.18": lambda mra, k: And(*(
+        encode_state_observation_by_agent_at_t(observation, mra.num_agents_plus(), t)
+        for t in range(k + 1) for agent in mra.agt
+        for observation in h_get_all_observed_resource_states(agent, mra.agt)
+    )),
+    "SBMF_2021.19": lambda mra, k: And(*(
+        encode_goal(agent, t, mra.num_agents_plus())
+        for t in range(k + 1) for agent in mra.agt
+    )),
+    "SBMF_2021.20": lambda mra, k: And(*(
+        encode_action(action, agent, mra.num_resources(), t)
+        for t in range(k + 1) for agent in mra.agt for action in h_actions(agent)
+    )),
+    "SBMF_2021.21": lambda mra, k: And(*(
+        encode_strategic_decision(action, observation, agent, mra.num_resources(), 0)
+        for agent in mra.agt
+        for observation in h_get_all_observed_resource_states(agent, mra.agt)
+        for action in h_actions(agent)
+    )),
+    "EUMAS_2025.1": lambda mra, k: encode_formula_f_agt_infinity_hard_clauses(mra, k),
+    "EUMAS_2025.2": lambda mra, k: encode_m_loop(mra, k),
+    "EUMAS_2025.2.1": lambda mra, k: encode_valid_states(mra),
+    "EUMAS_2025.2.2": lambda mra, k: encode_looped(mra, k),
+    "EUMAS_2025.2.3": lambda mra, k: encode_aux_loop_closed(mra, k),
+    "EUMAS_2025.3": lambda mra, k: encode_infinite_goal_reachability(mra, k),
+    "EUMAS_2025.4": lambda mra, k: encode_optimal_goal_reachability(mra, k),
+    "EUMAS_2025.4.1": lambda mra, k: encode_aux_loop_size(k),
+    "EUMAS_2025.4.2": lambda mra, k: encode_aux_goal(mra, k),
+    "SCP_2023.33": lambda mra, k: encode_frequency_optimisation(mra, k),
+}
+
+def measure(encoder, mra: MRA, k: int, repeat: int) -> dict:
+    """
+    Encodes and clausifies one Definition repeat times from a fresh pysat context
+    and reports the fastest run.
+    """
+    encode_times, clausify_times = [], []
+    for _ in range(repeat):
+        with EncodingContext() as context:
+            start_time = time.perf_counter()
+            formula = context.encode(encoder, mra, k)
+            encode_times.append(time.perf_counter() - start_time)
+
+            start_time = time.perf_counter()
+            clauses = context.clausify(formula)
+            clausify_times.append(time.perf_counter() - start_time)
+
+    return {
+        'encode_time': min(encode_times),
+        'clausify_time': min(clausify_times),
+        'num_named_vars': context.vpool.top,
+        'num_vars': max((abs(lit) for clause in clauses for lit in clause), default=0),
+        'num_clauses': len(clauses),
+        'num_literals': sum(len(clause) for clause in clauses),
+    }
+
+def run_benchmarks(definitions: list, sweeps: dict, repeat: int = 3, seed: int = 0) -> dict:
+    """
+    Runs every Definition on every point of the scaling curves.
+
+    Returns:
+        JSON-serialisable report (see SCHEMA)
+    """
+    results = []
+    for name in definitions:
+        encoder = DEFINITIONS[name]
+        for parameter, values in sweeps.items():
+            for value in values:
+                params = dict(BASE_POINT, **{parameter: value})
+                mra = random_mra(params['agents'], params['resources'], params['density'], params['demand'], seed)
+                logger.info(f"{name}: {parameter}={value}")
+                results.append({
+                    'definition': name,
+                    'sweep': parameter,
+                    'params': params,
+                    **measure(encoder, mra, params['k'], repeat),
+                })
+
+    return {
+        'schema': SCHEMA,
+        'environment': {
+            'python': platform.python_version(),
+            'pysat': pysat.__version__,
+            'platform': platform.platform(),
+        },
+        'seed': seed,
+        'repeat': repeat,
+        'results': results,
+    }
+
+def compare(report: dict, baseline: dict, time_tolerance: float = 0.25, min_time_delta: float = 0.01) -> list:
+    """
+    Lists the differences between a report and a baseline: any change of the
+    variable or clause counts, and encode/clausify times that grew by more than
+    time_tolerance (relative) and min_time_delta seconds (to ignore timer noise
+    on the smallest points).
+    """
+    if baseline.get('schema') != report['schema']:
+        return [f"Baseline schema {baseline.get('schema')} differs from {report['schema']}"]
+
+    def key(result):
+        return (result['definition'], result['sweep'], json.dumps(result['params'], sort_keys=True))
+
+    baseline_results = {key(result): result for result in baseline['results']}
+    problems = []
+    for result in report['results']:
+        old = baseline_results.get(key(result))
+        if old is None:
+            continue
+        label = f"{result['definition']} {result['sweep']}={result['params'][result['sweep']]}"
+        for field in ('num_vars', 'num_named_vars', 'num_clauses', 'num_literals'):
+            if result[field] != old[field]:
+                problems.append(f"{label}: {field} {old[field]} -> {result[field]}")
+        for field in ('encode_time', 'clausify_time'):
+            if result[field] > old[field] * (1 + time_tolerance) and result[field] - old[field] > min_time_delta:
+                problems.append(f"{label}: {field} {old[field]:.4f}s -> {result[field]:.4f}s")
+    return problems
+
+def format_report(report: dict) -> str:
+    header = f"{'definition':<16} {'sweep':<10} {'value':>6} {'encode [s]':>11} {'clausify [s]':>13} {'vars':>9} {'clauses':>9}"
+    lines = [header, "-" * len(header)]
+    for result in report['results']:
+        lines.append(
+            f"{result['definition']:<16} {result['sweep']:<10} {str(result['params'][result['sweep']]):>6} "
+            f"{result['encode_time']:>11.4f} {result['clausify_time']:>13.4f} {result['num_vars']:>9} {result['num_clauses']:>9}"
+        )
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time and size every encoder Definition along scaling curves.")
+    parser.add_argument(
+        "--definitions",
+        nargs="*",
+        default=list(DEFINITIONS),
+        help=f"Definitions to benchmark (default: all of {', '.join(DEFINITIONS)})"
+    )
+    parser.add_argument("--quick", action="store_true", help="Only sweep agents and k over two values each")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per point, the fastest is reported")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the random access sets")
+    parser.add_argument("--output", type=str, default=None, help="Write the report as JSON to this file")
+    parser.add_argument("--compare", type=str, default=None, help="Baseline JSON report to compare against")
+    parser.add_argument("--time_tolerance", type=float, default=0.25, help="Allowed relative slowdown when comparing")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every benchmark point")
+
+    args = parser.parse_args()
+    set_log_level(logging.INFO if args.verbose else logging.WARNING)
+
+    unknown = [name for name in args.definitions if name not in DEFINITIONS]
+    if unknown:
+        logger.error(f"Unknown definitions: {unknown}")
+        sys.exit(1)
+
+    report = run_benchmarks(args.definitions, QUICK_SWEEPS if args.quick else SWEEPS, args.repeat, args.seed)
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            problems = compare(report, json.load(f), args.time_tolerance)
+        for problem in problems:
+            print(problem)
+        sys.exit(1 if problems else 0)
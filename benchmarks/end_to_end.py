@@ -0,0 +1,234 @@
+import sys
+import os
+import json
+import time
+import logging
+import argparse
+import platform
+import resource
+import tempfile
+import multiprocessing
+
+import yaml
+
+# --- Path Setup ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+# --- Core Imports ---
+import pysat
+from utils.yaml_parser import parse_mra_from_yaml
+from utils.logging_helper import get_logger, set_log_level
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import iterative_optimal_loop_synthesis_parallel
+
+logger = get_logger("end_to_end_benchmark")
+
+SCHEMA = "satmas-end-to-end-benchmark/1"
+DEFAULT_CORPUS = os.path.join(script_dir, "regression", "corpus.yml")
+DEFAULT_BASELINE = os.path.join(script_dir, "regression", "baseline.json")
+
+# ru_maxrss is reported in KiB on Linux and in bytes on macOS.
+_MAXRSS_TO_MIB = 1 / 1024 if sys.platform != "darwin" else 1 / (1024 * 1024)
+
+def _measured_call(func, args: tuple) -> tuple:
+    result = func(*args)
+    # RUSAGE_CHILDREN would include the worker's own peak from before the exec of
+    # open-wbo, so the solver's peak is the one sampled by OpenWBOSolver
+    usage = {
+        'worker_peak_rss_mib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_TO_MIB,
+        'solver_peak_rss_mib': result.get('solver_peak_rss_mib'),
+    }
+    return result, usage
+
+class MeasuringPool:
+    """
+    Worker pool for iterative_optimal_loop_synthesis_parallel that runs every k in
+    a fresh process and records the per-k results together with the peak RSS of
+    the worker (encoding) and of its open-wbo child (solving).
+    """
+    def __init__(self, processes: int | None = None):
+        self.processes = processes or os.cpu_count() or 1
+        self.measurements = []
+
+    def starmap(self, func, iterable) -> list:
+        with multiprocessing.Pool(processes=self.processes, maxtasksperchild=1) as pool:
+            outputs = pool.starmap(_measured_call, [(func, args) for args in iterable])
+        self.measurements.extend(outputs)
+        return [result for result, _ in outputs]
+
+def load_corpus(corpus_path: str) -> list:
+    with open(corpus_path) as f:
+        return yaml.safe_load(f)['scenarios']
+
+def benchmark_scenario(scenario: str, open_wbo_binary_path: str | None, num_processes: int | None) -> dict:
+    """
+    Solves one scenario of the corpus without cache and reports the optimum and
+    the per-k measurements.
+    """
+    mra, k_start, k_end = parse_mra_from_yaml(os.path.join(project_root, scenario))
+    pool = MeasuringPool(num_processes)
+
+    with tempfile.TemporaryDirectory() as cache_root:
+        start_time = time.time()
+        best_k, best_cost, _ = iterative_optimal_loop_synthesis_parallel(
+            mra, k_start, k_end,
+            log_level=logging.WARNING,
+            use_cache=False,
+            open_wbo_binary_path=open_wbo_binary_path,
+            pool=pool,
+            cache_root=cache_root,
+            engine="sat"
+        )
+        wall_time = time.time() - start_time
+
+    per_k = {}
+    for result, usage in sorted(pool.measurements, key=lambda measurement: measurement[0]['k']):
+        per_k[str(result['k'])] = {
+            'status': result['status'],
+            'cost': result['cost'],
+            'encoding_time': result.get('encoding_time'),
+            'write_time': result.get('write_time'),
+            'solving_time': result.get('solving_time'),
+            'num_vars': result.get('num_vars'),
+            'num_clauses': result.get('num_clauses'),
+            **usage,
+        }
+
+    return {
+        'k_start': k_start,
+        'k_end': k_end,
+        'best_k': best_k,
+        'best_cost': best_cost if best_k != -1 else None,
+        'wall_time': wall_time,
+        'k': per_k,
+    }
+
+def run_corpus(scenarios: list, open_wbo_binary_path: str | None, num_processes: int | None) -> dict:
+    results = {}
+    for scenario in scenarios:
+        logger.warning(f"Benchmarking {scenario}")
+        results[scenario] = benchmark_scenario(scenario, open_wbo_binary_path, num_processes)
+    return {
+        'schema': SCHEMA,
+        'environment': {
+            'python': platform.python_version(),
+            'pysat': pysat.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'scenarios': results,
+    }
+
+def _grew(new, old, tolerance: float, min_delta: float) -> bool:
+    if new is None or old is None:
+        return False
+    return new > old * (1 + tolerance) and new - old > min_delta
+
+def compare(
+    report: dict,
+    baseline: dict,
+    time_tolerance: float = 0.5,
+    min_time_delta: float = 0.5,
+    rss_tolerance: float = 0.25,
+    min_rss_delta: float = 16.0
+) -> list:
+    """
+    Lists the regressions of a report against a baseline:
+
+      - any change of the optimum (best k, cost) or of the status or cost of a k
+      - encode, write and solve times that grew by more than time_tolerance
+        (relative) and min_time_delta seconds
+      - peak RSS that grew by more than rss_tolerance (relative) and min_rss_delta MiB
+    """
+    if baseline.get('schema') != report['schema']:
+        return [f"Baseline schema {baseline.get('schema')} differs from {report['schema']}"]
+
+    regressions = []
+    for scenario, result in report['scenarios'].items():
+        old = baseline['scenarios'].get(scenario)
+        if old is None:
+            logger.warning(f"{scenario} is not in the baseline")
+            continue
+        if (result['best_k'], result['best_cost']) != (old['best_k'], old['best_cost']):
+            regressions.append(
+                f"{scenario}: optimum changed from k={old['best_k']} cost={old['best_cost']} "
+                f"to k={result['best_k']} cost={result['best_cost']}"
+            )
+        for k, measurement in result['k'].items():
+            old_measurement = old['k'].get(k)
+            if old_measurement is None:
+                continue
+            label = f"{scenario} k={k}"
+            for field in ('status', 'cost'):
+                if measurement[field] != old_measurement[field]:
+                    regressions.append(f"{label}: {field} {old_measurement[field]} -> {measurement[field]}")
+            for field in ('encoding_time', 'write_time', 'solving_time'):
+                if _grew(measurement[field], old_measurement[field], time_tolerance, min_time_delta):
+                    regressions.append(f"{label}: {field} {old_measurement[field]:.3f}s -> {measurement[field]:.3f}s")
+            for field in ('worker_peak_rss_mib', 'solver_peak_rss_mib'):
+                if _grew(measurement[field], old_measurement[field], rss_tolerance, min_rss_delta):
+                    regressions.append(f"{label}: {field} {old_measurement[field]:.0f} MiB -> {measurement[field]:.0f} MiB")
+    return regressions
+
+def format_report(report: dict) -> str:
+    header = f"{'scenario':<64} {'k':>3} {'status':<20} {'cost':>8} {'encode [s]':>10} {'write [s]':>9} {'solve [s]':>9} {'RSS [MiB]':>9}"
+    lines = [header, "-" * len(header)]
+    for scenario, result in report['scenarios'].items():
+        for k, measurement in result['k'].items():
+            lines.append(
+                f"{scenario:<64} {k:>3} {str(measurement['status']):<20} {str(measurement['cost']):>8} "
+                f"{measurement['encoding_time'] or 0:>10.3f} {measurement['write_time'] or 0:>9.3f} "
+                f"{measurement['solving_time'] or 0:>9.3f} "
+                f"{max(measurement['worker_peak_rss_mib'], measurement['solver_peak_rss_mib'] or 0):>9.0f}"
+            )
+        lines.append(f"{scenario:<64} best k = {result['best_k']}, cost = {result['best_cost']}, wall time = {result['wall_time']:.3f}s")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="End-to-end regression benchmark of the optimal loop synthesis.")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Corpus file listing the scenarios")
+    parser.add_argument("--scenarios", nargs="*", default=None, help="Only run these corpus entries")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON report")
+    parser.add_argument("--update_baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--output", default=None, help="Write the results as JSON to this file")
+    parser.add_argument("--open_wbo", default=None, help="Path to the open-wbo binary")
+    parser.add_argument("--num_processes", type=int, default=None, help="Worker processes per sweep")
+    parser.add_argument("--time_tolerance", type=float, default=0.5, help="Allowed relative slowdown per phase")
+    parser.add_argument("--min_time_delta", type=float, default=0.5, help="Slowdowns below this many seconds are ignored")
+    parser.add_argument("--rss_tolerance", type=float, default=0.25, help="Allowed relative growth of the peak RSS")
+    parser.add_argument("--min_rss_delta", type=float, default=16.0, help="RSS growth below this many MiB is ignored")
+    args = parser.parse_args()
+    set_log_level(logging.WARNING)
+
+    scenarios = load_corpus(args.corpus)
+    if args.scenarios:
+        scenarios = [scenario for scenario in scenarios if scenario in args.scenarios]
+
+    report = run_corpus(scenarios, args.open_wbo, args.num_processes)
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --update_baseline first")
+        sys.exit(0)
+
+    with open(args.baseline) as f:
+        regressions = compare(
+            report, json.load(f),
+            args.time_tolerance, args.min_time_delta, args.rss_tolerance, args.min_rss_delta
+        )
+    for regression in regressions:
+        print(regression)
+    print(f"{len(regressions)} regressions against {args.baseline}")
+    sys.exit(1 if regressions else 0)
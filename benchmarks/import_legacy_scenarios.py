@@ -0,0 +1,51 @@
+import sys
+import os
+import glob
+import argparse
+
+# --- Path Setup ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+# --- Core Imports ---
+from utils.yaml_parser import parse_legacy_mra_from_yaml, write_mra_to_yaml
+
+LEGACY_TEST_DIR = os.path.join(project_root, "__legacy", "implementation", "test")
+DEFAULT_OUTPUT_DIR = os.path.join(script_dir, "regression", "scenarios")
+
+def import_legacy_scenario(legacy_path: str, output_dir: str, k_start: int, k_end: int) -> str:
+    """
+    Converts one legacy scenario to the current YAML format. The legacy time bound
+    k is replaced by the loop-size range k_start..k_end.
+
+    Returns:
+        Path of the written scenario, named legacy_<family>_<file>.yml
+    """
+    mra, _ = parse_legacy_mra_from_yaml(legacy_path)
+    relative_path = os.path.relpath(legacy_path, LEGACY_TEST_DIR)
+    name = "legacy_" + os.path.splitext(relative_path)[0].replace(os.sep, "_").lower() + ".yml"
+    output_path = os.path.join(output_dir, name)
+    write_mra_to_yaml(mra, k_start, k_end, output_path)
+    return output_path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert legacy test scenarios to the current YAML format.")
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        default=[os.path.join(LEGACY_TEST_DIR, "**", "*.yml")],
+        help="Legacy YAML files or glob patterns (default: all legacy test scenarios)"
+    )
+    parser.add_argument("--output_dir", default=DEFAULT_OUTPUT_DIR, help="Directory for the converted scenarios")
+    parser.add_argument("--k_start", type=int, default=1, help="Smallest loop size of the converted scenarios")
+    parser.add_argument("--k_end", type=int, default=5, help="Largest loop size of the converted scenarios")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    legacy_paths = sorted(set(
+        path for pattern in args.scenarios for path in glob.glob(pattern, recursive=True)
+    ))
+    for legacy_path in legacy_paths:
+        print(import_legacy_scenario(legacy_path, args.output_dir, args.k_start, args.k_end))
@@ -0,0 +1,105 @@
+import sys
+import os
+import glob
+import json
+import time
+import logging
+import argparse
+import tempfile
+
+# --- Path Setup ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+# --- Core Imports ---
+from utils.yaml_parser import parse_mra_from_yaml
+from utils.logging_helper import get_logger, set_log_level
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import iterative_optimal_loop_synthesis_parallel
+
+logger = get_logger("incremental_vs_sweep")
+
+DEFAULT_SCENARIOS = os.path.join(project_root, "examples", "**", "*.yml")
+
+def benchmark_scenario(yaml_file_path: str, open_wbo_binary_path: str | None, num_processes: int | None, prune: bool) -> dict:
+    """
+    Solves one scenario with the process-per-k sweep (open-wbo) and with the
+    incremental sweep on one encoding, both without cache, and reports
+    wall-clock times and results.
+    """
+    mra, k_start, k_end = parse_mra_from_yaml(yaml_file_path)
+
+    rows = {}
+    # Keep the benchmark from touching the caller's cache
+    with tempfile.TemporaryDirectory() as work_dir:
+        for engine in ("sat", "incremental"):
+            start_time = time.time()
+            best_k, best_cost, _ = iterative_optimal_loop_synthesis_parallel(
+                mra, k_start, k_end,
+                num_processes=num_processes,
+                log_level=logging.WARNING,
+                use_cache=False,
+                cache_root=work_dir,
+                prune=prune,
+                open_wbo_binary_path=open_wbo_binary_path,
+                engine=engine
+            )
+            rows[engine] = {'k': best_k, 'cost': best_cost, 'time': time.time() - start_time}
+
+    return {
+        'scenario': os.path.relpath(yaml_file_path, project_root),
+        'agents': mra.num_agents,
+        'resources': mra.num_resources(),
+        'k_start': k_start,
+        'k_end': k_end,
+        'sweep': rows['sat'],
+        'incremental': rows['incremental'],
+        'same_optimum': rows['sat']['cost'] == rows['incremental']['cost'],
+    }
+
+def format_report(rows: list) -> str:
+    header = f"{'scenario':<60} {'|Agt|':>5} {'|Res|':>5} {'k':>7} {'sweep [s]':>10} {'incr. [s]':>10} {'speedup':>8} {'cost':>10} {'same':>5}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        speedup = row['sweep']['time'] / row['incremental']['time'] if row['incremental']['time'] > 0 else float('inf')
+        lines.append(
+            f"{row['scenario']:<60} {row['agents']:>5} {row['resources']:>5} "
+            f"{row['k_start']:>3}-{row['k_end']:<3} {row['sweep']['time']:>10.3f} {row['incremental']['time']:>10.3f} "
+            f"{speedup:>8.2f} {str(row['sweep']['cost']):>10} {str(row['same_optimum']):>5}"
+        )
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the incremental sweep on one encoding against the process-per-k sweep.")
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        default=[DEFAULT_SCENARIOS],
+        help="YAML scenario files or glob patterns (default: all example scenarios)"
+    )
+    parser.add_argument("--open_wbo", type=str, default=None, help="Path to the open-wbo binary")
+    parser.add_argument("--num_processes", type=int, default=None, help="Worker processes for the process-per-k sweep")
+    parser.add_argument("--prune", action="store_true", help="Skip k values whose cost lower bound cannot beat the incumbent (both engines)")
+    parser.add_argument("--output", type=str, default=None, help="Write the results as JSON to this file")
+
+    args = parser.parse_args()
+    set_log_level(logging.WARNING)
+
+    yaml_files = sorted(set(
+        path for pattern in args.scenarios for path in glob.glob(pattern, recursive=True)
+    ))
+    if not yaml_files:
+        logger.error(f"No scenarios matched {args.scenarios}")
+        sys.exit(1)
+
+    rows = []
+    for yaml_file in yaml_files:
+        logger.warning(f"Benchmarking {yaml_file}")
+        rows.append(benchmark_scenario(yaml_file, args.open_wbo, args.num_processes, args.prune))
+
+    print(format_report(rows))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
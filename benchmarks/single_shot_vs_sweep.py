@@ -0,0 +1,114 @@
+import sys
+import os
+import glob
+import json
+import time
+import logging
+import argparse
+import tempfile
+
+# --- Path Setup ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+# --- Core Imports ---
+from utils.yaml_parser import parse_mra_from_yaml
+from utils.logging_helper import get_logger, set_log_level
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import iterative_optimal_loop_synthesis_parallel
+from algorithms.EUMAS_2025.implemenation_guide.single_shot import single_shot_optimal_loop_synthesis
+
+logger = get_logger("single_shot_vs_sweep")
+
+DEFAULT_SCENARIOS = os.path.join(project_root, "examples", "**", "*.yml")
+
+def benchmark_scenario(yaml_file_path: str, open_wbo_binary_path: str | None, num_processes: int | None) -> dict:
+    """
+    Solves one scenario with the per-k sweep and with the single-shot encoding,
+    both without cache, and reports wall-clock times and results.
+    """
+    mra, k_start, k_end = parse_mra_from_yaml(yaml_file_path)
+
+    # Both algorithms cache into ./cache; keep the benchmark from touching the caller's cache.
+    with tempfile.TemporaryDirectory() as work_dir:
+        previous_dir = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            start_time = time.time()
+            sweep_k, sweep_cost, _ = iterative_optimal_loop_synthesis_parallel(
+                mra, k_start, k_end,
+                num_processes=num_processes,
+                log_level=logging.WARNING,
+                use_cache=False,
+                open_wbo_binary_path=open_wbo_binary_path,
+                engine="sat"
+            )
+            sweep_time = time.time() - start_time
+
+            start_time = time.time()
+            single_k, single_cost, _ = single_shot_optimal_loop_synthesis(
+                mra, k_start, k_end,
+                log_level=logging.WARNING,
+                use_cache=False,
+                open_wbo_binary_path=open_wbo_binary_path
+            )
+            single_time = time.time() - start_time
+        finally:
+            os.chdir(previous_dir)
+
+    return {
+        'scenario': os.path.relpath(yaml_file_path, project_root),
+        'agents': mra.num_agents,
+        'resources': mra.num_resources(),
+        'k_start': k_start,
+        'k_end': k_end,
+        'sweep': {'k': sweep_k, 'cost': sweep_cost, 'time': sweep_time},
+        'single_shot': {'k': single_k, 'cost': single_cost, 'time': single_time},
+        'same_optimum': sweep_cost == single_cost,
+    }
+
+def format_report(rows: list) -> str:
+    header = f"{'scenario':<60} {'|Agt|':>5} {'|Res|':>5} {'k':>7} {'sweep [s]':>10} {'single [s]':>10} {'speedup':>8} {'cost':>10} {'same':>5}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        speedup = row['sweep']['time'] / row['single_shot']['time'] if row['single_shot']['time'] > 0 else float('inf')
+        lines.append(
+            f"{row['scenario']:<60} {row['agents']:>5} {row['resources']:>5} "
+            f"{row['k_start']:>3}-{row['k_end']:<3} {row['sweep']['time']:>10.3f} {row['single_shot']['time']:>10.3f} "
+            f"{speedup:>8.2f} {str(row['sweep']['cost']):>10} {str(row['same_optimum']):>5}"
+        )
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the single-shot all-loop-sizes solve against the per-k sweep.")
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        default=[DEFAULT_SCENARIOS],
+        help="YAML scenario files or glob patterns (default: all example scenarios)"
+    )
+    parser.add_argument("--open_wbo", type=str, default=None, help="Path to the open-wbo binary")
+    parser.add_argument("--num_processes", type=int, default=None, help="Worker processes for the sweep")
+    parser.add_argument("--output", type=str, default=None, help="Write the results as JSON to this file")
+
+    args = parser.parse_args()
+    set_log_level(logging.WARNING)
+
+    yaml_files = sorted(set(
+        path for pattern in args.scenarios for path in glob.glob(pattern, recursive=True)
+    ))
+    if not yaml_files:
+        logger.error(f"No scenarios matched {args.scenarios}")
+        sys.exit(1)
+
+    rows = []
+    for yaml_file in yaml_files:
+        logger.warning(f"Benchmarking {yaml_file}")
+        rows.append(benchmark_scenario(yaml_file, args.open_wbo, args.num_processes))
+
+    print(format_report(rows))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
@@ -0,0 +1,76 @@
+import sys
+import os
+import json
+import time
+import logging
+import argparse
+
+# --- Path Setup ---
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+# --- Core Imports ---
+from core.encoding_context import EncodingContext
+from mra.generator import random_mra
+from utils.logging_helper import get_logger, set_log_level
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+from encoding.EUMAS_2025.implementation_guide.time_layers import encode_formula_f_agt_infinity_hard_clauses_in_layers
+
+logger = get_logger("time_layers_benchmark")
+
+def measure(mra, k: int, processes: int | None) -> dict:
+    """
+    Encodes and clausifies the hard clauses of F_Agt^inf for k as a whole
+    (processes=None) or in time layers on processes workers.
+    """
+    with EncodingContext() as context:
+        start_time = time.perf_counter()
+        if processes is None:
+            clauses = context.clausify(context.encode(encode_formula_f_agt_infinity_hard_clauses, mra, k))
+        else:
+            clauses = encode_formula_f_agt_infinity_hard_clauses_in_layers(context, mra, k, processes)
+        elapsed = time.perf_counter() - start_time
+        return {'processes': processes, 'time': elapsed, 'num_clauses': len(clauses), 'num_vars': context.top}
+
+def format_report(rows: list) -> str:
+    header = f"{'encoding':<20} {'time [s]':>10} {'speedup':>8} {'clauses':>10} {'vars':>10}"
+    lines = [header, "-" * len(header)]
+    whole_time = rows[0]['time']
+    for row in rows:
+        label = "whole" if row['processes'] is None else f"layers, {row['processes']} proc."
+        speedup = whole_time / row['time'] if row['time'] > 0 else float('inf')
+        lines.append(f"{label:<20} {row['time']:>10.3f} {speedup:>8.2f} {row['num_clauses']:>10} {row['num_vars']:>10}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark encoding F_Agt^inf in time layers on several processes against encoding it as a whole.")
+    parser.add_argument("--agents", type=int, default=3, help="Number of agents of the generated MRA")
+    parser.add_argument("--resources", type=int, default=4, help="Number of resources of the generated MRA")
+    parser.add_argument("--density", type=float, default=0.6, help="Access density of the generated MRA")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the generated MRA")
+    parser.add_argument("--k", type=int, default=16, help="Loop size to encode")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        nargs="+",
+        default=[0, 1, 2, 4, os.cpu_count() or 1],
+        help="Numbers of worker processes to encode the layers on (0 = in this process)"
+    )
+    parser.add_argument("--output", type=str, default=None, help="Write the results as JSON to this file")
+
+    args = parser.parse_args()
+    set_log_level(logging.WARNING)
+
+    mra = random_mra(args.agents, args.resources, density=args.density, seed=args.seed)
+    rows = [measure(mra, args.k, None)]
+    for processes in sorted(set(args.processes)):
+        logger.warning(f"Encoding k={args.k} in time layers on {processes} processes")
+        rows.append(measure(mra, args.k, processes))
+
+    print(format_report(rows))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'agents': args.agents, 'resources': args.resources, 'density': args.density, 'seed': args.seed, 'k': args.k, 'rows': rows}, f, indent=2)
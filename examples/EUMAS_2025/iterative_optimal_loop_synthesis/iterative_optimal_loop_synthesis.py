@@ -11,13 +11,18 @@ sys.path.insert(0, os.path.join(project_root, 'src'))
 
 # --- Core Imports ---
 from utils.yaml_parser import parse_mra_from_yaml
-from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import iterative_optimal_loop_synthesis_parallel
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import iterative_optimal_loop_synthesis_parallel, get_cache_paths
+from algorithms.EUMAS_2025.implemenation_guide.single_shot import single_shot_optimal_loop_synthesis, encode_single_shot_wcnf, get_single_shot_cache_paths
 from core.model_interpreter import ModelInterpreter
-from core.pysat_constructs import vpool
+from core.variable_index import load_variable_index
 from utils.logging_helper import get_logger, set_log_level
+from utils.telemetry import configure_telemetry
+from core.clause_simplification import SIMPLIFY_ENV
+from core.preprocessor import PREPROCESS_ENV
 
-# --- Imports for Re-establishing PySAT Context ---
-from pysat.formula import Formula, And
+# --- Imports for Re-establishing PySAT Context (results cached without a variable index) ---
+from pysat.formula import And
+from core.encoding_context import EncodingContext
 from core.pysat_constructs import Atom
 # The following functions are needed to re-create the encoding context for the best_k_value
 from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import enrich_formula_f_agt_infinity_with_maxbound_soft_clauses
@@ -26,7 +31,7 @@ from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula
 # Setup logger
 logger = get_logger("iterative_example")
 
-def run_iterative_example(yaml_file_path: str, verbose: bool = False):
+def run_iterative_example(yaml_file_path: str, verbose: bool = False, prune: bool = False, single_shot: bool = False, memory_budget: str | None = None, engine: str = "sat", cross_check: bool = False, layer_processes: int | None = None):
     """
     Runs the iterative optimal loop synthesis algorithm on an MRA problem
     defined in a YAML file.
@@ -43,9 +48,15 @@ def run_iterative_example(yaml_file_path: str, verbose: bool = False):
         logger.error(f"Error parsing YAML into MRA problem: {e}")
         return
 
-    best_k_value, best_payoff, best_k_loop_model = iterative_optimal_loop_synthesis_parallel(
-        mra, k_start, k_end, log_level=log_level
-    )
+    if single_shot:
+        best_k_value, best_payoff, best_k_loop_model = single_shot_optimal_loop_synthesis(
+            mra, k_start, k_end, log_level=log_level, layer_processes=layer_processes
+        )
+    else:
+        best_k_value, best_payoff, best_k_loop_model = iterative_optimal_loop_synthesis_parallel(
+            mra, k_start, k_end, log_level=log_level, prune=prune, memory_budget=memory_budget,
+            engine=engine, cross_check_engines=cross_check
+        )
 
     logger.info("\n--- Iterative Algorithm Final Result ---")
     if best_k_loop_model is not None:
@@ -55,34 +66,43 @@ def run_iterative_example(yaml_file_path: str, verbose: bool = False):
 
         logger.info("\n--- Preparing for Model Interpretation ---")
         try:
-            logger.debug(f"Re-establishing PySAT context for k={best_k_value}...")
-            Formula.cleanup()
-            vpool.restart()
+            # The variable names are stored next to the cached result
+            if single_shot:
+                cache_dir = get_single_shot_cache_paths(mra, k_start, k_end)[0]
+            else:
+                cache_dir = get_cache_paths(mra, best_k_value, k_end)[0]
+            variable_pool = load_variable_index(cache_dir)
 
-            reconstructed_hard_clauses_formula = And(
-                encode_formula_f_agt_infinity_hard_clauses(mra, best_k_value),
-                Atom(f"loopSize_{best_k_value}")
-            )
-            
-            enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(
-                reconstructed_hard_clauses_formula,
-                mra,
-                best_k_value,
-                k_end
-            )
+            if variable_pool is None:
+                # Results cached without an index: re-encode to recover the names
+                logger.debug(f"No variable index in {cache_dir}, re-establishing PySAT context for k={best_k_value}...")
+                with EncodingContext() as context, context.active():
+                    if single_shot:
+                        encode_single_shot_wcnf(mra, k_start, k_end)
+                    else:
+                        reconstructed_hard_clauses_formula = And(
+                            encode_formula_f_agt_infinity_hard_clauses(mra, best_k_value),
+                            Atom(f"loopSize_{best_k_value}")
+                        )
+
+                        enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(
+                            reconstructed_hard_clauses_formula,
+                            mra,
+                            best_k_value,
+                            k_end
+                        )
+                variable_pool = context.vpool
             
-            logger.debug(f"PySAT context re-established. Top variable ID in pool: {vpool.top if vpool else 'N/A'}")
+            logger.debug(f"Variable names loaded. Top variable ID: {variable_pool.top}")
 
             logger.info("\n--- Interpreted Model Trace ---")
             interpreter = ModelInterpreter(
                 raw_model=best_k_loop_model,
-                vpool=vpool,
+                vpool=variable_pool,
                 mra_problem=mra
             )
-            formatted_trace = interpreter.format_complete_trace()
-            
-            # Print the trace directly, not through logger to preserve formatting
-            print(formatted_trace)
+            # Stream the trace to stdout directly, not through logger to preserve formatting
+            interpreter.write_trace(sys.stdout)
 
         except Exception as e:
             logger.error(f"Error during model interpretation: {e}")
@@ -104,11 +124,68 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable verbose (debug) logging"
     )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Skip loop sizes whose cost lower bound cannot beat the best loop found so far"
+    )
+    parser.add_argument(
+        "--single_shot",
+        action="store_true",
+        help="Solve all loop sizes with a single MaxSAT call instead of one call per k"
+    )
+    parser.add_argument(
+        "--memory_budget",
+        type=str,
+        default=None,
+        help="Memory budget for all running loop sizes together, e.g. 16G (default: one loop size per CPU)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "sat", "explicit", "incremental"],
+        default="sat",
+        help="Solve every k with MaxSAT, with an explicit-state search, on one incremental solver, or try the explicit-state search on small MRAs within a time limit (default: sat)"
+    )
+    parser.add_argument(
+        "--cross_check",
+        action="store_true",
+        help="Also solve explicit-state or incremental k values with open-wbo and report differences"
+    )
+    parser.add_argument(
+        "--layer_processes",
+        type=int,
+        default=None,
+        help="With --single_shot, encode the time layers of k_end on this many processes"
+    )
+    parser.add_argument(
+        "--simplify_clauses",
+        action="store_true",
+        help="Remove duplicate, tautological and subsumed hard clauses before writing the WCNF"
+    )
+    parser.add_argument(
+        "--preprocess",
+        action="store_true",
+        help="Preprocess the hard clauses (unit propagation, equivalent literals, variable elimination) before solving"
+    )
+    parser.add_argument(
+        "--telemetry",
+        type=str,
+        default=None,
+        help="Append JSON-lines telemetry events to this file (or stdout/stderr)"
+    )
 
     args = parser.parse_args()
 
     if not os.path.exists(args.yaml_file):
         logger.error(f"YAML file not found at {args.yaml_file}")
         sys.exit(1)
+
+    if args.telemetry:
+        configure_telemetry(args.telemetry)
+    # Read when the WCNFs are assembled and solved, also in the worker processes
+    if args.simplify_clauses:
+        os.environ[SIMPLIFY_ENV] = "1"
+    if args.preprocess:
+        os.environ[PREPROCESS_ENV] = "1"
         
-    run_iterative_example(args.yaml_file, args.verbose)
\ No newline at end of file
+    run_iterative_example(args.yaml_file, args.verbose, args.prune, args.single_shot, args.memory_budget, args.engine, args.cross_check, args.layer_processes)
\ No newline at end of file
@@ -1,6 +1,8 @@
 import os
+import json
 import pickle
 import hashlib
+from dataclasses import asdict
 from math import floor
 import time
 import logging
@@ -10,9 +12,22 @@ from core.pysat_constructs import Atom
 from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
 from core.open_wbo_solver import OpenWBOSolver
 import multiprocessing
+import queue
 from utils.logging_helper import get_logger
-import core.pysat_constructs
-from pysat.formula import IDPool
+from utils.telemetry import emit, phase, telemetry_context
+from .loop_bounds import cost_lower_bound
+from .explicit_state import (
+    EXPLICIT_STATE_THRESHOLD, EXPLICIT_STATE_TIME_LIMIT, ExplicitStateTimeout, estimate_state_count, explicit_state_sweep, cross_check
+)
+from .incremental_sweep import incremental_sweep
+from execution.admission import MemoryAdmissionController, parse_memory_size
+import core.instrumentation
+import core.clause_simplification
+from core.clause_simplification import simplify_clauses
+import core.preprocessor
+from core.preprocessor import preprocess_wcnf
+from core.encoding_context import EncodingContext
+from core.variable_index import save_variable_index
 
 # Create logger from the helper
 logger = get_logger("algorithm_1")
@@ -43,10 +58,12 @@ def generate_scenario_hash(mra: MRA) -> str:
     # Create a hash of the scenario string for a shorter identifier
     return hashlib.md5(scenario_str.encode()).hexdigest()[:12]
 
-def get_cache_paths(mra: MRA, k_loop_size: int) -> tuple:
+def get_cache_paths(mra: MRA, k_loop_size: int, maxbound: int, cache_root: str | None = None) -> tuple:
     """
-    Generate paths for caching files related to a specific scenario and k value.
-    Places cache in the directory of the file that invoked the algorithm.
+    Generate paths for caching files related to a specific scenario, k value and
+    soft clause maxbound (the weights, and so the costs, depend on it).
+    Places cache in the directory of the file that invoked the algorithm, or in
+    cache_root when given (e.g. a cache directory shared between nodes).
     
     Returns:
         Tuple containing (cache_dir, wcnf_path, result_path)
@@ -58,9 +75,9 @@ def get_cache_paths(mra: MRA, k_loop_size: int) -> tuple:
     caller_dir = os.getcwd()
     
     # Create structured cache directory in the caller's directory
-    cache_base_dir = os.path.join(caller_dir, "cache")
+    cache_base_dir = cache_root or os.path.join(caller_dir, "cache")
     scenario_dir = os.path.join(cache_base_dir, f"scenario_{scenario_hash}")
-    k_dir = os.path.join(scenario_dir, f"k_{k_loop_size}")
+    k_dir = os.path.join(scenario_dir, f"k_{k_loop_size}_mb{maxbound}")
     
     # Create paths for specific files
     wcnf_path = os.path.join(k_dir, "encoding.wcnf")
@@ -70,7 +87,15 @@ def get_cache_paths(mra: MRA, k_loop_size: int) -> tuple:
     
     return k_dir, wcnf_path, result_path
 
-def _solve_for_k(k_loop_size: int, mra: MRA, maxbound: int, open_wbo_binary_path: str, use_cache: bool = True):
+def default_open_wbo_binary_path() -> str:
+    """
+    Path of the open-wbo binary shipped in libs/open-wbo.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.abspath(os.path.join(script_dir, '..', '..', '..', '..')) 
+    return os.path.join(project_root, "libs", "open-wbo", "open-wbo")
+
+def _solve_for_k(k_loop_size: int, mra: MRA, maxbound: int, open_wbo_binary_path: str, use_cache: bool = True, cache_root: str | None = None):
     """
     Solves the MRA problem for a specific k loop size, with caching support.
     
@@ -80,15 +105,18 @@ def _solve_for_k(k_loop_size: int, mra: MRA, maxbound: int, open_wbo_binary_path
         maxbound: Maximum bound for the soft clauses
         open_wbo_binary_path: Path to the OpenWBO solver binary
         use_cache: Whether to use cached results if available
+        cache_root: Cache directory (None = ./cache)
     
     Returns:
         Dictionary with the solution data
     """
+    with telemetry_context(scenario_hash=generate_scenario_hash(mra), k=k_loop_size):
+        return _solve_for_k_with_telemetry(k_loop_size, mra, maxbound, open_wbo_binary_path, use_cache, cache_root)
+
+def _solve_for_k_with_telemetry(k_loop_size: int, mra: MRA, maxbound: int, open_wbo_binary_path: str, use_cache: bool, cache_root: str | None):
     iteration_start_time = time.time()
-    Formula.cleanup()
-    core.pysat_constructs.vpool = IDPool()
     # Setup cache paths
-    cache_dir, wcnf_path, result_path = get_cache_paths(mra, k_loop_size)
+    cache_dir, wcnf_path, result_path = get_cache_paths(mra, k_loop_size, maxbound, cache_root)
     
     # Check for cached result
     if use_cache and os.path.exists(result_path):
@@ -97,32 +125,42 @@ def _solve_for_k(k_loop_size: int, mra: MRA, maxbound: int, open_wbo_binary_path
             with open(result_path, 'rb') as f:
                 output = pickle.load(f)
             logger.info(f"Successfully loaded cached result for k={k_loop_size}")
+            emit("cache_hit", status=output.get('status'), cost=output.get('cost'))
             return output
         except Exception as e:
             logger.warning(f"Error loading cached result for k={k_loop_size}: {e}. Will recompute.")
     
     logger.info(f"Starting iteration for k = {k_loop_size} (Process ID: {os.getpid()})")
 
-    # Encoding phase
-    encoding_start_time = time.time()
-    wcnf = enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(
-        And(
-            encode_formula_f_agt_infinity_hard_clauses(mra, k_loop_size),
-            Atom(f"loopSize_{k_loop_size}")
-        ),
-        mra,
-        k_loop_size,
-        maxbound
-    )
-    encoding_time = time.time() - encoding_start_time
-    logger.debug(f"(k={k_loop_size}) Encoding time: {encoding_time:.4f}s")
+    # Encoding phase (building the formula, then clausifying it into the WCNF)
+    with EncodingContext() as context:
+        wcnf, encoding_time, profile = _encode_for_k(context, k_loop_size, mra, maxbound)
+        vpool = context.vpool
+
+    if profile is not None:
+        # Per-Definition encoding profile, stored next to the cached result
+        profile_path = os.path.join(cache_dir, "encoding_profile.json")
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(profile_path, 'w') as f:
+            json.dump({'k': k_loop_size, 'encoding_time': encoding_time, 'definitions': profile}, f, indent=2)
+        logger.info(f"(k={k_loop_size}) Encoding profile written to: {profile_path}")
+
+    # Optional preprocessing of the hard clauses (SATMAS_PREPROCESS); the model is reconstructed after solving
+    preprocessor = None
+    if core.preprocessor.enabled():
+        wcnf, preprocessor = preprocess_wcnf(wcnf)
 
     # Save the WCNF file for caching/debugging
-    os.makedirs(os.path.dirname(wcnf_path), exist_ok=True)
-    wcnf.to_file(wcnf_path)
+    write_start_time = time.time()
+    with phase("write"):
+        os.makedirs(os.path.dirname(wcnf_path), exist_ok=True)
+        wcnf.to_file(wcnf_path)
+        # ID -> name index, so that the cached model can be interpreted without re-encoding
+        save_variable_index(vpool, cache_dir)
+    write_time = time.time() - write_start_time
     logger.debug(f"(k={k_loop_size}) WCNF problem saved to: {wcnf_path}")
 
-    # Solve the problem
+    # Solve the problem (the solver emits the solve and parse phases)
     solver = OpenWBOSolver(open_wbo_binary_path)
     solving_start_time = time.time()
     result = solver.solve(wcnf_path)
@@ -140,11 +178,17 @@ def _solve_for_k(k_loop_size: int, mra: MRA, maxbound: int, open_wbo_binary_path
         'message': result.get('message'),
         'error': False,
         'computation_time': time.time() - iteration_start_time,
+        'encoding_time': encoding_time,
+        'write_time': write_time,
+        'solving_time': solving_time,
+        'num_vars': wcnf.nv,
+        'num_clauses': len(wcnf.hard) + len(wcnf.soft),
+        'solver_peak_rss_mib': result.get('peak_rss_mib'),
     }
 
     if result.get('status') == 'success' and result.get('model') is not None:
         output['cost'] = result.get('cost')
-        output['model'] = result.get('model')
+        output['model'] = result.get('model') if preprocessor is None else preprocessor.reconstruct(result.get('model'))
         logger.info(f"(k={k_loop_size}) Optimal loop found with pay-off (cost): {output['cost']}")
     elif result.get('status') == 'no solution (UNSAT)':
         logger.info(f"(k={k_loop_size}) No loop found (UNSAT).")
@@ -162,14 +206,56 @@ def _solve_for_k(k_loop_size: int, mra: MRA, maxbound: int, open_wbo_binary_path
     
     iteration_time = time.time() - iteration_start_time
     logger.info(f"(k={k_loop_size}) Total time for iteration: {iteration_time:.4f}s")
+    emit(
+        "result",
+        status=output['status'],
+        cost=output['cost'],
+        error=output['error'],
+        duration=iteration_time,
+        num_vars=output['num_vars'],
+        num_clauses=output['num_clauses']
+    )
     
     return output
 
-def enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(formula: Formula, mra: MRA, k: int, maxbound: int) -> WCNF:
+def _encode_for_k(context: EncodingContext, k_loop_size: int, mra: MRA, maxbound: int) -> tuple:
+    # WCNF of loop size k in context, its encoding time and (if instrumented) its encoding profile
+    with context.active():
+        if core.instrumentation.ENABLED:
+            core.instrumentation.start_run()
+        encoding_start_time = time.time()
+        with phase("encode"):
+            formula = And(
+                encode_formula_f_agt_infinity_hard_clauses(mra, k_loop_size),
+                Atom(f"loopSize_{k_loop_size}")
+            )
+        with phase("clausify") as event:
+            wcnf = enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(formula, mra, k_loop_size, maxbound)
+            event.update(num_vars=wcnf.nv, num_clauses=len(wcnf.hard) + len(wcnf.soft))
+        encoding_time = time.time() - encoding_start_time
+        logger.debug(f"(k={k_loop_size}) Encoding time: {encoding_time:.4f}s")
+        profile = core.instrumentation.finish_run() if core.instrumentation.ENABLED else None
+    return wcnf, encoding_time, profile
+
+def enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(formula: Formula, mra: MRA, k: int, maxbound: int, simplify: bool | None = None) -> WCNF:
+    # simplify: whether to remove duplicate, tautological and subsumed hard clauses
+    # (None = if SATMAS_SIMPLIFY_CLAUSES is set, see core.clause_simplification)
     wcnf = WCNF()
 
-    for clause in formula:
-        wcnf.append(clause)
+    if simplify is None:
+        simplify = core.clause_simplification.enabled()
+    if simplify:
+        with phase("simplify") as event:
+            hard_clauses, stats = simplify_clauses(formula)
+            event.update(asdict(stats))
+        logger.info(
+            f"(k={k}) Simplified hard clauses: {stats.clauses_before} -> {stats.clauses_after} "
+            f"({stats.duplicates} duplicates, {stats.tautologies} tautologies, {stats.subsumed} subsumed)"
+        )
+        wcnf.extend(hard_clauses)
+    else:
+        for clause in formula:
+            wcnf.append(clause)
     
     for agent in mra.agt:
         for t in range(1, k + 1): 
@@ -179,13 +265,161 @@ def enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(formula: Formula, m
 
     return wcnf
 
+def _error_result(k_loop_size: int, error: BaseException) -> dict:
+    return {
+        'k': k_loop_size,
+        'cost': None,
+        'model': None,
+        'status': 'error',
+        'message': str(error),
+        'error': True,
+        'computation_time': None,
+        'encoding_time': None,
+        'write_time': None,
+        'solving_time': None,
+        'num_vars': None,
+        'num_clauses': None,
+    }
+
+def _run_lazy_sweep(
+    k_values: list,
+    mra: MRA,
+    maxbound: int,
+    open_wbo_binary_path: str,
+    num_processes: int | None,
+    incumbent_cost: float,
+    pool=None,
+    prune: bool = True,
+    admission=None,
+    cache_root: str | None = None
+) -> list:
+    """
+    Solves the given k values in parallel, dispatching them lazily in ascending
+    order of k.
+
+    With prune, every k whose cost lower bound cannot beat the incumbent is
+    skipped, so improvements found for small k prune the larger ones before they
+    are encoded. Once neither pending nor running k values can improve on the
+    incumbent, the sweep stops. Running tasks are cancelled when the sweep owns its
+    pool (terminating a worker also kills its open-wbo process, see
+    core.open_wbo_solver); on a shared pool they are left to finish and their
+    results are discarded.
+
+    With an admission controller (execution.admission.MemoryAdmissionController),
+    a k is only started once its estimated memory fits into the budget next to
+    the k values that are already running.
+
+    Returns:
+        List of result dictionaries (as produced by _solve_for_k) sorted by k
+    """
+    if pool is None:
+        with multiprocessing.Pool(processes=num_processes) as own_pool:
+            return _dispatch_sweep(
+                own_pool, num_processes or os.cpu_count() or 1,
+                k_values, mra, maxbound, open_wbo_binary_path, incumbent_cost, prune, admission, cache_root
+            )
+    return _dispatch_sweep(
+        pool, pool.processes, k_values, mra, maxbound, open_wbo_binary_path, incumbent_cost, prune, admission, cache_root
+    )
+
+def _dispatch_sweep(
+    pool,
+    max_in_flight: int,
+    k_values: list,
+    mra: MRA,
+    maxbound: int,
+    open_wbo_binary_path: str,
+    incumbent_cost: float,
+    prune: bool = True,
+    admission=None,
+    cache_root: str | None = None
+) -> list:
+    if prune:
+        lower_bounds = {k: cost_lower_bound(mra, k, maxbound) for k in k_values}
+        logger.debug(f"Cost lower bounds per k: {lower_bounds}")
+    else:
+        lower_bounds = {k: float('-inf') for k in k_values}
+
+    pending = sorted(k_values)
+    in_flight = set()
+    skipped = []
+    results = []
+    completed = queue.Queue()
+    throttled = False
+
+    while pending or in_flight:
+        while pending and len(in_flight) < max_in_flight:
+            k = pending[0]
+            if lower_bounds[k] >= incumbent_cost:
+                skipped.append(pending.pop(0))
+                continue
+            if admission is not None and not admission.try_admit(mra, k):
+                if not throttled:
+                    logger.info(
+                        f"Memory budget reached: holding back k={k} with {len(in_flight)} k values running "
+                        f"({admission.used_bytes() / 2**20:.0f} MiB in use)"
+                    )
+                    throttled = True
+                break
+            throttled = False
+            pending.pop(0)
+            in_flight.add(k)
+            pool.apply_async(
+                _solve_for_k,
+                (k, mra, maxbound, open_wbo_binary_path, False, cache_root),
+                callback=completed.put,
+                error_callback=lambda e, k=k: completed.put(_error_result(k, e))
+            )
+
+        if not in_flight:
+            break
+
+        try:
+            result = completed.get(timeout=admission.wait_timeout() if admission is not None else None)
+        except queue.Empty:
+            # Measured memory may have dropped, re-check the budget
+            continue
+        in_flight.discard(result['k'])
+        if admission is not None:
+            admission.release(result['k'])
+        results.append(result)
+
+        if not result['error'] and result['status'] == 'success' and result['cost'] is not None:
+            incumbent_cost = min(incumbent_cost, result['cost'])
+
+        remaining = pending + sorted(in_flight)
+        if remaining and all(lower_bounds[k] >= incumbent_cost for k in remaining):
+            skipped.extend(remaining)
+            pending = []
+            if in_flight:
+                logger.info(f"Cancelling running k values {sorted(in_flight)}: they cannot improve on cost {incumbent_cost}")
+            logger.info(f"Theoretical optimum reached: no remaining k can improve on cost {incumbent_cost}")
+            break
+
+    if skipped:
+        logger.info(f"Pruned k values (lower bound >= incumbent): {sorted(skipped)}")
+    if admission is not None:
+        logger.debug(f"Peak memory attributed to running k values: {admission.peak_bytes / 2**20:.0f} MiB")
+
+    return sorted(results, key=lambda r: r['k'])
+
 def iterative_optimal_loop_synthesis_parallel(
     mra: MRA, 
     k_start: int, 
     k_end: int, 
     num_processes: int | None = None, 
     log_level: int = logging.INFO, 
-    use_cache: bool = True
+    use_cache: bool = True,
+    prune: bool = False,
+    open_wbo_binary_path: str | None = None,
+    pool=None,
+    memory_budget: int | str | None = None,
+    monitor_rss: bool = False,
+    cache_root: str | None = None,
+    engine: str = "sat",
+    explicit_state_threshold: int = EXPLICIT_STATE_THRESHOLD,
+    explicit_state_time_limit: float = EXPLICIT_STATE_TIME_LIMIT,
+    cross_check_engines: bool = False
 ):
     """
     Run the iterative optimal loop synthesis algorithm in parallel with caching support.
@@ -197,10 +431,33 @@ def iterative_optimal_loop_synthesis_parallel(
         num_processes: Number of parallel processes to use (None = use CPU count)
         log_level: Logging level (use logging.DEBUG for verbose output)
         use_cache: Whether to use cached results when available
+        prune: Whether to skip k values whose cost lower bound cannot beat the best result so far
+        open_wbo_binary_path: Path to the OpenWBO solver binary (None = bundled binary)
+        pool: Shared worker pool (e.g. execution.worker_pool.WarmWorkerPool) to run the
+              k values on; None creates a fresh multiprocessing.Pool for this call
+        memory_budget: Memory budget for all running k values together, in bytes or as
+              a size such as "16G"; k values are held back while their estimated memory
+              does not fit (None = start one k per worker)
+        monitor_rss: Whether to also throttle on the measured resident memory of the
+              workers and their solver processes (requires psutil)
+        cache_root: Cache directory (None = ./cache)
+        engine: "sat" (encode every k and solve it with open-wbo), "explicit" (explicit-state
+              search, see explicit_state), "incremental" (encode k_end once and solve every k
+              on one incremental solver, see incremental_sweep) or "auto" (explicit-state
+              search if the MRA has at most explicit_state_threshold states, for at most
+              explicit_state_time_limit seconds, then "sat" for the remaining k values)
+        explicit_state_threshold: Estimated number of states up to which "auto" tries the
+              explicit-state search
+        explicit_state_time_limit: Seconds the explicit-state search may take over all
+              k values with "auto"
+        cross_check_engines: Whether to also solve the k values of an explicit-state or
+              incremental run with open-wbo and log every difference; the open-wbo results are used
         
     Returns:
         Tuple of (best_k_value, best_payoff, best_k_loop_model)
     """
+    if engine not in ("auto", "sat", "explicit", "incremental"):
+        raise ValueError(f"Unknown engine: {engine}")
     # Set log level for this run
     logger.setLevel(log_level)
     
@@ -209,9 +466,7 @@ def iterative_optimal_loop_synthesis_parallel(
     best_k_value = -1
     total_algorithm_start_time = time.time()
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.abspath(os.path.join(script_dir, '..', '..', '..', '..')) 
-    open_wbo_binary_path = os.path.join(project_root, "libs", "open-wbo", "open-wbo")
+    open_wbo_binary_path = open_wbo_binary_path or default_open_wbo_binary_path()
 
     # Create scenario hash for this run
     scenario_hash = generate_scenario_hash(mra)
@@ -222,7 +477,7 @@ def iterative_optimal_loop_synthesis_parallel(
     to_compute_k_values = []
     
     for k_loop_size in range(k_start, k_end + 1):
-        _, _, result_path = get_cache_paths(mra, k_loop_size)
+        _, _, result_path = get_cache_paths(mra, k_loop_size, k_end, cache_root)
         if use_cache and os.path.exists(result_path):
             cached_k_values.append(k_loop_size)
         else:
@@ -236,21 +491,82 @@ def iterative_optimal_loop_synthesis_parallel(
     # Process cached results first (serially since they should be fast to load)
     cached_results = []
     for k in cached_k_values:
-        cached_results.append(_solve_for_k(k, mra, k_end, open_wbo_binary_path, use_cache=True))
+        cached_results.append(_solve_for_k(k, mra, k_end, open_wbo_binary_path, use_cache=True, cache_root=cache_root))
     
+    # Small MRAs: explicit-state search instead of encoding every k; with engine="incremental"
+    # all k are solved on one encoding
+    engine_results = []
+    sat_k_values = to_compute_k_values
+    if to_compute_k_values and (engine == "explicit" or (engine == "auto" and estimate_state_count(mra) <= explicit_state_threshold)):
+        logger.info(f"Starting explicit-state search for {len(to_compute_k_values)} k values ({estimate_state_count(mra)} states estimated)")
+        incumbent_cost = min(
+            (r['cost'] for r in cached_results if not r['error'] and r['status'] == 'success' and r['cost'] is not None),
+            default=float('inf')
+        )
+        time_limit = explicit_state_time_limit if engine == "auto" else None
+        try:
+            engine_results = explicit_state_sweep(to_compute_k_values, mra, k_end, incumbent_cost, prune, cache_root, time_limit)
+            if not cross_check_engines:
+                sat_k_values = []
+        except ExplicitStateTimeout as timeout:
+            engine_results = timeout.results
+            logger.info(f"Solving the remaining k values {timeout.remaining} with MaxSAT")
+            if not cross_check_engines:
+                sat_k_values = timeout.remaining
+    elif to_compute_k_values and engine == "incremental":
+        logger.info(f"Starting incremental sweep for {len(to_compute_k_values)} k values on one encoding")
+        incumbent_cost = min(
+            (r['cost'] for r in cached_results if not r['error'] and r['status'] == 'success' and r['cost'] is not None),
+            default=float('inf')
+        )
+        engine_results = incremental_sweep(to_compute_k_values, mra, k_end, incumbent_cost, prune, cache_root)
+        if not cross_check_engines:
+            sat_k_values = []
+
     # Process non-cached results in parallel
     parallel_results = []
-    if to_compute_k_values:
-        logger.info(f"Starting parallel computation for {len(to_compute_k_values)} k values using up to {num_processes or os.cpu_count()} processes")
+    worker_count = pool.processes if pool is not None else (num_processes or os.cpu_count())
+    admission = None
+    if memory_budget is not None:
+        admission = MemoryAdmissionController(parse_memory_size(memory_budget), monitor_rss=monitor_rss)
+        logger.info(f"Memory budget: {admission.budget_bytes / 2**20:.0f} MiB")
+    if sat_k_values and (prune or admission is not None):
+        known_results = cached_results if cross_check_engines else cached_results + engine_results
+        incumbent_cost = min(
+            (r['cost'] for r in known_results if not r['error'] and r['status'] == 'success' and r['cost'] is not None),
+            default=float('inf')
+        )
+        mode = "pruned" if prune else "memory-bounded"
+        logger.info(f"Starting {mode} parallel computation for {len(sat_k_values)} k values using up to {worker_count} processes")
+        parallel_results = _run_lazy_sweep(
+            sat_k_values, mra, k_end, open_wbo_binary_path, num_processes, incumbent_cost, pool,
+            prune=prune, admission=admission, cache_root=cache_root
+        )
+    elif sat_k_values:
+        logger.info(f"Starting parallel computation for {len(sat_k_values)} k values using up to {worker_count} processes")
         
         # Prepare arguments for parallel processing
         tasks_args = []
-        for k in to_compute_k_values:
-            tasks_args.append((k, mra, k_end, open_wbo_binary_path, False))  # False = don't recheck cache
+        for k in sat_k_values:
+            tasks_args.append((k, mra, k_end, open_wbo_binary_path, False, cache_root))  # False = don't recheck cache
             
         # Run parallel computations
-        with multiprocessing.Pool(processes=num_processes) as pool:
+        if pool is not None:
             parallel_results = pool.starmap(_solve_for_k, tasks_args)
+        else:
+            with multiprocessing.Pool(processes=num_processes) as own_pool:
+                parallel_results = own_pool.starmap(_solve_for_k, tasks_args)
+
+    if engine_results and cross_check_engines:
+        engine_name = "incremental" if engine == "incremental" else "explicit state"
+        mismatches = cross_check(engine_results, parallel_results, engine_name)
+        for mismatch in mismatches:
+            logger.error(f"{engine_name.capitalize()} and SAT results differ: {mismatch}")
+        if not mismatches:
+            logger.info(f"{engine_name.capitalize()} and SAT results agree for {len(engine_results)} k values")
+    elif engine_results:
+        # k values the explicit-state search left to MaxSAT (engine="auto") are in parallel_results
+        parallel_results = sorted(engine_results + parallel_results, key=lambda r: r['k'])
 
     # Combine results from cache and parallel computation
     all_results = cached_results + parallel_results
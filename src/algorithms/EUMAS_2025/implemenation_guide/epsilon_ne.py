@@ -0,0 +1,409 @@
+import math
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from fractions import Fraction
+from mra.agent import Agent
+from mra.problem import MRA
+from mra.strategy import StrategyProfile, StrategyTable
+from pysat.examples.rc2 import RC2
+from pysat.formula import WCNF
+from execution.sticky_pool import StickyPool
+from utils.logging_helper import get_logger
+
+from .nash_equilibrium import best_response_pool, complete_profile, h_format_payoffs, h_payoffs, run_check
+from .strategy_verification import DEFAULT_SOLVER, LoopEncoding
+
+logger = get_logger("epsilon_ne")
+
+# Epsilon-NE weighted search with partitioning at articulation agents (port of
+# the legacy NE/epsilon/weighted_search.articulation_search).
+#
+# Agents contend if they share a resource. The contention graph is split at an
+# articulation agent (the one whose removal leaves the smallest largest part;
+# the agent closest to all others if the graph has none) into parts that each
+# keep the split agent, recursively up to max_depth. Every part is a
+# sub-problem (its agents and the resources they access, renumbered) solved by
+# weighted MaxSAT: agent a's goal variables get weight w_a * floor(k_end^2 / t),
+# which maximises the weighted goal frequency of a loop of size t. The merged
+# strategies (observations a part does not cover are left open) are then
+# completed by the best loop on the full MRA, and epsilon is the largest ratio of
+# an agent's best-response payoff to its payoff in that profile (1 = Nash
+# equilibrium). The weights start from the contention graph (legacy
+# build_weight_map_from_graph) and are shifted towards the agents that gain
+# most by deviating (legacy h_calculate_improvement) until epsilon stops
+# decreasing.
+#
+# The parts are solved in parallel, each always in the same worker, which keeps
+# the hard clauses of its encoding: a weight update rebuilds only the soft
+# clauses. The best responses run on StrategyVerifier workers of the full MRA
+# (see nash_equilibrium), also encoded once for all iterations.
+
+@dataclass
+class ContentionNode:
+    agent_id: int
+    demand: int
+    resources: set[int]
+    neighbours: set[int] = field(default_factory=set)
+    num_common: int = 0     # Shared resources, summed over the neighbours
+    denominator: int = 0    # Demands of the neighbours
+
+@dataclass
+class SubProblem:
+    """
+    Part of an MRA: agent i + 1 of mra is agent agent_ids[i] of the full MRA,
+    resource j + 1 is resource resource_ids[j].
+    """
+    mra: MRA
+    agent_ids: list[int]
+    resource_ids: list[int]
+
+@dataclass
+class EpsilonNEResult:
+    """
+    Outcome of find_epsilon_ne. fractions holds the best-response payoff of
+    every agent divided by its payoff in profile (inf if it gets nothing but
+    could), epsilon their maximum (inf if no profile was found).
+    """
+    profile: StrategyProfile | None = None
+    payoffs: dict[int, Fraction] = field(default_factory=dict)
+    loop_size: int | None = None
+    fractions: dict[int, float] = field(default_factory=dict)
+    epsilon: float = math.inf
+    weights: dict[int, int] = field(default_factory=dict)
+    partitions: list[list[int]] = field(default_factory=list)
+    iterations: int = 0
+
+def contention_graph(mra: MRA) -> dict[int, ContentionNode]:
+    graph = {agent.id: ContentionNode(agent.id, agent.d, set(agent.acc)) for agent in mra.agt}
+    for node in graph.values():
+        for other in graph.values():
+            common = len(node.resources & other.resources)
+            if other is not node and common:
+                node.neighbours.add(other.agent_id)
+                node.num_common += common
+                node.denominator += other.demand
+    return graph
+
+def connected_components(graph: dict[int, ContentionNode], nodes: set[int]) -> list[list[int]]:
+    """
+    Connected components of the subgraph induced by nodes, each sorted, in order of their smallest agent.
+    """
+    components = []
+    unvisited = set(nodes)
+    for start in sorted(nodes):
+        if start not in unvisited:
+            continue
+        unvisited.discard(start)
+        component, queue = [start], deque([start])
+        while queue:
+            for neighbour in graph[queue.popleft()].neighbours & unvisited:
+                unvisited.discard(neighbour)
+                component.append(neighbour)
+                queue.append(neighbour)
+        components.append(sorted(component))
+    return components
+
+def articulation_points(graph: dict[int, ContentionNode], nodes: set[int]) -> set[int]:
+    """
+    Articulation points of the subgraph induced by nodes (iterative Hopcroft-Tarjan).
+    """
+    discovery, low, points = {}, {}, set()
+    for root in sorted(nodes):
+        if root in discovery:
+            continue
+        discovery[root] = low[root] = len(discovery)
+        root_children = 0
+        stack = [(root, None, iter(sorted(graph[root].neighbours & nodes)))]
+        while stack:
+            node, parent, neighbours = stack[-1]
+            child = next(neighbours, None)
+            if child is None:
+                stack.pop()
+                if parent is not None:
+                    low[parent] = min(low[parent], low[node])
+                    if parent != root and low[node] >= discovery[parent]:
+                        points.add(parent)
+            elif child not in discovery:
+                discovery[child] = low[child] = len(discovery)
+                if node == root:
+                    root_children += 1
+                stack.append((child, node, iter(sorted(graph[child].neighbours & nodes))))
+            elif child != parent:
+                low[node] = min(low[node], discovery[child])
+        if root_children > 1:
+            points.add(root)
+    return points
+
+def h_distance_sum(graph: dict[int, ContentionNode], nodes: set[int], start: int) -> int:
+    # Sum of the BFS distances from start to the nodes it reaches
+    distance, queue = {start: 0}, deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbour in graph[node].neighbours & nodes:
+            if neighbour not in distance:
+                distance[neighbour] = distance[node] + 1
+                queue.append(neighbour)
+    return sum(distance.values())
+
+def split_agent(graph: dict[int, ContentionNode], nodes: set[int]) -> int:
+    """
+    Agent to split the connected nodes at: the articulation point whose removal
+    leaves the smallest largest component, or, if there is none, the agent with
+    the smallest distance sum to all others (closeness centrality). Ties go to
+    the smallest ID.
+    """
+    candidates = articulation_points(graph, nodes)
+    if candidates:
+        return min(
+            sorted(candidates),
+            key=lambda point: max(len(component) for component in connected_components(graph, nodes - {point}))
+        )
+    return min(sorted(nodes), key=lambda node: h_distance_sum(graph, nodes, node))
+
+def partition_agents(graph: dict[int, ContentionNode], max_depth: int = 1, min_size: int = 3) -> list[list[int]]:
+    """
+    Splits every connected component of more than min_size agents at its split
+    agent into parts (component + split agent), recursively for parts with more
+    than min_size agents up to max_depth levels below the first split. A part
+    also keeps the split agents of the levels above that contend with it.
+    """
+    partitions = []
+
+    def h_partition(nodes: set[int], depth: int, attached: set[int]):
+        split = split_agent(graph, nodes)
+        for component in connected_components(graph, nodes - {split}):
+            if depth < max_depth and len(component) > min_size:
+                h_partition(set(component), depth + 1, attached | {split})
+            else:
+                part = set(component) | {split}
+                part |= {agent for agent in attached if graph[agent].neighbours & part}
+                partitions.append(sorted(part))
+
+    for component in connected_components(graph, set(graph)):
+        if len(component) > min_size:
+            h_partition(set(component), 0, set())
+        else:
+            partitions.append(component)
+    return partitions
+
+def weight_map(graph: dict[int, ContentionNode]) -> dict[int, int]:
+    """
+    Initial goal weights (legacy build_weight_map_from_graph): within a
+    component, w_a = lcm(denominators) / denominator_a * d_a * num_common_a,
+    raised to at least 1.
+    """
+    weights = {}
+    for component in connected_components(graph, set(graph)):
+        if len(component) == 1:
+            weights[component[0]] = 1
+            continue
+        lcm = math.lcm(*(graph[agent_id].denominator for agent_id in component))
+        for agent_id in component:
+            node = graph[agent_id]
+            weights[agent_id] = max(1, lcm // node.denominator * node.demand * node.num_common)
+    return weights
+
+def update_weights(fractions: dict[int, float], target_range: int = 50) -> dict[int, int]:
+    """
+    Goal weights proportional to how much each agent gains by deviating (legacy
+    _proportional_scaling), raised to at least 1. Unbounded fractions count as
+    one more than the largest bounded one.
+    """
+    bounded = [fraction for fraction in fractions.values() if math.isfinite(fraction)]
+    cap = max(bounded, default=1.0) + 1
+    ratios = {agent_id: fraction if math.isfinite(fraction) else cap for agent_id, fraction in fractions.items()}
+    spread = max(ratios.values()) - min(ratios.values())
+    scaling = target_range / spread if spread else 1.0
+    return {agent_id: max(1, math.floor(ratio * scaling)) for agent_id, ratio in ratios.items()}
+
+def sub_problem(mra: MRA, agent_ids: list[int]) -> SubProblem:
+    agents = sorted((agent for agent in mra.agt if agent.id in agent_ids), key=lambda a: a.id)
+    resource_ids = sorted(set().union(*(agent.acc for agent in agents)))
+    resource_index = {r: j + 1 for j, r in enumerate(resource_ids)}
+    sub_mra = MRA(
+        agt=[Agent(id=i + 1, d=agent.d, acc={resource_index[r] for r in agent.acc}) for i, agent in enumerate(agents)],
+        res=set(range(1, len(resource_ids) + 1))
+    )
+    return SubProblem(sub_mra, [agent.id for agent in agents], resource_ids)
+
+def lift_table(sub: SubProblem, sub_table: StrategyTable, table: StrategyTable):
+    """
+    Copies the strategy of a sub-problem agent into its table of the full MRA.
+    Observations in which an agent outside the sub-problem holds a resource are
+    not covered and stay as they are. sub_table has to be complete (see
+    nash_equilibrium.complete_profile).
+    """
+    agent_index = {agent_id: i + 1 for i, agent_id in enumerate(sub.agent_ids)}
+    agent_index[0] = 0
+    resource_index = {r: j + 1 for j, r in enumerate(sub.resource_ids)}
+    for index in range(table.num_observations):
+        observation = table.observation(index)
+        if any(owner not in agent_index for owner in observation):
+            continue
+        action = sub_table.decide({resource_index[r]: agent_index[owner] for r, owner in zip(table.acc, observation)})
+        if action >= 2:
+            action = 2 * sub.resource_ids[action // 2 - 1] + action % 2
+        table.actions[index] = action
+
+class PartitionSolver:
+    """
+    Weighted MaxSAT over the loops of size 1..k_end of a sub-problem. The hard
+    clauses are encoded once; each solve only adds the soft clauses of its weights.
+    """
+    def __init__(self, sub: SubProblem, k_end: int, solver_name: str = DEFAULT_SOLVER):
+        self.sub = sub
+        self.k_end = k_end
+        self.solver_name = solver_name
+        self.encoding = LoopEncoding(sub.mra, k_end)
+
+    def solve(self, weights: dict[int, int]):
+        """
+        Loop with the largest weighted goal frequency (weights by agent ID of the
+        full MRA), as (loop_size, goal counts by full agent ID, sub-problem
+        profile), or None if the sub-problem has no loop.
+        """
+        wcnf = WCNF()
+        wcnf.extend(self.encoding.clauses)
+        for i, agent_id in enumerate(self.sub.agent_ids):
+            for t in range(1, self.k_end + 1):
+                for var in self.encoding.goal_vars[(i + 1, t)]:
+                    wcnf.append([var], weight=weights[agent_id] * (self.k_end * self.k_end // t))
+        with RC2(wcnf, solver=self.solver_name) as rc2:
+            model = rc2.compute()
+        if model is None:
+            return None
+        t = self.encoding.loop_size(model)
+        goal_counts = self.encoding.goal_counts(model, t)
+        # Observations off the loop keep arbitrary action bits (e.g. codes above
+        # 2|Res| + 1), so the profile is completed before it is lifted
+        profile = complete_profile(self.encoding.extract_profile(model), self.sub.mra)
+        return t, {self.sub.agent_ids[i - 1]: count for i, count in goal_counts.items()}, profile
+
+# Sub-problems and solvers of the current worker process, see _init_partition_worker
+_worker_sub_problems = {}
+_worker_settings = None
+_worker_solvers = {}
+
+def _init_partition_worker(sub_problems: dict, k_end: int, solver_name: str):
+    global _worker_sub_problems, _worker_settings
+    _worker_sub_problems = sub_problems
+    _worker_settings = (k_end, solver_name)
+
+def _solve_partition(index: int, weights: dict[int, int]):
+    # Encodes the sub-problem on its first solve in this worker
+    if index not in _worker_solvers:
+        _worker_solvers[index] = PartitionSolver(_worker_sub_problems[index], *_worker_settings)
+    return _worker_solvers[index].solve(weights)
+
+def _close_partition_worker():
+    _worker_sub_problems.clear()
+    _worker_solvers.clear()
+
+def h_fraction(response: Fraction, payoff: Fraction) -> float:
+    if payoff > 0:
+        return float(response / payoff)
+    return math.inf if response > 0 else 1.0
+
+def find_epsilon_ne(
+    mra: MRA,
+    k_end: int,
+    num_processes: int | None = None,
+    max_iterations: int = 10,
+    max_depth: int = 1,
+    min_size: int = 3,
+    solver_name: str = DEFAULT_SOLVER,
+    log_level: int = logging.INFO
+) -> EpsilonNEResult:
+    """
+    Searches a strategy profile with a small epsilon by weighted solves of the
+    parts of the contention graph (see module comment).
+
+    Args:
+        mra: The MRA problem instance
+        k_end: The largest loop size to consider
+        num_processes: Number of worker processes of each of the two pools (parts
+              and best responses; None = one per part / agent, at most the CPU
+              count; 0 = solve in this process)
+        max_iterations: Maximum number of weight updates
+        max_depth: Levels of splits below the first one
+        min_size: Parts of at most this many agents are not split further
+        solver_name: PySAT solver (of RC2 and of the verifiers)
+        log_level: Logging level (use logging.DEBUG for verbose output)
+
+    Returns:
+        EpsilonNEResult of the iteration with the smallest epsilon
+    """
+    logger.setLevel(log_level)
+    start_time = time.time()
+    graph = contention_graph(mra)
+    weights = weight_map(graph)
+    partitions = partition_agents(graph, max_depth, min_size)
+    sub_problems = {i: sub_problem(mra, part) for i, part in enumerate(partitions)}
+    logger.info(f"Partitions: {partitions}, initial weights: {weights}")
+    # Every agent takes its strategy from the first part that contains it
+    source = {}
+    for i, part in enumerate(partitions):
+        for agent_id in part:
+            source.setdefault(agent_id, i)
+    shared = sorted(agent_id for agent_id in graph if sum(agent_id in part for part in partitions) > 1)
+    agent_ids = sorted(graph)
+
+    best = EpsilonNEResult(weights=weights, partitions=partitions)
+    partition_pool = StickyPool(sub_problems, num_processes, _init_partition_worker, (sub_problems, k_end, solver_name), _close_partition_worker)
+    check_pool = best_response_pool(mra, k_end, num_processes, solver_name)
+    try:
+        for iteration in range(1, max_iterations + 1):
+            pending = {i: partition_pool.apply_async(i, _solve_partition, (i, weights)) for i in sub_problems}
+            solutions = {i: result.get() for i, result in pending.items()}
+            unsolved = [partitions[i] for i, solution in solutions.items() if solution is None]
+            if unsolved:
+                logger.warning(f"No loop of size up to {k_end} for the parts {unsolved}")
+                break
+
+            merged = StrategyProfile.for_mra(mra)
+            for agent_id, i in source.items():
+                sub = sub_problems[i]
+                lift_table(sub, solutions[i][2].tables[sub.agent_ids.index(agent_id) + 1], merged.tables[agent_id])
+
+            # Observations the parts do not cover are left to the evaluation. If the
+            # merged strategies have no loop together, the strategies of the shared
+            # agents, then of their neighbours and so on are dropped (as legacy
+            # calculate_fraction_vector drops those of neighbours)
+            evaluation = run_check(check_pool, agent_ids[0], "evaluate", merged).get()
+            released = set(shared)
+            undecided = StrategyProfile.for_mra(mra).tables
+            while evaluation is None and released:
+                logger.debug(f"Iteration {iteration}: no loop in the full MRA, releasing agents {sorted(released)}")
+                merged = StrategyProfile({**merged.tables, **{agent_id: undecided[agent_id] for agent_id in released}})
+                evaluation = run_check(check_pool, agent_ids[0], "evaluate", merged).get()
+                wider = released.union(*(graph[agent_id].neighbours for agent_id in released))
+                released = wider if wider != released else set()
+            if evaluation is None:
+                logger.warning(f"Iteration {iteration}: the merged profile has no loop in the full MRA")
+                break
+            loop_size, goal_counts, profile = evaluation
+            payoffs = h_payoffs(loop_size, goal_counts)
+            pending = {agent_id: run_check(check_pool, agent_id, "best_response", profile, agent_id) for agent_id in agent_ids}
+            fractions = {}
+            for agent_id, result in pending.items():
+                response = result.get()
+                response_payoff = Fraction(response[1][agent_id], response[0]) if response is not None else Fraction(0)
+                fractions[agent_id] = h_fraction(response_payoff, payoffs[agent_id])
+            epsilon = max(fractions.values())
+            logger.info(f"Iteration {iteration}: epsilon {epsilon:.4f}, payoffs (loop size {loop_size}): {h_format_payoffs(payoffs)}")
+
+            if best.profile is not None and epsilon >= best.epsilon:
+                break
+            best = EpsilonNEResult(profile, payoffs, loop_size, fractions, epsilon, weights, partitions, iteration)
+            if epsilon <= 1:
+                break
+            weights = update_weights(fractions)
+            logger.debug(f"Iteration {iteration}: new weights {weights}")
+    finally:
+        partition_pool.terminate()
+        check_pool.terminate()
+
+    logger.info(f"Best epsilon {best.epsilon:.4f} after {best.iterations} iterations ({time.time() - start_time:.4f}s)")
+    return best
@@ -0,0 +1,426 @@
+import os
+import pickle
+import time
+from itertools import product
+from math import prod
+from mra.problem import MRA
+from pysat.formula import IDPool
+from core.model_decoder import h_bit_width
+from core.variable_index import save_variable_index
+from utils.logging_helper import get_logger
+from utils.telemetry import emit, phase, telemetry_context
+from .loop_bounds import cost_lower_bound, payoff_upper_bound, max_simultaneous_goals, soft_clause_weight, total_soft_weight
+
+logger = get_logger("explicit_state")
+
+# Explicit-state search for optimal loops of small MRAs.
+#
+# Instead of encoding a loop of size k, the states (owner tuples over the sorted
+# resources, 0 = a0) are explored directly. Under a memoryless strategy profile
+# the actions only depend on the observations, so every state has exactly one
+# successor and a loop of size k (EUMAS 2025 Def 2: s_k = s_0 and s_t != s_0 for
+# 0 < t < k) is a simple cycle of k distinct states. The search enumerates such
+# cycles depth-first, choosing the joint action of every state among the actions
+# the protocol allows (SBMF 2021 Def 15) and keeping the choices of each agent
+# consistent per observation. Every cycle is only searched from its smallest
+# state, and branches that cannot beat the best number of goal states found so
+# far are cut. Successors and per-state data are memoized across all k.
+#
+# The reported cost is the MaxSAT cost of the same loop, W(k) - G * floor(maxbound^2 / k)
+# (see loop_bounds), so results are interchangeable with _solve_for_k.
+#
+# The number of strategy choices grows exponentially with k and the number of
+# agents, so the search is only fast on very small instances: a ring of 5 agents
+# with 243 states already takes more than a minute per k from k = 6 on. The sweep
+# therefore uses it only on request (engine="explicit") or, with engine="auto",
+# within a time budget after which the remaining k values are solved with MaxSAT.
+
+# States up to which engine="auto" tries the explicit-state search
+EXPLICIT_STATE_THRESHOLD = 256
+
+# Seconds the explicit-state search may take over all k values with engine="auto"
+EXPLICIT_STATE_TIME_LIMIT = 10.0
+
+# Number of search nodes between two checks of the deadline (the first node is checked)
+_DEADLINE_CHECK_INTERVAL = 1024
+
+class ExplicitStateTimeout(Exception):
+    """
+    The explicit-state sweep ran out of time; results holds the k values solved
+    so far and remaining those that were not (see explicit_state_sweep).
+    """
+    def __init__(self, results: list, remaining: list):
+        super().__init__(f"Explicit-state search timed out with {len(remaining)} k values left")
+        self.results = results
+        self.remaining = remaining
+
+def estimate_state_count(mra: MRA) -> int:
+    """
+    Number of owner tuples in which every resource is unassigned or held by an
+    agent with access to it (an upper bound on the valid states).
+    """
+    return prod(1 + sum(1 for agent in mra.agt if r in agent.acc) for r in mra.res)
+
+class ExplicitStateSearch:
+    """
+    Explicit-state loop search over the states of one MRA (see module comment).
+    """
+    def __init__(self, mra: MRA):
+        self.mra = mra
+        self.resources = sorted(mra.res)
+        self.agents = sorted(mra.agt, key=lambda a: a.id)
+        # Positions of the resources accessible by each agent, in resource order
+        self._acc_positions = [[i for i, r in enumerate(self.resources) if r in agent.acc] for agent in self.agents]
+        self._requesters = [[j for j, agent in enumerate(self.agents) if r in agent.acc] for r in self.resources]
+        self._positions = {agent.id: j for j, agent in enumerate(self.agents)}
+        self._info = {}
+        self._successors = {}
+        self.max_simultaneous_goals = max_simultaneous_goals(mra)
+
+    @property
+    def num_states(self) -> int:
+        """
+        Number of states explored so far.
+        """
+        return len(self._info)
+
+    def state_info(self, state: tuple) -> tuple:
+        """
+        (goal flags, number of goals, allowed action codes per agent, observation per agent) of a state.
+        """
+        info = self._info.get(state)
+        if info is None:
+            goals = []
+            allowed = []
+            observations = []
+            for j, agent in enumerate(self.agents):
+                positions = self._acc_positions[j]
+                observation = tuple(state[i] for i in positions)
+                held = sum(1 for owner in observation if owner == agent.id)
+                # SBMF 2021 Def 19: d(a) = 0 is always a goal, d(a) > |Acc(a)| never
+                goal = len(agent.acc) >= agent.d and held >= agent.d
+                if goal:
+                    actions = (1,)  # relall
+                else:
+                    actions = (0,) + tuple(
+                        2 * self.resources[i] + (0 if state[i] == 0 else 1)
+                        for i in positions if state[i] in (0, agent.id)
+                    )
+                goals.append(goal)
+                allowed.append(actions)
+                observations.append(observation)
+            info = (tuple(goals), sum(goals), allowed, observations)
+            self._info[state] = info
+        return info
+
+    def successor(self, state: tuple, joint_action: tuple) -> tuple:
+        """
+        State after the joint action (action codes by agent position), by SBMF 2021 Def 13.
+        """
+        key = (state, joint_action)
+        successor = self._successors.get(key)
+        if successor is None:
+            owners = []
+            for i, r in enumerate(self.resources):
+                requesters = [j for j in self._requesters[i] if joint_action[j] == 2 * r]
+                owner = state[i]
+                if len(requesters) == 1:
+                    owner = self.agents[requesters[0]].id
+                elif owner != 0:
+                    action = joint_action[self._positions[owner]]
+                    if action == 2 * r + 1 or action == 1:
+                        owner = 0
+                owners.append(owner)
+            successor = tuple(owners)
+            self._successors[key] = successor
+        return successor
+
+    def return_distance(self, state: tuple, target: tuple) -> int:
+        """
+        Lower bound on the number of steps from state to target: an agent gains
+        at most one resource per step, and a resource held by another agent has
+        to be released before it can be requested.
+        """
+        distance = 0
+        missing = [0] * len(self.agents)
+        for owner, target_owner in zip(state, target):
+            if owner == target_owner:
+                continue
+            if target_owner == 0:
+                distance = max(distance, 1)
+            else:
+                missing[self._positions[target_owner]] += 1
+                if owner != 0:
+                    distance = max(distance, 2)
+        return max(distance, max(missing, default=0))
+
+    def goal_distance(self, state: tuple, j: int) -> int:
+        """
+        Lower bound on the number of steps until agent j (by position) reaches its goal.
+        """
+        agent = self.agents[j]
+        held = sum(1 for i in self._acc_positions[j] if state[i] == agent.id)
+        return max(agent.d - held, 0)
+
+    def initial_states(self) -> list[tuple]:
+        """
+        Valid states (EUMAS 2025 Def 2.1) in ascending order.
+        """
+        owners_per_resource = [[0] + [self.agents[j].id for j in self._requesters[i]] for i in range(len(self.resources))]
+        states = []
+        for state in product(*owners_per_resource):
+            if all(sum(1 for owner in state if owner == agent.id) <= agent.d for agent in self.agents):
+                states.append(state)
+        return states
+
+    def optimal_loop(self, k: int, deadline: float | None = None):
+        """
+        Finds a loop of size k with the most goal states (summed over the agents
+        and the steps 0..k-1) in which every agent reaches its goal (EUMAS 2025 Def 3).
+
+        Args:
+            k: Loop size
+            deadline: time.monotonic() value after which the search raises TimeoutError
+
+        Returns:
+            Tuple of (goal states, loop states s_0..s_{k-1}, joint actions per state), or None
+        """
+        if k < 1 or not self.agents:
+            return None
+        upper_bound = payoff_upper_bound(self.mra, k)
+        all_reached = (1 << len(self.agents)) - 1
+        best = [-1, None, None]
+        path = []
+        joint_actions = []
+        on_path = set()
+        # strategy[j]: observation -> action code chosen for agent j so far
+        strategy = [{} for _ in self.agents]
+        nodes = [0]
+
+        def reached_mask(goals):
+            return sum(1 << j for j, goal in enumerate(goals) if goal)
+
+        def extend(state, goal_count, reached):
+            t = len(path) - 1
+            nodes[0] += 1
+            if deadline is not None and nodes[0] % _DEADLINE_CHECK_INTERVAL == 1 and time.monotonic() > deadline:
+                raise TimeoutError(f"Explicit-state search for k={k} exceeded its deadline")
+            if goal_count + (k - 1 - t) * self.max_simultaneous_goals <= best[0]:
+                return
+            # s_k = s_0 has to be reachable, and every agent has to reach its goal by s_{k-1}
+            if self.return_distance(state, path[0]) > k - t:
+                return
+            for j in range(len(self.agents)):
+                if not reached >> j & 1 and self.goal_distance(state, j) > k - 1 - t:
+                    return
+            _, _, allowed, observations = self.state_info(state)
+            choices = []
+            for j, observation in enumerate(observations):
+                decided = strategy[j].get(observation)
+                if decided is None:
+                    choices.append(allowed[j])
+                elif decided in allowed[j]:
+                    choices.append((decided,))
+                else:
+                    return
+            for joint_action in product(*choices):
+                successor = self.successor(state, joint_action)
+                if t + 1 == k:
+                    if successor != path[0] or reached != all_reached or goal_count <= best[0]:
+                        continue
+                    best[:] = [goal_count, list(path), joint_actions + [joint_action]]
+                    if goal_count >= upper_bound:
+                        return
+                    continue
+                if successor <= path[0] or successor in on_path:
+                    continue
+                assigned = [j for j, observation in enumerate(observations) if observation not in strategy[j]]
+                for j in assigned:
+                    strategy[j][observations[j]] = joint_action[j]
+                goals, successor_goal_count, _, _ = self.state_info(successor)
+                path.append(successor)
+                on_path.add(successor)
+                joint_actions.append(joint_action)
+                extend(successor, goal_count + successor_goal_count, reached | reached_mask(goals))
+                joint_actions.pop()
+                on_path.discard(successor)
+                path.pop()
+                for j in assigned:
+                    del strategy[j][observations[j]]
+                if best[0] >= upper_bound:
+                    return
+
+        for initial_state in self.initial_states():
+            goals, goal_count, _, _ = self.state_info(initial_state)
+            path.append(initial_state)
+            on_path.add(initial_state)
+            extend(initial_state, goal_count, reached_mask(goals))
+            on_path.discard(initial_state)
+            path.pop()
+            if best[0] >= upper_bound:
+                break
+
+        return None if best[1] is None else tuple(best)
+
+    def named_model(self, k: int, loop: list[tuple], joint_actions: list[tuple]) -> dict[str, bool]:
+        """
+        Assignment of the named variables of the k encoding that describes the
+        loop, so that it can be interpreted like a solver model.
+        """
+        agent_bits = h_bit_width(self.mra.num_agents_plus())
+        action_bits = h_bit_width(self.mra.num_resources() * 2 + 2)
+        named = {}
+        for t in range(k + 1):
+            state = loop[t % k]
+            goals = self.state_info(state)[0]
+            for i, r in enumerate(self.resources):
+                for bit in range(agent_bits):
+                    named[f"t{t}r{r}b{bit}"] = bool(state[i] >> bit & 1)
+            for j, agent in enumerate(self.agents):
+                for bit in range(action_bits):
+                    named[f"t{t}act_a{agent.id}b{bit}"] = bool(joint_actions[t % k][j] >> bit & 1)
+            named[f"loopClosed_{t}"] = t == k
+            if t < k:
+                for j, agent in enumerate(self.agents):
+                    named[f"agent{agent.id}_goal_loop{k}_at_t_prime{t}"] = goals[j]
+        named[f"loopSize_{k}"] = True
+
+        # Strategic decisions (SBMF 2021 Def 21) of the observations on the loop
+        for state, joint_action in zip(loop, joint_actions):
+            for j, agent in enumerate(self.agents):
+                owners = dict(zip(self.resources, state))
+                observation = "_".join(f"r{r}_a{owners[r]}" for r in agent.acc)
+                prefix = f"so_{observation}_sdec_a{agent.id}" if observation else f"so_sdec_a{agent.id}"
+                for bit in range(action_bits):
+                    named[f"{prefix}b{bit}"] = bool(joint_action[j] >> bit & 1)
+        return named
+
+def solve_for_k_explicit(
+    k_loop_size: int,
+    mra: MRA,
+    maxbound: int,
+    cache_root: str | None = None,
+    search: ExplicitStateSearch | None = None,
+    deadline: float | None = None
+) -> dict:
+    """
+    Explicit-state counterpart of _solve_for_k: finds the optimal loop of size k
+    and caches the result (with a model over named variables and its variable
+    index) in the same place. Raises TimeoutError past deadline (see
+    ExplicitStateSearch.optimal_loop); nothing is cached then.
+    """
+    from .algorithm_1 import generate_scenario_hash, get_cache_paths
+
+    with telemetry_context(scenario_hash=generate_scenario_hash(mra), k=k_loop_size):
+        start_time = time.time()
+        cache_dir, _, result_path = get_cache_paths(mra, k_loop_size, maxbound, cache_root)
+        search = search or ExplicitStateSearch(mra)
+
+        with phase("solve", solver="explicit") as event:
+            loop = search.optimal_loop(k_loop_size, deadline)
+            event['num_states'] = search.num_states
+        solving_time = time.time() - start_time
+
+        output = {
+            'k': k_loop_size,
+            'cost': None,
+            'model': None,
+            'status': 'no solution (UNSAT)',
+            'message': None,
+            'error': False,
+            'computation_time': None,
+            'encoding_time': 0.0,
+            'write_time': None,
+            'solving_time': solving_time,
+            'num_vars': None,
+            'num_clauses': None,
+            'engine': 'explicit',
+        }
+        os.makedirs(cache_dir, exist_ok=True)
+        write_start_time = time.time()
+        if loop is not None:
+            goal_count, states, joint_actions = loop
+            output['status'] = 'success'
+            output['cost'] = total_soft_weight(mra, k_loop_size, maxbound) - goal_count * soft_clause_weight(k_loop_size, maxbound)
+            vpool = IDPool()
+            output['model'] = [
+                vpool.id(name) if value else -vpool.id(name)
+                for name, value in search.named_model(k_loop_size, states, joint_actions).items()
+            ]
+            output['num_vars'] = vpool.top
+            save_variable_index(vpool, cache_dir)
+            logger.info(f"(k={k_loop_size}) Optimal loop found with pay-off (cost): {output['cost']} (explicit state)")
+        else:
+            logger.info(f"(k={k_loop_size}) No loop found (UNSAT, explicit state).")
+        output['computation_time'] = time.time() - start_time
+
+        try:
+            with open(result_path, 'wb') as f:
+                pickle.dump(output, f)
+        except Exception as e:
+            logger.warning(f"Could not cache result for k={k_loop_size}: {e}")
+        output['write_time'] = time.time() - write_start_time
+
+        emit("result", status=output['status'], cost=output['cost'], error=False, duration=output['computation_time'], engine='explicit')
+        return output
+
+def explicit_state_sweep(
+    k_values: list,
+    mra: MRA,
+    maxbound: int,
+    incumbent_cost: float = float('inf'),
+    prune: bool = False,
+    cache_root: str | None = None,
+    time_limit: float | None = None
+) -> list:
+    """
+    Solves the given k values in ascending order with one ExplicitStateSearch,
+    so that states and successors are shared between them. With prune, k values
+    whose cost lower bound cannot beat the incumbent are skipped. With a time
+    limit (seconds, over all k values), ExplicitStateTimeout is raised once it
+    is exceeded, carrying the results so far and the k values left unsolved.
+
+    Returns:
+        List of result dictionaries (as produced by solve_for_k_explicit) sorted by k
+    """
+    search = ExplicitStateSearch(mra)
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+    results = []
+    skipped = []
+    ordered_k_values = sorted(k_values)
+    for position, k in enumerate(ordered_k_values):
+        if prune and cost_lower_bound(mra, k, maxbound) >= incumbent_cost:
+            skipped.append(k)
+            continue
+        try:
+            result = solve_for_k_explicit(k, mra, maxbound, cache_root, search, deadline)
+        except TimeoutError:
+            remaining = [other for other in ordered_k_values[position:] if other not in skipped]
+            logger.info(f"Explicit-state search exceeded its time limit of {time_limit:g}s at k={k}")
+            raise ExplicitStateTimeout(results, remaining)
+        results.append(result)
+        if result['status'] == 'success' and result['cost'] is not None:
+            incumbent_cost = min(incumbent_cost, result['cost'])
+    if skipped:
+        logger.info(f"Pruned k values (lower bound >= incumbent): {skipped}")
+    logger.debug(f"Explicit-state search explored {search.num_states} states")
+    return results
+
+def cross_check(explicit_results: list, sat_results: list, engine: str = "explicit state") -> list[str]:
+    """
+    Compares the status and cost per k of explicit-state (or other engine's) and
+    SAT results and returns a description of every difference (k values missing
+    on either side are not compared).
+    """
+    sat_by_k = {result['k']: result for result in sat_results if not result['error']}
+    mismatches = []
+    for result in explicit_results:
+        sat = sat_by_k.get(result['k'])
+        if sat is None:
+            continue
+        if (result['status'], result['cost']) != (sat['status'], sat['cost']):
+            mismatches.append(
+                f"k={result['k']}: {engine} {result['status']} (cost {result['cost']}), "
+                f"SAT {sat['status']} (cost {sat['cost']})"
+            )
+    return mismatches
@@ -0,0 +1,152 @@
+import os
+import pickle
+import time
+from mra.problem import MRA
+from mra.strategy import StrategyProfile
+from core.model_decoder import h_split_number
+from core.variable_index import VARIABLE_INDEX_FILENAME, VariableIndex
+from utils.logging_helper import get_logger
+from utils.telemetry import emit, phase, telemetry_context
+from .loop_bounds import cost_lower_bound, soft_clause_weight, total_soft_weight
+from .strategy_verification import DEFAULT_SOLVER, StrategyVerifier, VerificationResult
+
+logger = get_logger("incremental_sweep")
+
+# Sweep over the loop sizes on a single incremental solver.
+#
+# The process-per-k sweep encodes F_Agt^inf once per k, writes a WCNF and runs
+# open-wbo on it, so nothing learned for one k is reused for the next. Here the
+# hard clauses for max(k_values) (which contain loopSize_t for every smaller t)
+# are loaded once into a StrategyVerifier, and every k is selected by assuming
+# loopSize_k. With loopSize_k pinned, the soft clauses of the other loop sizes
+# are falsified and those of size k all weigh floor(maxbound^2 / k), so the
+# weighted optimum is the loop with the most goal states G: the verifier finds
+# it by raising a totalizer bound on G (also an assumption) until the solver
+# fails. Clauses learned for one k stay in the solver for the next. The cost is
+# reported as W(k) - G * floor(maxbound^2 / k) (see loop_bounds), and the model
+# is cut to the time steps 0..k, so results are interchangeable with _solve_for_k.
+
+def h_time_steps(variable_index: VariableIndex) -> dict[int, int]:
+    # Variable ID -> time step t of the variables named t{t}...
+    time_steps = {}
+    for var_id, name in variable_index.names.items():
+        if name.startswith('t'):
+            t, _ = h_split_number(name[1:])
+            if t is not None:
+                time_steps[var_id] = t
+    return time_steps
+
+def solve_for_k_incremental(
+    k_loop_size: int,
+    mra: MRA,
+    maxbound: int,
+    verifier: StrategyVerifier,
+    variable_index: VariableIndex,
+    time_steps: dict[int, int],
+    cache_root: str | None = None
+) -> dict:
+    """
+    Incremental counterpart of _solve_for_k: finds the optimal loop of size k on
+    the shared verifier and caches the result (with the variable index of the
+    shared encoding) in the same place. time_steps maps the variables of time
+    steps to their step (see h_time_steps).
+    """
+    from .algorithm_1 import generate_scenario_hash, get_cache_paths
+
+    with telemetry_context(scenario_hash=generate_scenario_hash(mra), k=k_loop_size):
+        start_time = time.time()
+        cache_dir, _, result_path = get_cache_paths(mra, k_loop_size, maxbound, cache_root)
+
+        with phase("solve", solver="incremental"):
+            # There are no loops of size 0
+            result = verifier.max_payoff(StrategyProfile.for_mra(mra), loop_sizes=[k_loop_size]) if k_loop_size >= 1 else VerificationResult(False)
+        solving_time = time.time() - start_time
+
+        output = {
+            'k': k_loop_size,
+            'cost': None,
+            'model': None,
+            'status': 'no solution (UNSAT)',
+            'message': None,
+            'error': False,
+            'computation_time': None,
+            'encoding_time': 0.0,
+            'write_time': None,
+            'solving_time': solving_time,
+            'num_vars': verifier.encoding.top,
+            'num_clauses': verifier.encoding.num_clauses,
+            'engine': 'incremental',
+        }
+        os.makedirs(cache_dir, exist_ok=True)
+        write_start_time = time.time()
+        if result.holds:
+            output['status'] = 'success'
+            output['cost'] = total_soft_weight(mra, k_loop_size, maxbound) - result.goal_count * soft_clause_weight(k_loop_size, maxbound)
+            # Without the totalizer variables and the time steps after the loop,
+            # which the encoding for k does not have either
+            output['model'] = [
+                literal for literal in result.model[:verifier.encoding.top]
+                if time_steps.get(abs(literal), 0) <= k_loop_size
+            ]
+            variable_index.save(os.path.join(cache_dir, VARIABLE_INDEX_FILENAME))
+            logger.info(f"(k={k_loop_size}) Optimal loop found with pay-off (cost): {output['cost']} (incremental)")
+        else:
+            logger.info(f"(k={k_loop_size}) No loop found (UNSAT, incremental).")
+        output['computation_time'] = time.time() - start_time
+
+        try:
+            with open(result_path, 'wb') as f:
+                pickle.dump(output, f)
+        except Exception as e:
+            logger.warning(f"Could not cache result for k={k_loop_size}: {e}")
+        output['write_time'] = time.time() - write_start_time
+
+        emit("result", status=output['status'], cost=output['cost'], error=False, duration=output['computation_time'], engine='incremental')
+        return output
+
+def incremental_sweep(
+    k_values: list,
+    mra: MRA,
+    maxbound: int,
+    incumbent_cost: float = float('inf'),
+    prune: bool = False,
+    cache_root: str | None = None,
+    solver_name: str = DEFAULT_SOLVER
+) -> list:
+    """
+    Solves the given k values in ascending order on one encoding for max(k_values)
+    (see module comment). With prune, k values whose cost lower bound cannot beat
+    the incumbent are skipped.
+
+    Returns:
+        List of result dictionaries (as produced by solve_for_k_incremental) sorted by k
+    """
+    if not k_values:
+        return []
+    encoding_start_time = time.time()
+    with phase("encode", solver="incremental") as event:
+        verifier = StrategyVerifier(mra, max(max(k_values), 1), solver_name)
+        event.update(num_vars=verifier.encoding.top, num_clauses=verifier.encoding.num_clauses)
+    variable_index = VariableIndex.from_pool(verifier.encoding.vpool)
+    time_steps = h_time_steps(variable_index)
+    encoding_time = time.time() - encoding_start_time
+    logger.info(f"Encoded loops up to size {max(k_values)} once in {encoding_time:.4f}s")
+
+    results = []
+    skipped = []
+    with verifier:
+        for k in sorted(k_values):
+            if prune and cost_lower_bound(mra, k, maxbound) >= incumbent_cost:
+                skipped.append(k)
+                continue
+            result = solve_for_k_incremental(k, mra, maxbound, verifier, variable_index, time_steps, cache_root)
+            results.append(result)
+            if result['status'] == 'success' and result['cost'] is not None:
+                incumbent_cost = min(incumbent_cost, result['cost'])
+    if results:
+        # The shared encoding is accounted to the first k solved
+        results[0]['encoding_time'] = encoding_time
+        results[0]['computation_time'] += encoding_time
+    if skipped:
+        logger.info(f"Pruned k values (lower bound >= incumbent): {skipped}")
+    return results
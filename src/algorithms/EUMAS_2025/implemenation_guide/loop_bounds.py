@@ -0,0 +1,88 @@
+from math import floor
+from mra.problem import MRA
+from mra.agent import Agent
+
+# Analytic bounds on the cost reported for a loop of size k.
+#
+# With loopSize_k pinned, every soft clause (_{a}goal^t_{t'}, floor(maxbound^2 / t))
+# for t != k is falsified, and for t = k exactly the goal hits of the loop are
+# satisfied. The MaxSAT cost of a loop of size k with G goal hits is therefore
+#
+#   cost(k) = W(k) - G * floor(maxbound^2 / k)
+#
+# where W(k) is the total weight of all soft clauses of the k encoding. Bounding G
+# from above (the payoff ceiling) bounds the cost from below, before anything is
+# encoded.
+
+def soft_clause_weight(t: int, maxbound: int) -> int:
+    """
+    Weight of a soft clause _{a}goal^t_{t'} for a loop of size t.
+    """
+    return floor((maxbound * maxbound) / t)
+
+def total_soft_weight(mra: MRA, k: int, maxbound: int) -> int:
+    """
+    Sum of the weights of all soft clauses in the encoding for loop size k.
+    """
+    return mra.num_agents * sum(
+        t * soft_clause_weight(t, maxbound)
+        for t in range(1, k + 1)
+    )
+
+def max_goal_hits(agent: Agent, k: int) -> int:
+    """
+    Upper bound on how often an agent can reach its goal in a loop of size k.
+
+    An agent at its goal has to relall, so it holds nothing in the next step and
+    needs d further steps (one successful request per step) to reach its goal
+    again. Two goal hits are therefore at least d + 1 steps apart.
+    """
+    if len(agent.acc) < agent.d:
+        return 0
+    return k // (agent.d + 1)
+
+def max_simultaneous_goals(mra: MRA) -> int:
+    """
+    Upper bound on the number of agents that can be at their goal in the same
+    time step, given that their demands have to fit into the available resources.
+    """
+    available = mra.num_resources()
+    satisfied = 0
+    for demand in sorted(agent.d for agent in mra.agt):
+        if demand > available:
+            break
+        available -= demand
+        satisfied += 1
+    return satisfied
+
+def payoff_upper_bound(mra: MRA, k: int) -> int:
+    """
+    Upper bound on the number of goal hits (summed over all agents) in a loop of size k.
+    """
+    return min(
+        sum(max_goal_hits(agent, k) for agent in mra.agt),
+        k * max_simultaneous_goals(mra)
+    )
+
+def is_trivially_infeasible(mra: MRA, k: int) -> bool:
+    """
+    Checks whether no loop of size k can satisfy infinite goal-reachability
+    (Definition 3), which requires every agent to reach its goal inside the loop.
+    """
+    if not mra.agt:
+        return False
+    if k < 1:
+        return True
+    return any(max_goal_hits(agent, k) == 0 for agent in mra.agt)
+
+def cost_lower_bound(mra: MRA, k: int, maxbound: int) -> float:
+    """
+    Lower bound on the optimal MaxSAT cost for loop size k.
+
+    Returns float('inf') if no loop of size k can exist.
+    """
+    if is_trivially_infeasible(mra, k):
+        return float('inf')
+    if k < 1:
+        return 0
+    return total_soft_weight(mra, k, maxbound) - payoff_upper_bound(mra, k) * soft_clause_weight(k, maxbound)
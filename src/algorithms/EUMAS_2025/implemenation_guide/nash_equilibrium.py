@@ -0,0 +1,215 @@
+import time
+import logging
+from dataclasses import dataclass, field
+from fractions import Fraction
+from mra.agent import Agent
+from mra.problem import MRA
+from mra.strategy import StrategyProfile, StrategyTable
+from execution.sticky_pool import StickyPool
+from utils.logging_helper import get_logger
+
+from .strategy_verification import DEFAULT_SOLVER, StrategyVerifier
+
+logger = get_logger("nash_equilibrium")
+
+# Nash-equilibrium search by best responses (port of the legacy NE/iterative.find_ne).
+#
+# An initial loop is synthesised for all agents and its strategy profile made
+# total. Every round then checks, for each agent a, whether a can raise its
+# own payoff by changing only its strategy while the others keep theirs. The
+# first agent (by ID) with a better response adopts it; a round without one
+# ends the search with an equilibrium, and a profile seen before ends it
+# without one.
+#
+# The checks run on StrategyVerifier: every worker process encodes the MRA once,
+# and fixing the other agents is a set of assumptions, so a check is a few
+# incremental SAT calls. Each agent is always checked by the same worker, so
+# with one worker per agent every agent has its own solver and learned clauses.
+
+@dataclass
+class NashEquilibriumResult:
+    """
+    Outcome of find_nash_equilibrium. payoffs are the goal frequencies of the
+    agents in the loop of profile (of size loop_size).
+    """
+    found: bool
+    profile: StrategyProfile | None = None
+    payoffs: dict[int, Fraction] = field(default_factory=dict)
+    loop_size: int | None = None
+    rounds: int = 0
+
+def h_protocol_action(agent: Agent, table: StrategyTable, index: int) -> int:
+    # The action of the table if the protocol (SBMF 2021 Def 15) allows it in the
+    # observation, otherwise relall at a goal and idle elsewhere
+    observation = table.observation(index)
+    if sum(1 for owner in observation if owner == agent.id) >= agent.d:
+        return 1
+    action = table.actions[index]
+    if action >= 2 and action // 2 in table.acc:
+        owner = observation[table.acc.index(action // 2)]
+        if (action % 2 == 0 and owner == 0) or (action % 2 == 1 and owner == agent.id):
+            return action
+    return 0
+
+def complete_profile(profile: StrategyProfile, mra: MRA) -> StrategyProfile:
+    """
+    Replaces every undecided action and every action the protocol forbids in its
+    observation (as in the legacy h_build_full_strategy). The actions on a loop
+    of the profile are kept, as the loop follows the protocol.
+    """
+    for agent in mra.agt:
+        table = profile.tables[agent.id]
+        for index in range(table.num_observations):
+            table.actions[index] = h_protocol_action(agent, table, index)
+    return profile
+
+class BestResponseChecker:
+    """
+    The checks of the search on one StrategyVerifier. Results are
+    (loop_size, goal counts by agent, profile or table) tuples, or None if there is no loop.
+    """
+    def __init__(self, mra: MRA, k_end: int, solver_name: str = DEFAULT_SOLVER):
+        self.mra = mra
+        self.verifier = StrategyVerifier(mra, k_end, solver_name)
+
+    def initial(self):
+        """
+        Loop with the largest payoff of all agents together and its (completed) profile.
+        """
+        result = self.verifier.max_payoff(StrategyProfile.for_mra(self.mra))
+        if not result.holds:
+            return None
+        profile = complete_profile(self.verifier.extract_profile(result), self.mra)
+        return result.loop_size, self.verifier.goal_counts(result), profile
+
+    def evaluate(self, profile: StrategyProfile):
+        """
+        Loop of the (possibly partial) profile with the largest payoff of all
+        agents together, and the profile completed by it.
+        """
+        result = self.verifier.max_payoff(profile)
+        if not result.holds:
+            return None
+        completed = complete_profile(self.verifier.extract_profile(result), self.mra)
+        return result.loop_size, self.verifier.goal_counts(result), completed
+
+    def best_response(self, profile: StrategyProfile, agent_id: int):
+        """
+        Loop with the largest payoff of agent_id when only agent_id deviates from
+        profile, and the (completed) strategy of agent_id in it.
+        """
+        result = self.verifier.max_payoff(profile, agents=[agent_id], free_agents=[agent_id])
+        if not result.holds:
+            return None
+        response = complete_profile(self.verifier.extract_profile(result), self.mra)
+        return result.loop_size, self.verifier.goal_counts(result), response.tables[agent_id]
+
+# Checker of the current worker process, see _init_worker
+_worker_checker = None
+
+def _init_worker(mra: MRA, k_end: int, solver_name: str):
+    global _worker_checker
+    _worker_checker = BestResponseChecker(mra, k_end, solver_name)
+
+def _run_worker(method: str, *args):
+    return getattr(_worker_checker, method)(*args)
+
+def _close_worker():
+    global _worker_checker
+    if _worker_checker is not None:
+        _worker_checker.verifier.delete()
+        _worker_checker = None
+
+def best_response_pool(mra: MRA, k_end: int, num_processes: int | None = None, solver_name: str = DEFAULT_SOLVER) -> StickyPool:
+    """
+    StickyPool keyed by agent ID whose workers each hold a BestResponseChecker
+    (num_processes=0 checks in the calling process), see run_check.
+    """
+    return StickyPool(sorted(agent.id for agent in mra.agt), num_processes, _init_worker, (mra, k_end, solver_name), _close_worker)
+
+def run_check(pool: StickyPool, agent_id: int, method: str, *args):
+    """
+    Submits the BestResponseChecker method to the worker of agent_id; returns an object with get().
+    """
+    return pool.apply_async(agent_id, _run_worker, (method, *args))
+
+def h_profile_key(profile: StrategyProfile) -> tuple:
+    return tuple(table.actions.tobytes() for table in profile.tables.values())
+
+def h_payoffs(loop_size: int, goal_counts: dict[int, int]) -> dict[int, Fraction]:
+    return {agent_id: Fraction(count, loop_size) for agent_id, count in goal_counts.items()}
+
+def find_nash_equilibrium(
+    mra: MRA,
+    k_end: int,
+    num_processes: int | None = None,
+    max_rounds: int = 100,
+    solver_name: str = DEFAULT_SOLVER,
+    log_level: int = logging.INFO
+) -> NashEquilibriumResult:
+    """
+    Searches a Nash equilibrium among the strategy profiles with loops of size
+    1..k_end by best responses (see module comment).
+
+    Args:
+        mra: The MRA problem instance
+        k_end: The largest loop size to consider
+        num_processes: Number of worker processes, each with its own encoding
+              (None = one per agent, at most the CPU count; 0 = check in this process)
+        max_rounds: Maximum number of rounds before giving up
+        solver_name: PySAT solver of the verifiers
+        log_level: Logging level (use logging.DEBUG for verbose output)
+
+    Returns:
+        NashEquilibriumResult, with found False if the best responses cycle, no
+        loop exists, or max_rounds is reached
+    """
+    logger.setLevel(log_level)
+    start_time = time.time()
+    agent_ids = sorted(agent.id for agent in mra.agt)
+
+    pool = best_response_pool(mra, k_end, num_processes, solver_name)
+    try:
+        initial = run_check(pool, agent_ids[0], "initial").get()
+        if initial is None:
+            logger.warning(f"No loop of size up to {k_end}, hence no equilibrium")
+            return NashEquilibriumResult(False)
+        loop_size, goal_counts, profile = initial
+        payoffs = h_payoffs(loop_size, goal_counts)
+        logger.info(f"Initial payoffs (loop size {loop_size}): {h_format_payoffs(payoffs)}")
+
+        seen = {h_profile_key(profile)}
+        for round_number in range(1, max_rounds + 1):
+            round_start_time = time.time()
+            pending = {agent_id: run_check(pool, agent_id, "best_response", profile, agent_id) for agent_id in agent_ids}
+            responses = {agent_id: result.get() for agent_id, result in pending.items()}
+            logger.debug(f"Round {round_number}: best responses in {time.time() - round_start_time:.4f}s")
+
+            deviator = next(
+                (agent_id for agent_id in agent_ids
+                 if responses[agent_id] is not None
+                 and Fraction(responses[agent_id][1][agent_id], responses[agent_id][0]) > payoffs[agent_id]),
+                None
+            )
+            if deviator is None:
+                logger.info(f"Found a Nash equilibrium after {round_number} rounds ({time.time() - start_time:.4f}s)")
+                return NashEquilibriumResult(True, profile, payoffs, loop_size, round_number)
+
+            loop_size, goal_counts, table = responses[deviator]
+            profile = StrategyProfile({**profile.tables, deviator: table})
+            payoffs = h_payoffs(loop_size, goal_counts)
+            logger.info(f"Round {round_number}: agent {deviator} deviates, payoffs (loop size {loop_size}): {h_format_payoffs(payoffs)}")
+
+            key = h_profile_key(profile)
+            if key in seen:
+                logger.info(f"Best responses cycle after {round_number} rounds, no Nash equilibrium found")
+                return NashEquilibriumResult(False, profile, payoffs, loop_size, round_number)
+            seen.add(key)
+
+        logger.warning(f"No Nash equilibrium found within {max_rounds} rounds")
+        return NashEquilibriumResult(False, profile, payoffs, loop_size, max_rounds)
+    finally:
+        pool.terminate()
+
+def h_format_payoffs(payoffs: dict[int, Fraction]) -> str:
+    return ", ".join(f"a{agent_id}: {payoff}" for agent_id, payoff in payoffs.items())
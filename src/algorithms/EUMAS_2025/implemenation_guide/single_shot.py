@@ -0,0 +1,191 @@
+import os
+import pickle
+import time
+import logging
+from mra.problem import MRA
+from pysat.formula import WCNF, And, Neg, IDPool
+from core.pysat_constructs import Atom, current_vpool
+from core.encoding_context import EncodingContext, active_context
+from core.open_wbo_solver import OpenWBOSolver
+from core.variable_index import save_variable_index
+import core.preprocessor
+from core.preprocessor import preprocess_wcnf
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+from encoding.EUMAS_2025.implementation_guide.time_layers import encode_formula_f_agt_infinity_hard_clauses_in_layers
+from utils.logging_helper import get_logger
+
+from .algorithm_1 import (
+    enrich_formula_f_agt_infinity_with_maxbound_soft_clauses,
+    generate_scenario_hash,
+    default_open_wbo_binary_path
+)
+from .loop_bounds import total_soft_weight
+
+logger = get_logger("single_shot")
+
+# Single-shot synthesis over all loop sizes.
+#
+# The encoding for k_end already contains loopSize_t for every t <= k_end and the
+# soft clauses (_{a}goal^t_{t'}, floor(k_end^2 / t)). Leaving the loop size free
+# and solving once yields a loop of some size t*, but the cost of that formula is
+# W(k_end) - G * floor(k_end^2 / t*) whereas the sweep ranks loop sizes by
+# W(t*) - G * floor(k_end^2 / t*) (W(t) = total soft weight of the encoding for t).
+# To make both objectives coincide, every loop size t additionally gets the soft
+# clause (NOT loopSize_t, W(t)). The optimal cost then equals the sweep optimum
+# plus the constant W(k_end).
+
+def get_single_shot_cache_paths(mra: MRA, k_start: int, k_end: int) -> tuple:
+    """
+    Generate paths for caching files of a single-shot solve over loop sizes k_start..k_end.
+
+    Returns:
+        Tuple containing (cache_dir, wcnf_path, result_path)
+    """
+    scenario_hash = generate_scenario_hash(mra)
+    cache_dir = os.path.join(
+        os.getcwd(), "cache", f"scenario_{scenario_hash}", f"single_shot_{k_start}_{k_end}"
+    )
+    return cache_dir, os.path.join(cache_dir, "encoding.wcnf"), os.path.join(cache_dir, "result.pkl")
+
+def encode_single_shot_wcnf(mra: MRA, k_start: int, k_end: int, layer_processes: int | None = None) -> WCNF:
+    """
+    Encodes all loop sizes in [max(k_start, 1), k_end] as one MaxSAT problem whose
+    optimum coincides with the optimum of the per-k sweep (see module comment).
+    With layer_processes, the time layers are encoded on that many worker processes
+    (see time_layers; 0 = in this process), which needs an active EncodingContext.
+    """
+    excluded_loop_sizes = [Neg(Atom(f"loopSize_{t}")) for t in range(1, min(k_start, k_end + 1))]
+
+    if layer_processes is None:
+        hard_clauses = And(
+            encode_formula_f_agt_infinity_hard_clauses(mra, k_end),
+            *excluded_loop_sizes
+        )
+    else:
+        context = active_context()
+        if context is None:
+            raise ValueError("Encoding in time layers requires an active EncodingContext")
+        hard_clauses = encode_formula_f_agt_infinity_hard_clauses_in_layers(
+            context, mra, k_end, layer_processes, tuple(excluded_loop_sizes)
+        )
+
+    wcnf = enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(hard_clauses, mra, k_end, k_end)
+
+    for t in range(1, k_end + 1):
+        weight = total_soft_weight(mra, t, k_end)
+        if weight > 0:
+            wcnf.append([-Atom(f"loopSize_{t}").name], weight=weight)
+
+    return wcnf
+
+def single_shot_cost_offset(mra: MRA, k_end: int) -> int:
+    """
+    Constant difference between the single-shot cost and the equivalent sweep cost.
+    """
+    return total_soft_weight(mra, k_end, k_end)
+
+def _find_loop_size(model: list, k_end: int, vpool: IDPool | None = None) -> int:
+    # vpool: pool of the encoding (None = that of the active encoding context, see current_vpool)
+    if vpool is None:
+        vpool = current_vpool()
+    true_vars = set(lit for lit in model if lit > 0)
+    for t in range(1, k_end + 1):
+        if vpool.id(f"loopSize_{t}") in true_vars:
+            return t
+    return -1
+
+def single_shot_optimal_loop_synthesis(
+    mra: MRA,
+    k_start: int,
+    k_end: int,
+    log_level: int = logging.INFO,
+    use_cache: bool = True,
+    open_wbo_binary_path: str | None = None,
+    layer_processes: int | None = None
+):
+    """
+    Synthesises the optimal loop over all loop sizes k_start..k_end with a single
+    MaxSAT call instead of one call per k.
+
+    Args:
+        mra: The MRA problem instance
+        k_start: The smallest loop size to consider (inclusive)
+        k_end: The largest loop size to consider (inclusive)
+        log_level: Logging level (use logging.DEBUG for verbose output)
+        use_cache: Whether to use a cached result when available
+        open_wbo_binary_path: Path to the OpenWBO solver binary (None = bundled binary)
+        layer_processes: Number of processes to encode the time layers of k_end on
+              (None = encode the formula as a whole in this process, see time_layers)
+
+    Returns:
+        Tuple of (best_k_value, best_payoff, best_k_loop_model), where best_payoff is
+        expressed in the same units as iterative_optimal_loop_synthesis_parallel
+    """
+    logger.setLevel(log_level)
+    start_time = time.time()
+    open_wbo_binary_path = open_wbo_binary_path or default_open_wbo_binary_path()
+
+    cache_dir, wcnf_path, result_path = get_single_shot_cache_paths(mra, k_start, k_end)
+
+    output = None
+    if use_cache and os.path.exists(result_path):
+        try:
+            with open(result_path, 'rb') as f:
+                output = pickle.load(f)
+            logger.info(f"Loaded cached single-shot result from {result_path}")
+        except Exception as e:
+            logger.warning(f"Error loading cached single-shot result: {e}. Will recompute.")
+
+    if output is None:
+        encoding_start_time = time.time()
+        with EncodingContext() as context:
+            wcnf = context.encode(encode_single_shot_wcnf, mra, k_start, k_end, layer_processes)
+        encoding_time = time.time() - encoding_start_time
+        logger.debug(f"Single-shot encoding time: {encoding_time:.4f}s")
+
+        preprocessor = None
+        if core.preprocessor.enabled():
+            wcnf, preprocessor = preprocess_wcnf(wcnf)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        wcnf.to_file(wcnf_path)
+        save_variable_index(context.vpool, cache_dir)
+        logger.debug(f"Single-shot WCNF problem saved to: {wcnf_path}")
+
+        solving_start_time = time.time()
+        result = OpenWBOSolver(open_wbo_binary_path).solve(wcnf_path)
+        solving_time = time.time() - solving_start_time
+
+        output = {
+            'k': -1,
+            'cost': None,
+            'model': None,
+            'status': result.get('status'),
+            'message': result.get('message'),
+            'error': result.get('status') not in ('success', 'no solution (UNSAT)'),
+            'computation_time': time.time() - start_time,
+            'encoding_time': encoding_time,
+            'solving_time': solving_time,
+            'num_vars': wcnf.nv,
+            'num_clauses': len(wcnf.hard) + len(wcnf.soft),
+        }
+        if result.get('status') == 'success' and result.get('model') is not None:
+            output['model'] = result['model'] if preprocessor is None else preprocessor.reconstruct(result['model'])
+            output['k'] = _find_loop_size(output['model'], k_end, context.vpool)
+            output['cost'] = result['cost'] - single_shot_cost_offset(mra, k_end)
+
+        try:
+            with open(result_path, 'wb') as f:
+                pickle.dump(output, f)
+        except Exception as e:
+            logger.warning(f"Could not cache single-shot result: {e}")
+
+    logger.info(f"Single-shot execution time: {time.time() - start_time:.4f}s")
+
+    if output['model'] is None:
+        logger.warning(f"No optimal loop found within the given k range ({k_start} to {k_end}). Status: {output['status']}")
+        return -1, float('inf'), None
+
+    logger.info(f"Best optimal loop found for k = {output['k']}")
+    logger.info(f"Best pay-off (cost): {output['cost']}")
+    return output['k'], output['cost'], output['model']
@@ -0,0 +1,263 @@
+import time
+from math import ceil
+from dataclasses import dataclass
+from typing import Iterable
+from mra.problem import MRA
+from mra.strategy import UNDECIDED, StrategyProfile, StrategyTable
+from pysat.card import ITotalizer
+from pysat.solvers import Solver
+from core.encoding_context import EncodingContext
+from core.model_decoder import h_bit_width, h_parse_strategic_decision
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+from utils.logging_helper import get_logger
+
+logger = get_logger("strategy_verification")
+
+# Verification of strategy profiles against a single encoding.
+#
+# The hard clauses of F_Agt^inf for k_end (which contain the loops of every size
+# t <= k_end) are added once to an incremental SAT solver. A profile is checked
+# by solving under assumptions: the bits of its strategic decisions (SBMF 2021
+# Def 21), loopSize_t, and a lower bound on the number of goal states in the
+# loop. The bound is an output of a totalizer over the goal variables
+# _{a}goal^t_{t'} (EUMAS 2025 Def 4.2) of loop size t, built once per loop size
+# and set of counted agents. Clauses learned for one profile carry over to the
+# next, so checking a profile costs one (or, for max_payoff, a few) incremental
+# SAT calls instead of an encoding.
+#
+# The payoff of a loop of size t is its number of goal states (summed over the
+# counted agents) divided by t, as in ModelInterpreter.calculate_payoff.
+
+DEFAULT_SOLVER = "cadical153"
+
+@dataclass
+class VerificationResult:
+    """
+    Outcome of a check. If holds, loop_size, goal_count and model describe a
+    witnessing loop.
+    """
+    holds: bool
+    loop_size: int | None = None
+    goal_count: int | None = None
+    model: list[int] | None = None
+
+    @property
+    def payoff(self) -> float | None:
+        return self.goal_count / self.loop_size if self.holds else None
+
+class LoopEncoding:
+    """
+    Hard clauses of F_Agt^inf for loops of size 1..k_end, encoded in their own
+    EncodingContext (whose pool is vpool), with the variable IDs of the loop
+    sizes, goals and strategic decisions. clauses can be released (set to None)
+    once they were handed to a solver.
+    """
+    def __init__(self, mra: MRA, k_end: int):
+        self.mra = mra
+        self.k_end = k_end
+        encoding_start_time = time.time()
+        with EncodingContext() as context:
+            self.clauses = context.clausify(context.encode(encode_formula_f_agt_infinity_hard_clauses, mra, k_end))
+        self.vpool = vpool = context.vpool
+        self.num_clauses = len(self.clauses)
+        self.top = max(vpool.top, max((abs(literal) for clause in self.clauses for literal in clause), default=0))
+
+        self.loop_size_vars = {t: vpool.id(f"loopSize_{t}") for t in range(1, k_end + 1)}
+        # (agent ID, t) -> variables _{a}goal^t_{t'} for t' = 0..t-1
+        self.goal_vars = {
+            (agent.id, t): [vpool.id(f"agent{agent.id}_goal_loop{t}_at_t_prime{t_prime}") for t_prime in range(t)]
+            for agent in mra.agt for t in range(1, k_end + 1)
+        }
+        self.decision_vars = self._index_decision_vars(vpool)
+        self.encoding_time = time.time() - encoding_start_time
+        logger.debug(f"Encoded loops up to size {k_end} in {self.encoding_time:.4f}s ({self.top} variables)")
+
+    def _index_decision_vars(self, vpool) -> dict:
+        # agent ID -> observation index (see StrategyTable) -> variable of every action bit
+        tables = StrategyProfile.for_mra(self.mra).tables
+        action_bits = h_bit_width(self.mra.num_resources() * 2 + 2)
+        decision_vars = {agent_id: {} for agent_id in tables}
+        for name, var_id in vpool.obj2id.items():
+            decision = h_parse_strategic_decision(name) if isinstance(name, str) else None
+            if decision is None:
+                continue
+            agent_id, observation, bit = decision
+            table = tables.get(agent_id)
+            if table is None or bit >= action_bits or len(observation) != len(table.acc):
+                continue
+            bits = decision_vars[agent_id].setdefault(table.index(observation), [None] * action_bits)
+            bits[bit] = var_id
+        return decision_vars
+
+    def loop_size(self, model: list[int]) -> int | None:
+        return next((t for t, var in self.loop_size_vars.items() if model[var - 1] > 0), None)
+
+    def goal_counts(self, model: list[int], t: int) -> dict[int, int]:
+        """
+        Number of goal states of every agent in the loop of size t of model.
+        """
+        return {
+            agent.id: sum(1 for var in self.goal_vars[(agent.id, t)] if model[var - 1] > 0)
+            for agent in self.mra.agt
+        }
+
+    def extract_profile(self, model: list[int]) -> StrategyProfile:
+        """
+        Strategy profile of model, with an action for every observation (bits the
+        model leaves open are 0).
+        """
+        profile = StrategyProfile.for_mra(self.mra)
+        for agent_id, table in profile.tables.items():
+            for index, bits in self.decision_vars[agent_id].items():
+                table.actions[index] = sum(1 << bit for bit, var in enumerate(bits) if var is not None and model[var - 1] > 0)
+        return profile
+
+class StrategyVerifier:
+    """
+    Checks many strategy profiles of one MRA against one encoding of its loops
+    of size 1..k_end (see module comment).
+
+    Agents in free_agents are not fixed to the profile, i.e. the checks ask
+    whether some strategy of theirs (together with the profile of the others)
+    reaches the payoff. agents selects whose goals count (None = all agents).
+    """
+    def __init__(self, mra: MRA, k_end: int, solver_name: str = DEFAULT_SOLVER):
+        self.mra = mra
+        self.k_end = k_end
+        self.encoding = LoopEncoding(mra, k_end)
+        self.solver = Solver(name=solver_name, bootstrap_with=self.encoding.clauses)
+        self.encoding.clauses = None
+        self.top = self.encoding.top
+        self._goal_counters = {}
+
+    def _goal_counter(self, t: int, agents: frozenset) -> ITotalizer:
+        # Totalizer over the negated goal variables of loop size t: at least m goal
+        # states <=> at most n - m unreached ones <=> NOT rhs[n - m]
+        key = (t, agents)
+        if key not in self._goal_counters:
+            goal_vars = [var for agent in self.mra.agt if agent.id in agents for var in self.encoding.goal_vars[(agent.id, t)]]
+            counter = ITotalizer(lits=[-var for var in goal_vars], ubound=len(goal_vars), top_id=self.top)
+            self.solver.append_formula(counter.cnf.clauses)
+            self.top = counter.top_id
+            self._goal_counters[key] = (counter, goal_vars)
+        return self._goal_counters[key]
+
+    def decision_assumptions(self, profile: StrategyProfile, free_agents: Iterable[int] = ()) -> list[int]:
+        """
+        Literals fixing the decided actions of every agent not in free_agents.
+        """
+        free_agents = set(free_agents)
+        assumptions = []
+        for agent_id, table in profile.tables.items():
+            if agent_id in free_agents:
+                continue
+            assumptions.extend(self._table_literals(table))
+        return assumptions
+
+    def _table_literals(self, table: StrategyTable) -> list[int]:
+        literals = []
+        decision_vars = self.encoding.decision_vars.get(table.agent_id, {})
+        for index, action in enumerate(table.actions):
+            if action == UNDECIDED:
+                continue
+            for bit, var_id in enumerate(decision_vars.get(index, ())):
+                if var_id is not None:
+                    literals.append(var_id if action >> bit & 1 else -var_id)
+        return literals
+
+    def _solve(self, assumptions: list[int], t: int, counted: frozenset, min_goals: int) -> list[int] | None:
+        counter, goal_vars = self._goal_counter(t, counted)
+        if min_goals > len(goal_vars):
+            return None
+        bound = [-counter.rhs[len(goal_vars) - min_goals]] if min_goals > 0 else []
+        if self.solver.solve(assumptions=assumptions + [self.encoding.loop_size_vars[t]] + bound):
+            return self.solver.get_model()
+        return None
+
+    def _count_goals(self, model: list[int], t: int, counted: frozenset) -> int:
+        goal_vars = self._goal_counter(t, counted)[1]
+        return sum(1 for var in goal_vars if model[var - 1] > 0)
+
+    def _loop_sizes(self, loop_sizes: Iterable[int] | None) -> list[int]:
+        if loop_sizes is None:
+            return list(range(1, self.k_end + 1))
+        loop_sizes = list(loop_sizes)
+        for t in loop_sizes:
+            if not 1 <= t <= self.k_end:
+                raise ValueError(f"Loop size {t} is outside of 1..{self.k_end}")
+        return loop_sizes
+
+    def _counted(self, agents: Iterable[int] | None) -> frozenset:
+        return frozenset(agent.id for agent in self.mra.agt) if agents is None else frozenset(agents)
+
+    def verify(
+        self,
+        profile: StrategyProfile,
+        min_payoff: float = 0.0,
+        loop_sizes: Iterable[int] | None = None,
+        agents: Iterable[int] | None = None,
+        free_agents: Iterable[int] = ()
+    ) -> VerificationResult:
+        """
+        Checks whether the profile produces a loop (of one of loop_sizes, default
+        1..k_end) whose payoff is at least min_payoff.
+
+        Returns:
+            VerificationResult of the first loop size with such a loop
+        """
+        assumptions = self.decision_assumptions(profile, free_agents)
+        counted = self._counted(agents)
+        for t in self._loop_sizes(loop_sizes):
+            # Tolerance against rounding, e.g. 0.1 * 30 = 3.0000000000000004
+            min_goals = max(0, ceil(min_payoff * t - 1e-9))
+            model = self._solve(assumptions, t, counted, min_goals)
+            if model is not None:
+                return VerificationResult(True, t, self._count_goals(model, t, counted), model)
+        return VerificationResult(False)
+
+    def max_payoff(
+        self,
+        profile: StrategyProfile,
+        loop_sizes: Iterable[int] | None = None,
+        agents: Iterable[int] | None = None,
+        free_agents: Iterable[int] = ()
+    ) -> VerificationResult:
+        """
+        Finds a loop with the largest payoff the profile produces (over loop_sizes,
+        default 1..k_end) by raising the goal bound until the solver fails.
+
+        Returns:
+            VerificationResult of the best loop (holds is False if there is no loop)
+        """
+        assumptions = self.decision_assumptions(profile, free_agents)
+        counted = self._counted(agents)
+        best = VerificationResult(False)
+        for t in self._loop_sizes(loop_sizes):
+            # Only loops that beat the best payoff so far: goal_count / t > best
+            min_goals = best.goal_count * t // best.loop_size + 1 if best.holds else 0
+            while (model := self._solve(assumptions, t, counted, min_goals)) is not None:
+                goal_count = self._count_goals(model, t, counted)
+                best = VerificationResult(True, t, goal_count, model)
+                min_goals = goal_count + 1
+        return best
+
+    def goal_counts(self, result: VerificationResult) -> dict[int, int]:
+        """
+        Number of goal states of every agent in the witnessing loop of result.
+        """
+        return self.encoding.goal_counts(result.model, result.loop_size)
+
+    def extract_profile(self, result: VerificationResult) -> StrategyProfile:
+        """
+        Strategy profile of the model of result (see LoopEncoding.extract_profile).
+        """
+        return self.encoding.extract_profile(result.model)
+
+    def delete(self):
+        self.solver.delete()
+
+    def __enter__(self) -> "StrategyVerifier":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.delete()
@@ -0,0 +1,94 @@
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+
+# Simplification of the hard clauses before they are written to the WCNF.
+#
+# Clausifying the nested And/Or trees of the Definitions (e.g. Defs 13 and 15)
+# produces repeated clauses, clauses with a repeated literal, tautologies (a
+# literal and its negation) and clauses that contain a shorter clause. The pass
+#
+#   1. removes repeated literals and drops tautologies,
+#   2. drops repeated clauses (hashing the literal sets),
+#   3. drops every clause that is a strict superset of another one (backward
+#      subsumption: the clauses in ascending length look up their candidate
+#      supersets in the occurrence list of their rarest literal).
+#
+# Each step keeps the set of models unchanged (a tautology is always true, a
+# subsumed clause is implied by its subsumer), so the result is equivalent to
+# the input and in particular equisatisfiable; the soft clauses are not touched,
+# so the optimum and its cost stay the same. The pass is opt-in, like the
+# instrumentation, and worker processes inherit it:
+#
+#   SATMAS_SIMPLIFY_CLAUSES=1
+
+SIMPLIFY_ENV = "SATMAS_SIMPLIFY_CLAUSES"
+
+def enabled() -> bool:
+    """
+    Whether the WCNF assembly simplifies the hard clauses (SATMAS_SIMPLIFY_CLAUSES).
+    """
+    return os.environ.get(SIMPLIFY_ENV, "").strip().lower() not in ("", "0", "false", "off")
+
+@dataclass
+class SimplificationStats:
+    """
+    Clause counts before and after simplify_clauses and what was removed.
+    """
+    clauses_before: int = 0
+    tautologies: int = 0
+    duplicates: int = 0
+    subsumed: int = 0
+    clauses_after: int = 0
+    literals_before: int = 0
+    literals_after: int = 0
+
+def simplify_clauses(clauses: Iterable[list[int]], subsumption: bool = True) -> tuple[list[list[int]], SimplificationStats]:
+    """
+    Equivalent clause list without repeated literals, tautologies, repeated and
+    (with subsumption) subsumed clauses, in the order of the input (see module comment).
+
+    Returns:
+        Tuple of (clauses, SimplificationStats)
+    """
+    stats = SimplificationStats()
+    unique = []
+    literal_sets = []
+    seen = set()
+    for clause in clauses:
+        stats.clauses_before += 1
+        stats.literals_before += len(clause)
+        literals = frozenset(clause)
+        if any(-literal in literals for literal in literals):
+            stats.tautologies += 1
+            continue
+        if literals in seen:
+            stats.duplicates += 1
+            continue
+        seen.add(literals)
+        unique.append(list(dict.fromkeys(clause)))
+        literal_sets.append(literals)
+
+    removed = bytearray(len(unique))
+    if subsumption:
+        occurrences = defaultdict(list)
+        for index, literals in enumerate(literal_sets):
+            for literal in literals:
+                occurrences[literal].append(index)
+        for index in sorted(range(len(unique)), key=lambda i: len(literal_sets[i])):
+            literals = literal_sets[index]
+            # A removed clause's supersets are also supersets of its subsumer;
+            # the empty clause is kept as it is
+            if removed[index] or not literals:
+                continue
+            rarest = min(literals, key=lambda literal: len(occurrences[literal]))
+            for candidate in occurrences[rarest]:
+                if not removed[candidate] and len(literal_sets[candidate]) > len(literals) and literals <= literal_sets[candidate]:
+                    removed[candidate] = 1
+                    stats.subsumed += 1
+
+    simplified = [clause for clause, is_removed in zip(unique, removed) if not is_removed]
+    stats.clauses_after = len(simplified)
+    stats.literals_after = sum(len(clause) for clause in simplified)
+    return simplified, stats
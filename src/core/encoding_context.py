@@ -0,0 +1,123 @@
+import itertools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterable
+from pysat.formula import Formula, IDPool
+
+# Encoding contexts.
+#
+# The encoders name their variables through core.pysat_constructs.Atom, and
+# pysat keeps every Formula it builds (and the Tseitin variables it introduces
+# when clausifying) in a registry per formula context. An EncodingContext owns
+# both for one encoding: its own IDPool and its own pysat formula context, which
+# close() releases. Encoding and clausifying run with the context active:
+#
+#     context = EncodingContext()
+#     with context.active():
+#         clauses = list(encode_formula_f_agt_infinity_hard_clauses(mra, k))
+#     context.vpool  # names of the variables in clauses
+#     context.close()
+#
+# The active context is a context variable, so every thread and every asyncio
+# task has its own, and encoders need no extra argument. pysat's formula
+# context, however, is a single class attribute for the whole process: active
+# blocks therefore hold a process-wide lock, so encodings in different threads
+# take turns (under the GIL they would not run in parallel anyway), while model
+# interpretation and solving, which do not build formulas, run concurrently.
+# Without an active context Atom uses the global core.pysat_constructs.vpool, as
+# before.
+
+_active_context: ContextVar["EncodingContext | None"] = ContextVar("encoding_context", default=None)
+# Serialises blocks that switch pysat's process-wide formula context (re-entrant for nesting)
+_formula_lock = threading.RLock()
+_context_ids = itertools.count(1)
+
+# pysat offers no public way to read the current formula context, nor to list
+# the clauses of an already clausified formula without clausifying it again
+# (Formula.__iter__ does). These two helpers are the only places that use its
+# private state; they target python-sat 1.8.dev16 (see pyproject.toml).
+def h_formula_context():
+    return Formula._context
+
+def h_formula_clauses(formula: Formula) -> Iterable[list[int]]:
+    # Clauses of a formula that has been clausified before
+    return formula._iter(outermost=not formula.name)
+
+def active_context() -> "EncodingContext | None":
+    """
+    The EncodingContext active in the current thread or task, or None.
+    """
+    return _active_context.get()
+
+class EncodingContext:
+    """
+    Variable pool and pysat formula context of one encoding (see module comment).
+    """
+    def __init__(self, vpool: IDPool | None = None):
+        self.vpool = vpool if vpool is not None else IDPool()
+        self.name = f"encoding_context_{next(_context_ids)}"
+        self._occupied_top = 0
+
+    def id(self, name) -> int:
+        return self.vpool.id(name)
+
+    @contextmanager
+    def active(self):
+        """
+        Makes this the context of Atom and of the formulas built and clausified in the block.
+        """
+        with _formula_lock:
+            previous_formula_context = h_formula_context()
+            token = _active_context.set(self)
+            Formula.set_context(self.name)
+            try:
+                yield self
+            finally:
+                Formula.set_context(previous_formula_context)
+                _active_context.reset(token)
+
+    def encode(self, encoder: Callable, *args, **kwargs):
+        """
+        Calls encoder(*args, **kwargs) with this context active.
+        """
+        with self.active():
+            return encoder(*args, **kwargs)
+
+    def clausify(self, formula: Formula | Iterable[list[int]]) -> list[list[int]]:
+        """
+        Clauses of formula, with its Tseitin variables taken from this context.
+        """
+        with self.active():
+            return [clause for clause in formula]
+
+    @property
+    def top(self) -> int:
+        """
+        Largest variable ID of this context so far, named or introduced by clausifying.
+        """
+        with _formula_lock:
+            return max(self.vpool.top, Formula.export_vpool(active=False, context=self.name).top, self._occupied_top)
+
+    def occupy(self, start: int, stop: int):
+        """
+        Keeps new variables of this context, named or introduced by clausifying, out
+        of start..stop (inclusive), e.g. the IDs of clauses built in another process.
+        """
+        self.vpool.occupy(start, stop)
+        self._occupied_top = max(self._occupied_top, stop)
+        with _formula_lock:
+            Formula.export_vpool(active=False, context=self.name).occupy(start, stop)
+
+    def close(self):
+        """
+        Releases the formulas of this context; the variable pool stays usable.
+        """
+        with _formula_lock:
+            Formula.cleanup(self.name)
+
+    def __enter__(self) -> "EncodingContext":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
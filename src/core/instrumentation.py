@@ -0,0 +1,127 @@
+import os
+import time
+import functools
+import tracemalloc
+from pysat.formula import Formula
+import core.pysat_constructs
+from core.encoding_context import h_formula_clauses
+
+# Instrumentation of the encode_* entry points is opt-in and decided when the
+# encoding modules are imported, so with it turned off the encoders are the
+# plain functions (no wrapper, no overhead). Worker processes inherit it:
+#
+#   SATMAS_INSTRUMENT=1       wall time, variables and clauses per Definition
+#   SATMAS_INSTRUMENT=memory  additionally the peak allocation (tracemalloc)
+INSTRUMENT_ENV = "SATMAS_INSTRUMENT"
+_MODE = os.environ.get(INSTRUMENT_ENV, "").strip().lower()
+ENABLED = _MODE not in ("", "0", "false", "off")
+TRACE_MEMORY = _MODE == "memory"
+
+# Frames of the encode_* calls that are currently running, innermost last.
+_stack = []
+# Finished calls of the current run: (name, time, self time, vars, self vars, peak bytes, result)
+_calls = []
+
+class _Frame:
+    __slots__ = ("start_time", "start_vars", "start_memory", "child_time", "child_vars", "child_peak")
+
+def h_definition_name(func) -> str:
+    module = func.__module__
+    if module.startswith("encoding."):
+        module = module[len("encoding."):]
+    return f"{module}.{func.__name__}"
+
+def h_count_clauses(formula) -> int:
+    """
+    Number of clauses the formula contributes after Tseitin clausification, or 0
+    if it was never clausified (i.e. is not part of the encoded formula).
+    """
+    if not isinstance(formula, Formula):
+        return 0
+    try:
+        return sum(1 for _ in h_formula_clauses(formula))
+    except AttributeError:
+        return 0
+
+def instrumented(func):
+    """
+    Decorator for the encode_* entry points of the Definitions. Returns func
+    unchanged unless instrumentation is enabled.
+    """
+    if not ENABLED:
+        return func
+
+    name = h_definition_name(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        frame = _Frame()
+        frame.child_time = frame.child_vars = frame.child_peak = 0
+        if TRACE_MEMORY:
+            current, peak = tracemalloc.get_traced_memory()
+            if _stack:
+                # The peak is reset per call, so keep the parent's peak so far.
+                _stack[-1].child_peak = max(_stack[-1].child_peak, peak)
+            tracemalloc.reset_peak()
+            frame.start_memory = current
+        frame.start_vars = core.pysat_constructs.current_vpool().top
+        _stack.append(frame)
+        frame.start_time = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - frame.start_time
+            _stack.pop()
+            num_vars = core.pysat_constructs.current_vpool().top - frame.start_vars
+            peak_bytes = None
+            if TRACE_MEMORY:
+                peak = max(tracemalloc.get_traced_memory()[1], frame.child_peak)
+                peak_bytes = peak - frame.start_memory
+                if _stack:
+                    _stack[-1].child_peak = max(_stack[-1].child_peak, peak)
+            if _stack:
+                _stack[-1].child_time += elapsed
+                _stack[-1].child_vars += num_vars
+        _calls.append((name, elapsed, elapsed - frame.child_time, num_vars, num_vars - frame.child_vars, peak_bytes, result))
+        return result
+
+    return wrapper
+
+def start_run():
+    """
+    Starts collecting the calls of a new encoding run (e.g. one k).
+    """
+    _stack.clear()
+    _calls.clear()
+    if TRACE_MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def finish_run() -> dict:
+    """
+    Rolls the calls collected since start_run up per Definition. Call it once the
+    formula has been clausified, so the clause counts are known.
+
+    Returns:
+        Dictionary mapping each Definition's encode_* function to its number of
+        calls, wall time, self time (without nested encode_* calls), variables
+        allocated from the pool (total and self), clauses after clausification
+        (including those of nested Definitions) and peak allocation in bytes
+        (None unless memory tracing is enabled), ordered by decreasing time
+    """
+    report = {}
+    for name, elapsed, self_time, num_vars, self_vars, peak_bytes, result in _calls:
+        entry = report.setdefault(name, {
+            'calls': 0, 'time': 0.0, 'self_time': 0.0, 'vars': 0, 'self_vars': 0, 'clauses': 0, 'peak_bytes': None
+        })
+        entry['calls'] += 1
+        entry['time'] += elapsed
+        entry['self_time'] += self_time
+        entry['vars'] += num_vars
+        entry['self_vars'] += self_vars
+        entry['clauses'] += h_count_clauses(result)
+        if peak_bytes is not None:
+            entry['peak_bytes'] = max(entry['peak_bytes'] or 0, peak_bytes)
+    _calls.clear()
+    if TRACE_MEMORY:
+        tracemalloc.stop()
+    return dict(sorted(report.items(), key=lambda item: -item[1]['time']))
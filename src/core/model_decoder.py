@@ -0,0 +1,214 @@
+from dataclasses import dataclass, field
+from math import ceil, log
+from typing import Iterable, Tuple
+from mra.problem import MRA
+from mra.strategy import StrategyProfile
+
+_DIGITS = "0123456789"
+
+def h_split_number(text: str) -> Tuple[int | None, str]:
+    """
+    Splits text into its leading decimal number (None if there is none) and the rest.
+    """
+    rest = text.lstrip(_DIGITS)
+    head = text[:len(text) - len(rest)]
+    return (int(head) if head else None), rest
+
+def h_bit_width(num_values: int) -> int:
+    return ceil(log(num_values, 2)) if num_values > 1 else 0
+
+@dataclass
+class DecodedModel:
+    """
+    Dense per-time-step view of a model, decoded in a single pass over its
+    variables (see decode_assignments).
+
+    The arrays are indexed by time step t in 0..max_time_step:
+      - resource_owners[t][r - 1]: 0-indexed agent ID holding resource r (0 = a0, unassigned)
+      - actions[t][i]: action number of the i-th agent of agent_ids
+      - goal_flags[t][i]: value of t{t}_g_a{id} (SCP 2023 Def 33) of the i-th agent of agent_ids
+    """
+    agent_ids: list[int]
+    num_resources: int
+    max_time_step: int = -1
+    resource_owners: list[list[int]] = field(default_factory=list)
+    actions: list[list[int]] = field(default_factory=list)
+    goal_flags: list[list[bool]] = field(default_factory=list)
+    loop_size: int = 0
+    loop_closed_steps: list[int] = field(default_factory=list)
+    # Agent ID -> sorted (loop, t_prime) pairs of the true agent{id}_goal_loop{loop}_at_t_prime{t_prime}
+    loop_goals: dict[int, list[tuple[int, int]]] = field(default_factory=dict)
+
+    @property
+    def num_time_steps(self) -> int:
+        return self.max_time_step + 1
+
+def decode_assignments(assignments: Iterable[Tuple[str, bool]], mra_problem: MRA) -> DecodedModel:
+    """
+    Decodes (variable name, truth value) pairs in a single pass. Only the true
+    bits are kept during the pass; the dense arrays are filled from them once the
+    number of time steps is known.
+
+    Args:
+        assignments: Variable names with their truth values
+        mra_problem: The MRA problem the model was encoded from
+
+    Returns:
+        DecodedModel with the resource owners, actions and goal flags per time step
+    """
+    num_resources = mra_problem.num_resources()
+    agent_ids = sorted(agent.id for agent in mra_problem.agt)
+    agent_index = {agent_id: i for i, agent_id in enumerate(agent_ids)}
+    agent_id_bits = h_bit_width(mra_problem.num_agents_plus())
+    action_bits = h_bit_width(num_resources * 2 + 2)  # idle, relall, req_i, rel_i
+
+    max_t = -1
+    loop_size = None
+    loop_closed_steps = []
+    loop_goals = {}
+    resource_bits = []  # (t, resource index, bit)
+    action_bits_set = []  # (t, agent index, bit)
+    goal_bits = []  # (t, agent index)
+
+    for name, value in assignments:
+        if not name:
+            continue
+        first = name[0]
+        if first == 't':
+            t, rest = h_split_number(name[1:])
+            if t is None:
+                continue
+            # Any variable of a time step counts, true or not
+            if t > max_t:
+                max_t = t
+            if not value:
+                continue
+            if rest[:1] == 'r':
+                # t{t}r{r}b{bit} (Def 17)
+                r, rest = h_split_number(rest[1:])
+                if r is not None and rest[:1] == 'b':
+                    bit, tail = h_split_number(rest[1:])
+                    if bit is not None and not tail and 1 <= r <= num_resources and bit < agent_id_bits:
+                        resource_bits.append((t, r - 1, bit))
+            elif rest.startswith('act_a'):
+                # t{t}act_a{id}b{bit} (Def 20)
+                a, rest = h_split_number(rest[5:])
+                if a in agent_index and rest[:1] == 'b':
+                    bit, tail = h_split_number(rest[1:])
+                    if bit is not None and not tail and bit < action_bits:
+                        action_bits_set.append((t, agent_index[a], bit))
+            elif rest.startswith('_g_a'):
+                # t{t}_g_a{id} (SCP 2023 Def 33)
+                a, tail = h_split_number(rest[4:])
+                if a in agent_index and not tail:
+                    goal_bits.append((t, agent_index[a]))
+        elif not value:
+            continue
+        elif first == 'l':
+            if name.startswith('loopSize_'):
+                k, tail = h_split_number(name[9:])
+                if k is not None and not tail and loop_size is None:
+                    loop_size = k
+            elif name.startswith('loopClosed_'):
+                step, tail = h_split_number(name[11:])
+                if step is not None and not tail:
+                    loop_closed_steps.append(step)
+        elif first == 'a' and name.startswith('agent'):
+            # agent{id}_goal_loop{loop}_at_t_prime{t_prime} (EUMAS 2025 Def 4.2)
+            a, rest = h_split_number(name[5:])
+            if a is not None and rest.startswith('_goal_loop'):
+                loop, rest = h_split_number(rest[10:])
+                if loop is not None and rest.startswith('_at_t_prime'):
+                    t_prime, tail = h_split_number(rest[11:])
+                    if t_prime is not None and not tail:
+                        loop_goals.setdefault(a, []).append((loop, t_prime))
+
+    num_steps = max_t + 1
+    resource_owners = [[0] * num_resources for _ in range(num_steps)]
+    for t, r, bit in resource_bits:
+        resource_owners[t][r] |= 1 << bit
+    actions = [[0] * len(agent_ids) for _ in range(num_steps)]
+    for t, i, bit in action_bits_set:
+        actions[t][i] |= 1 << bit
+    goal_flags = [[False] * len(agent_ids) for _ in range(num_steps)]
+    for t, i in goal_bits:
+        goal_flags[t][i] = True
+
+    return DecodedModel(
+        agent_ids=agent_ids,
+        num_resources=num_resources,
+        max_time_step=max_t,
+        resource_owners=resource_owners,
+        actions=actions,
+        goal_flags=goal_flags,
+        loop_size=loop_size or 0,
+        loop_closed_steps=sorted(loop_closed_steps),
+        loop_goals={a: sorted(goals) for a, goals in loop_goals.items()},
+    )
+
+def decode_model(raw_model: list[int], vpool, mra_problem: MRA) -> DecodedModel:
+    """
+    Decodes a raw solver model (signed variable IDs) with the pool it was encoded with.
+    """
+    def assignments():
+        for literal in raw_model or []:
+            name = vpool.obj(abs(literal))
+            if isinstance(name, str):
+                yield name, literal > 0
+    return decode_assignments(assignments(), mra_problem)
+
+def h_parse_strategic_decision(name: str) -> Tuple[int, dict, int] | None:
+    # so_r{r}_a{owner}_..._sdec_a{id}b{bit} -> (id, {r: owner}, bit), None for other names
+    if not name or not name.startswith('so'):
+        return None
+    split = name.rfind('sdec_a')
+    if split < 0:
+        return None
+    a, rest = h_split_number(name[split + 6:])
+    if a is None or rest[:1] != 'b':
+        return None
+    bit, tail = h_split_number(rest[1:])
+    if bit is None or tail:
+        return None
+
+    # r{r}_a{owner} pairs between "so_" and "_sdec_a"
+    tokens = name[3:split].rstrip('_').split('_') if split > 3 else []
+    if len(tokens) % 2:
+        return None
+    observation = {}
+    for r_token, a_token in zip(tokens[::2], tokens[1::2]):
+        r, r_tail = h_split_number(r_token[1:])
+        owner, a_tail = h_split_number(a_token[1:])
+        if r is None or owner is None or r_tail or a_tail:
+            return None
+        observation[r] = owner
+    return a, observation, bit
+
+def decode_strategies(assignments: Iterable[Tuple[str, bool]], mra_problem: MRA) -> StrategyProfile:
+    """
+    Decodes the strategic decisions so_r{r}_a{owner}_..._sdec_a{id}b{bit} (SBMF 2021
+    Def 21) into a strategy table per agent. Observations without any decision
+    variable in the model stay UNDECIDED.
+    """
+    profile = StrategyProfile.for_mra(mra_problem)
+    action_bits = h_bit_width(mra_problem.num_resources() * 2 + 2)
+
+    for name, value in assignments:
+        decision = h_parse_strategic_decision(name)
+        if decision is None:
+            continue
+        a, observation, bit = decision
+        table = profile.tables.get(a)
+        if table is None or bit >= action_bits or len(observation) != len(table.acc):
+            continue
+        try:
+            index = table.index(observation)
+        except (KeyError, ValueError):
+            continue
+
+        if table.actions[index] < 0:
+            table.actions[index] = 0
+        if value:
+            table.actions[index] |= 1 << bit
+
+    return profile
@@ -1,8 +1,12 @@
-import re
-from collections import defaultdict
+import logging
+from collections import OrderedDict, defaultdict
+from collections.abc import Sequence
 from math import ceil, log
 from mra.problem import MRA
+from core.model_decoder import DecodedModel, decode_assignments, decode_strategies
+from mra.strategy import StrategyProfile
 from utils.logging_helper import get_logger
+from utils.telemetry import phase
 
 # Setup logger
 logger = get_logger("model_interpreter")
@@ -11,7 +15,7 @@ class TimeStep:
     """
     Analyzes and represents the state of the MRA system at a specific time step.
     """
-    def __init__(self, t: int, named_model: dict[str, bool], mra_problem: MRA):
+    def __init__(self, t: int, named_model: dict[str, bool], mra_problem: MRA, decoded: DecodedModel | None = None):
         self.t = t
         self.named_model = named_model
         self.mra_problem = mra_problem 
@@ -33,36 +37,17 @@ class TimeStep:
         self.agent_actions: dict[int, str] = {} # 1-idx agent_id (a1,...) -> action_string
         self.satisfied_agents: set[int] = set()  # Set of 1-idx agent IDs that have satisfied their demand
 
-        self._parse_resource_states()
+        # Without a decoded model (e.g. a single step), decode the named model here
+        if decoded is None:
+            decoded = decode_assignments(named_model.items(), mra_problem)
+        self._read_resource_states(decoded)
         self._calculate_demand_fulfillment()
-        self._parse_actions()
-
-    def _parse_resource_states(self):
-        # Pattern: t{self.t}r<R>b<B> (R is 1-indexed resource ID)
-        pattern = re.compile(rf"^t{self.t}r(\d+)b(\d+)$")
-        temp_resource_bits = defaultdict(dict) # res_id_0_indexed -> {bit_idx: value}
-
-        for var_name, truth_value in self.named_model.items():
-            match = pattern.match(var_name)
-            if match:
-                res_id_1_indexed = int(match.group(1))
-                bit_idx = int(match.group(2)) # 0-indexed bit (LSB)
-                res_id_0_indexed = res_id_1_indexed - 1
-
-                if 0 <= res_id_0_indexed < self.num_total_resources and \
-                   0 <= bit_idx < self.m_agent_id_bits:
-                    temp_resource_bits[res_id_0_indexed][bit_idx] = truth_value
-        
+        self._read_actions(decoded)
+
+    def _read_resource_states(self, decoded: DecodedModel):
+        owners = decoded.resource_owners[self.t] if self.t < decoded.num_time_steps else None
         for r_idx_0 in range(self.num_total_resources):
-            bits_map = temp_resource_bits.get(r_idx_0, {})
-            agent_id_0_indexed = 0
-            if self.m_agent_id_bits == 0: # Only agent a0 possible
-                agent_id_0_indexed = 0
-            else:
-                for i in range(self.m_agent_id_bits): # i is bit_idx (0 for LSB)
-                    if bits_map.get(i, False):
-                        agent_id_0_indexed += (1 << i)
-            self.resource_states[r_idx_0] = agent_id_0_indexed
+            self.resource_states[r_idx_0] = owners[r_idx_0] if owners else 0
 
     def _calculate_demand_fulfillment(self):
         # Counts resources held by each agent (0-indexed agent ID for a0, a1, ...)
@@ -100,37 +85,12 @@ class TimeStep:
                 return f"rel{x}"
         return f"unknown_action({number})" # Fallback
 
-    def _parse_actions(self):
-        # Pattern: t{self.t}act_a<A>b<B> (A is 1-indexed agent ID)
-        pattern = re.compile(rf"^t{self.t}act_a(\d+)b(\d+)$")
-        temp_action_bits = defaultdict(dict) # agent_id_1_indexed -> {bit_idx: value}
-
-        for var_name, truth_value in self.named_model.items():
-            match = pattern.match(var_name)
-            if match:
-                agent_id_1_indexed = int(match.group(1))
-                bit_idx = int(match.group(2)) # 0-indexed bit (LSB)
-
-                # Check if this agent_id_1_indexed is one of the actual agents
-                is_valid_agent = any(ag.id == agent_id_1_indexed for ag in self.mra_problem.agt)
-                
-                if is_valid_agent and 0 <= bit_idx < self.m_action_bits:
-                    temp_action_bits[agent_id_1_indexed][bit_idx] = truth_value
-        
+    def _read_actions(self, decoded: DecodedModel):
+        actions = decoded.actions[self.t] if self.t < decoded.num_time_steps else None
+        index = {agent_id: i for i, agent_id in enumerate(decoded.agent_ids)}
         for agent_obj in self.mra_problem.agt: # Iterate through actual agents
-            agent_id_1_idx = agent_obj.id
-            bits_map = temp_action_bits.get(agent_id_1_idx, {})
-            
-            action_num = 0
-            if self.m_action_bits == 0: # Only one action possible (e.g. "idle" if num_possible_actions is 1)
-                # Assuming action_num 0 is the default if no bits.
-                action_num = 0 
-            else:
-                for i in range(self.m_action_bits): # i is bit_idx (0 for LSB)
-                    if bits_map.get(i, False):
-                        action_num += (1 << i)
-            
-            self.agent_actions[agent_id_1_idx] = self._action_number_to_string(action_num)
+            action_num = actions[index[agent_obj.id]] if actions else 0
+            self.agent_actions[agent_obj.id] = self._action_number_to_string(action_num)
 
     def get_formatted_string(self) -> str:
         lines = []
@@ -185,6 +145,46 @@ class TimeStep:
         return "\n".join(lines)
 
 
+class TimeSteps(Sequence):
+    """
+    Read-only sequence of the TimeSteps of a decoded model. A TimeStep is only
+    built when it is accessed; indexed access keeps the most recently used ones
+    in a bounded cache, iteration builds them one at a time without caching.
+    """
+    def __init__(self, named_model: dict[str, bool], mra_problem: MRA, decoded: DecodedModel, cache_size: int = 64):
+        self.named_model = named_model
+        self.mra_problem = mra_problem
+        self.decoded = decoded
+        self.cache_size = cache_size
+        self._cache: OrderedDict[int, TimeStep] = OrderedDict()
+
+    def __len__(self) -> int:
+        return self.decoded.num_time_steps
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[t] for t in range(*index.indices(len(self)))]
+        t = index + len(self) if index < 0 else index
+        if not 0 <= t < len(self):
+            raise IndexError(f"time step {index} out of range")
+        time_step = self._cache.get(t)
+        if time_step is None:
+            time_step = self._build(t)
+            self._cache[t] = time_step
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(t)
+        return time_step
+
+    def __iter__(self):
+        for t in range(len(self)):
+            yield self._cache.get(t) or self._build(t)
+
+    def _build(self, t: int) -> TimeStep:
+        return TimeStep(t, self.named_model, self.mra_problem, self.decoded)
+
+
 class ModelInterpreter:
     """
     Interprets a raw SAT model output to generate a step-by-step trace
@@ -196,39 +196,37 @@ class ModelInterpreter:
 
         Args:
             raw_model: The raw model (list of integers) from the SAT solver.
-            vpool: The PySAT VarPool object used for encoding.
+            vpool: The PySAT VarPool object used for encoding, or the VariableIndex stored with a cached result.
             mra_problem: The MRAProblem object containing agent definitions, resource counts, etc.
         """
         logger.debug("Initializing ModelInterpreter")
         self.raw_model = raw_model if raw_model else []
         self.vpool = vpool
         self.mra_problem = mra_problem
-        self.named_model: dict[str, bool] = self._to_named_model()
-        
-        # Debug key variables
-        self._debug_key_variables()
-        
-        self.max_time_step = self._find_max_time_step()
-        self.loop_size = self._find_loop_size()
-        self.loop_closed_steps = self._find_loop_closed_steps()
-        self.time_steps = []
-        self._process_time_steps()
+        with phase("interpret", num_vars=len(self.raw_model)) as event:
+            # Single pass over the model: name the variables and decode them
+            self.named_model: dict[str, bool] = {}
+            self.decoded = decode_assignments(self._named_assignments(), mra_problem)
+            logger.debug(f"Named model created with {len(self.named_model)} variables")
+
+            self.max_time_step = self.decoded.max_time_step
+            self.loop_size = self.decoded.loop_size
+            self.loop_closed_steps = self.decoded.loop_closed_steps
+            # Time steps are built on access (see TimeSteps)
+            self.time_steps = TimeSteps(self.named_model, mra_problem, self.decoded)
+            event.update(num_time_steps=len(self.time_steps), loop_size=self.loop_size)
         logger.debug(f"ModelInterpreter initialized: max_time_step={self.max_time_step}, loop_size={self.loop_size}")
         
-        # Debug the loop structure
-        self._debug_loop_structure()
-
-    def _to_named_model(self) -> dict[str, bool]:
-        if not self.raw_model:
-            logger.debug("Empty raw model, returning empty named model")
-            return {}
-        model = {}
+        if logger.isEnabledFor(logging.DEBUG):
+            self._debug_key_variables()
+            self._debug_loop_structure()
+
+    def _named_assignments(self):
         for var_int in self.raw_model:
             obj = self.vpool.obj(abs(var_int))
             if obj is not None:
-                 model[obj] = var_int > 0
-        logger.debug(f"Named model created with {len(model)} variables")
-        return model
+                self.named_model[obj] = var_int > 0
+                yield obj, var_int > 0
     
     def _debug_key_variables(self):
         """Debug the key variables in the model to understand its structure"""
@@ -236,160 +234,57 @@ class ModelInterpreter:
             logger.debug("No variables to debug (empty model)")
             return
             
-        # Find and log only TRUE loopSize variables
-        loop_size_vars = [var for var, value in self.named_model.items() 
-                         if re.match(r'^loopSize_\d+$', var) and value]
-        logger.debug(f"TRUE loopSize variables: {loop_size_vars}")
-        
-        # Find and log only TRUE loopClosed variables
-        loop_closed_vars = [var for var, value in self.named_model.items() 
-                           if re.match(r'^loopClosed_\d+$', var) and value]
-        logger.debug(f"TRUE loopClosed variables: {sorted(loop_closed_vars)}")
-        
-        # Find and log only TRUE agent goal variables
-        goal_vars = [var for var, value in self.named_model.items() 
-                    if re.match(r'^agent\d+_goal_loop\d+_at_t_prime\d+$', var) and value]
-        
-        # Group goal variables by agent for clearer output
-        agent_goals = defaultdict(list)
-        for var in goal_vars:
-            match = re.match(r'^agent(\d+)_goal_loop(\d+)_at_t_prime(\d+)$', var)
-            if match:
-                agent_id = match.group(1)
-                loop_size = match.group(2)
-                t_prime = match.group(3)
-                agent_goals[f"Agent {agent_id}"].append(f"loop={loop_size},t_prime={t_prime}")
+        logger.debug(f"TRUE loopSize variables: {[f'loopSize_{self.loop_size}'] if self.loop_size else []}")
+        logger.debug(f"TRUE loopClosed variables: {[f'loopClosed_{t}' for t in self.loop_closed_steps]}")
         
-        for agent, goals in agent_goals.items():
-            logger.debug(f"TRUE goal variables for {agent}: {sorted(goals)}")
+        # Goal variables grouped by agent for clearer output
+        for agent_id, goals in self.decoded.loop_goals.items():
+            logger.debug(f"TRUE goal variables for Agent {agent_id}: {[f'loop={loop},t_prime={t_prime}' for loop, t_prime in goals]}")
         
         # Log counts of variable patterns for an overview
-        var_patterns = {}
-        true_var_patterns = {}
+        var_patterns = defaultdict(int)
+        true_var_patterns = defaultdict(int)
         for var, value in self.named_model.items():
             prefix = var.split('_')[0] if '_' in var else var
-            
-            # Count all variables
-            if prefix not in var_patterns:
-                var_patterns[prefix] = 0
             var_patterns[prefix] += 1
-            
-            # Count only TRUE variables
             if value:
-                if prefix not in true_var_patterns:
-                    true_var_patterns[prefix] = 0
                 true_var_patterns[prefix] += 1
         
         # Log only the pattern counts, not the full variables
-        logger.debug(f"Total variable pattern counts: {var_patterns}")
-        logger.debug(f"TRUE variable pattern counts: {true_var_patterns}")
-        
-        # Additional helpful debug: count time steps that have resource state data
-        time_steps_with_data = set()
-        for var in self.named_model.keys():
-            match = re.match(r'^t(\d+)r\d+b\d+$', var)
-            if match:
-                time_steps_with_data.add(int(match.group(1)))
-        
-        logger.debug(f"Time steps with resource state data: {sorted(time_steps_with_data)}")
-
-    def _find_max_time_step(self) -> int:
-        max_t = -1
-        if not self.named_model:
-            return max_t
-        
-        # General time pattern to find max_time_step from any t-variable
-        time_var_pattern = re.compile(r"^t(\d+)")
-        for var_name in self.named_model.keys():
-            match = time_var_pattern.match(var_name)
-            if match:
-                t = int(match.group(1))
-                if t > max_t:
-                    max_t = t
-        logger.debug(f"Found maximum time step: {max_t}")
-        return max_t
-    
-    def _find_loop_size(self) -> int:
-        """Find loop size from the model using loopSize_{k} variables"""
-        loop_size_pattern = re.compile(r"^loopSize_(\d+)$")
-        
-        for var_name, truth_value in self.named_model.items():
-            match = loop_size_pattern.match(var_name)
-            if match and truth_value:
-                loop_size = int(match.group(1))
-                logger.debug(f"Found loop size: {loop_size}")
-                return loop_size
-        logger.debug("No loop size found in model, using default 0")
-        return 0  # Default if not found
-    
-    def _find_loop_closed_steps(self) -> list[int]:
-        """Find all time steps where loopClosed is true"""
-        loop_closed_pattern = re.compile(r"^loopClosed_(\d+)$")
-        closed_steps = []
-        
-        for var_name, truth_value in self.named_model.items():
-            match = loop_closed_pattern.match(var_name)
-            if match and truth_value:
-                step = int(match.group(1))
-                closed_steps.append(step)
-        
-        closed_steps.sort()
-        logger.debug(f"Found loop closed steps: {closed_steps}")
-        return closed_steps
+        logger.debug(f"Total variable pattern counts: {dict(var_patterns)}")
+        logger.debug(f"TRUE variable pattern counts: {dict(true_var_patterns)}")
+        logger.debug(f"Time steps with data: {list(range(self.decoded.num_time_steps))}")
     
     def _debug_loop_structure(self):
         """Debug the loop structure based on loopClosed and loopSize variables"""
-        # Get information about loop structure
-        loop_begin = 1  # Default value
-        
         if self.loop_closed_steps:
-            loop_end = self.loop_closed_steps[-1] if self.loop_closed_steps else -1
-            logger.debug(f"Loop ends at step: {loop_end}")
-            
-            # Find the first step where the loop is considered to be closed
-            # This helps in understanding where the loop actually begins
-            first_closed_step = self.loop_closed_steps[0] if self.loop_closed_steps else -1
-            logger.debug(f"First loop closed step: {first_closed_step}")
+            logger.debug(f"Loop ends at step: {self.loop_closed_steps[-1]}")
+            logger.debug(f"First loop closed step: {self.loop_closed_steps[0]}")
             
             # Check if loopSize matches the expected formula from definition 4.1
             # loopSize_t is true iff (not loopClosed_{t-1} AND loopClosed_t)
             if self.loop_size > 0:
-                prev_closed = f"loopClosed_{self.loop_size - 1}" in self.named_model and self.named_model[f"loopClosed_{self.loop_size - 1}"]
-                curr_closed = f"loopClosed_{self.loop_size}" in self.named_model and self.named_model[f"loopClosed_{self.loop_size}"]
+                prev_closed = (self.loop_size - 1) in self.loop_closed_steps
+                curr_closed = self.loop_size in self.loop_closed_steps
                 
                 logger.debug(f"For loopSize={self.loop_size}, checking definition 4.1:")
                 logger.debug(f"  - loopClosed_{self.loop_size-1} is {prev_closed}")
                 logger.debug(f"  - loopClosed_{self.loop_size} is {curr_closed}")
                 logger.debug(f"  - (not prev) AND curr = {(not prev_closed) and curr_closed}")
         
-        # Find goal satisfaction steps for each agent
+        # Goal satisfaction steps for each agent
         for agent in self.mra_problem.agt:
-            agent_id = agent.id
-            goal_vars = {var: value for var, value in self.named_model.items() 
-                        if re.match(rf'^agent{agent_id}_goal_loop\d+_at_t_prime\d+$', var) and value}
-                        
-            if goal_vars:
-                logger.debug(f"Agent {agent_id} goal satisfaction variables: {goal_vars}")
-                
-                # Extract loops and t_prime values
-                goal_details = []
-                for var in goal_vars.keys():
-                    match = re.match(rf'^agent{agent_id}_goal_loop(\d+)_at_t_prime(\d+)$', var)
-                    if match:
-                        loop = int(match.group(1))
-                        t_prime = int(match.group(2))
-                        goal_details.append((loop, t_prime))
-                
-                goal_details.sort()
-                logger.debug(f"Agent {agent_id} goal details (loop, t_prime): {goal_details}")
-    
-    def _process_time_steps(self):
-        """Process all time steps and store them for analysis"""
-        logger.debug(f"Processing {self.max_time_step + 1} time steps")
-        for t_idx in range(self.max_time_step + 1):
-            self.time_steps.append(TimeStep(t_idx, self.named_model, self.mra_problem))
-        logger.debug("Time steps processing complete")
+            goal_details = self.decoded.loop_goals.get(agent.id)
+            if goal_details:
+                logger.debug(f"Agent {agent.id} goal details (loop, t_prime): {goal_details}")
     
+    def extract_strategies(self) -> StrategyProfile:
+        """
+        Decodes the strategy of every agent from the model into strategy tables
+        that can be saved and evaluated without the SAT machinery.
+        """
+        return decode_strategies(self.named_model.items(), self.mra_problem)
+
     def calculate_payoff(self) -> float:
         """
         Calculate the payoff based on goal satisfaction divided by loop size.
@@ -424,6 +319,23 @@ class ModelInterpreter:
     def format_complete_trace(self) -> str:
         """
         Formats the entire trace of the system over all time steps with improved readability.
+        Use write_trace to stream long traces instead of building the string.
+        """
+        return "\n".join(self.iter_trace())
+
+    def write_trace(self, file):
+        """
+        Writes the complete trace to a file-like object (e.g. sys.stdout) one
+        part at a time, each followed by a newline.
+        """
+        for part in self.iter_trace():
+            file.write(part)
+            file.write("\n")
+
+    def iter_trace(self):
+        """
+        Yields the parts of the complete trace (see format_complete_trace) one at a
+        time; time steps are rendered as they are reached.
         """
         logger.debug("Formatting complete trace")
         
@@ -432,67 +344,64 @@ class ModelInterpreter:
             if self.mra_problem.num_resources() > 0:  # If there are resources, show initial state
                 # Create a TimeStep for t=0 even if no model vars exist for t=0
                 ts_obj_initial = TimeStep(0, {}, self.mra_problem)
-                return ts_obj_initial.get_formatted_string()
+                yield ts_obj_initial.get_formatted_string()
             else:
-                return "No time steps found in model and no resources to display for t=0."
+                yield "No time steps found in model and no resources to display for t=0."
+            return
 
         # Calculate payoff for the entire loop
         payoff = self.calculate_payoff()
         summary = self.get_goal_satisfaction_summary()
         
-        # Create a header section with important overview information
-        header = [
-            "╔════════════════════════════════════════════╗",
-            f"║ Loop Size: {self.loop_size:<32} ║",
-            f"║ Payoff: {payoff:.4f} ({sum(len(t) for t in summary.values())} goal states/{self.loop_size} steps) ║",
-            "╚════════════════════════════════════════════╝"
-        ]
+        # Header section with important overview information
+        yield "╔════════════════════════════════════════════╗"
+        yield f"║ Loop Size: {self.loop_size:<32} ║"
+        yield f"║ Payoff: {payoff:.4f} ({sum(len(t) for t in summary.values())} goal states/{self.loop_size} steps) ║"
+        yield "╚════════════════════════════════════════════╝"
         
-        # Add agent satisfaction summary
-        summary_lines = ["", "━━━ Agent Goal Satisfaction Summary ━━━"]
+        # Agent satisfaction summary
+        yield ""
+        yield "━━━ Agent Goal Satisfaction Summary ━━━"
         for agent_id in sorted(summary.keys()):
             times = summary[agent_id]
             agent_obj = next((a for a in self.mra_problem.agt if a.id == agent_id), None)
             demand = agent_obj.d if agent_obj else "?"
             
-            summary_lines.append(f"Agent {agent_id} (demand={demand}): Goal reached {len(times)} times")
+            yield f"Agent {agent_id} (demand={demand}): Goal reached {len(times)} times"
             if times:
                 time_groups = self._group_consecutive_numbers(times)
                 time_str = ", ".join([
                     f"t={g[0]}" if len(g) == 1 else f"t={g[0]}-{g[-1]}" 
                     for g in time_groups
                 ])
-                summary_lines.append(f"  At time steps: {time_str}")
+                yield f"  At time steps: {time_str}"
         
-        # Build the trace visualization
-        trace_parts = []
+        # Trace visualization
+        yield ""
+        yield "━━━ Complete Execution Trace ━━━"
         
         # Determine loop structure for display
         loop_start = 0
 
-        for t_idx in range(self.max_time_step + 1):
+        for t_idx, ts_obj in enumerate(self.time_steps):
             # Add time step header to visually separate steps
             if t_idx > 0:
-                trace_parts.append("")
+                yield ""
             
             # Mark special time steps
             elif t_idx == loop_start:
-                trace_parts.append(f"┏━━━ Time Step {t_idx} (Loop Start) ━━━┓") 
+                yield f"┏━━━ Time Step {t_idx} (Loop Start) ━━━┓"
             elif t_idx == self.max_time_step and t_idx > 1:
-                trace_parts.append(f"┗━━━ Time Step {t_idx} (Loop End) ━━━┛")
+                yield f"┗━━━ Time Step {t_idx} (Loop End) ━━━┛"
             else:
                 is_closed_step = t_idx in self.loop_closed_steps
                 status = " (Loop Closed)" if is_closed_step else ""
-                trace_parts.append(f"┈┈┈ Time Step {t_idx}{status} ┈┈┈")
+                yield f"┈┈┈ Time Step {t_idx}{status} ┈┈┈"
             
             # Add the formatted time step content
-            ts_obj = self.time_steps[t_idx]
-            trace_parts.append(ts_obj.get_formatted_string())
+            yield ts_obj.get_formatted_string()
         
-        # Combine everything
-        result = "\n".join(header + summary_lines + ["", "━━━ Complete Execution Trace ━━━"] + trace_parts)
         logger.debug("Trace formatting complete")
-        return result
     
     def _group_consecutive_numbers(self, numbers):
         """Helper method to group consecutive numbers for prettier display"""
@@ -1,5 +1,102 @@
+import os
+import signal
 import subprocess
+import threading
 import time
+from contextlib import contextmanager
+from utils.logging_helper import get_logger
+from utils.telemetry import phase
+
+logger = get_logger("open_wbo_solver")
+
+# open-wbo runs in a process group of its own. Pool.terminate (e.g. when a
+# pruned sweep cancels its running k values) only sends SIGTERM to the workers,
+# so a worker that is terminated or interrupted while it waits for the solver
+# kills the solver's group first; otherwise the solver would keep running orphaned.
+#
+# The peak RSS of the solver is sampled from /proc/<pid>/status (VmHWM) while it
+# runs. getrusage(RUSAGE_CHILDREN) and the rusage of wait4 cannot be used: on
+# Linux they include the peak of the forked worker before the exec, so they
+# report the Python process whenever it is larger than the solver. Samples start
+# 1 ms apart and back off to RSS_SAMPLE_INTERVAL; growth after the last sample
+# before the exit is missed, so the value is a lower bound.
+
+# Largest number of seconds between two samples of the solver's peak RSS
+RSS_SAMPLE_INTERVAL = 0.005
+
+def h_kill_process_group(process: subprocess.Popen):
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+@contextmanager
+def h_kill_on_sigterm(process: subprocess.Popen):
+    # Kills the solver before the calling process handles SIGTERM as before
+    # (signal handlers can only be installed in the main thread)
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def handler(signum, frame):
+        h_kill_process_group(process)
+        signal.signal(signal.SIGTERM, previous if previous is not None else signal.SIG_DFL)
+        if callable(previous):
+            previous(signum, frame)
+        else:
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, handler)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous if previous is not None else signal.SIG_DFL)
+
+def h_peak_rss_kib(pid: int) -> int | None:
+    # Peak resident memory of a running process (None if unavailable, e.g. not on Linux)
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+def run_solver_process(command: list) -> tuple:
+    """
+    Runs the solver command in its own process group and waits for it, sampling
+    its peak RSS (see module comment).
+
+    Returns:
+        Tuple of (return code, stdout, stderr, peak RSS in MiB or None)
+    """
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True
+    )
+    peak_rss_kib = None
+    interval = 0.001
+    with h_kill_on_sigterm(process):
+        try:
+            while True:
+                sample = h_peak_rss_kib(process.pid)
+                if sample is not None:
+                    peak_rss_kib = max(peak_rss_kib or 0, sample)
+                try:
+                    stdout, stderr = process.communicate(timeout=interval)
+                    break
+                except subprocess.TimeoutExpired:
+                    interval = min(2 * interval, RSS_SAMPLE_INTERVAL)
+        except BaseException:
+            h_kill_process_group(process)
+            process.wait()
+            raise
+    return process.returncode, stdout, stderr, None if peak_rss_kib is None else peak_rss_kib / 1024
 
 class OpenWBOSolver:
     def __init__(self, binary_path):
@@ -7,58 +104,58 @@ class OpenWBOSolver:
         self.solver_name = "open-wbo"
 
     def solve(self, wcnf_file_path):
-        print(f"[{self.solver_name}] Starting solver ({self.binary_path})...")
+        logger.debug(f"[{self.solver_name}] Starting solver ({self.binary_path})...")
         results = {}
         try:
             start_time = time.time()
-            process = subprocess.run(
-                [self.binary_path, wcnf_file_path],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            with phase("solve", solver=self.solver_name) as event:
+                return_code, stdout, stderr, peak_rss_mib = run_solver_process([self.binary_path, wcnf_file_path])
+                event.update(return_code=return_code, peak_rss_mib=peak_rss_mib)
             end_time = time.time()
 
-            solution_model_str = None
-            solution_model = None
-            cost_str = None
-            status = 'unknown'
-
-            # Parse model and cost from stdout
-            for line in process.stdout.splitlines():
-                if line.startswith("v "):
-                    solution_model_str = line[2:]
-                    # convert to list of integers
-                    solution_model = [int(x) for x in solution_model_str.split() if x.isdigit() or (x.startswith('-') and x[1:].isdigit())]
-                if line.startswith("o "):
-                    cost_str = line[2:]
-                    try:
-                        cost_str = int(cost_str) # Attempt to convert cost to int
-                    except ValueError:
-                        pass # Keep as string if not an int
-
-            # Determine status based on stdout content first, then return code
-            if "s OPTIMUM FOUND" in process.stdout or "s SATISFIABLE" in process.stdout:
-                status = 'success'
-            elif "s UNSATISFIABLE" in process.stdout:
-                status = 'no solution (UNSAT)'
-            
+            with phase("parse", solver=self.solver_name) as event:
+                solution_model_str = None
+                solution_model = None
+                cost_str = None
+                status = 'unknown'
+
+                # Parse model and cost from stdout
+                for line in stdout.splitlines():
+                    if line.startswith("v "):
+                        solution_model_str = line[2:]
+                        # convert to list of integers
+                        solution_model = [int(x) for x in solution_model_str.split() if x.isdigit() or (x.startswith('-') and x[1:].isdigit())]
+                    if line.startswith("o "):
+                        cost_str = line[2:]
+                        try:
+                            cost_str = int(cost_str) # Attempt to convert cost to int
+                        except ValueError:
+                            pass # Keep as string if not an int
+
+                # Determine status based on stdout content first, then return code
+                if "s OPTIMUM FOUND" in stdout or "s SATISFIABLE" in stdout:
+                    status = 'success'
+                elif "s UNSATISFIABLE" in stdout:
+                    status = 'no solution (UNSAT)'
+                event.update(status=status, cost=cost_str, num_vars=len(solution_model) if solution_model else None)
+
             results = {
-                'stdout': process.stdout,
-                'stderr': process.stderr,
-                'return_code': process.returncode,
+                'stdout': stdout,
+                'stderr': stderr,
+                'return_code': return_code,
                 'total_time': end_time - start_time,
                 'status': status,
                 'model': solution_model,
-                'cost': cost_str
+                'cost': cost_str,
+                'peak_rss_mib': peak_rss_mib
             }
-            print(f"[{self.solver_name}] Finished with status: {status}.")
+            logger.debug(f"[{self.solver_name}] Finished with status: {status}.")
         except FileNotFoundError:
             message = f"Error: {self.solver_name} binary not found at {self.binary_path}"
-            print(f"[{self.solver_name}] {message}")
+            logger.error(f"[{self.solver_name}] {message}")
             results = {'status': 'error', 'message': message}
         except Exception as e:
             message = f"Error during {self.solver_name} solving: {e}"
-            print(f"[{self.solver_name}] {message}")
+            logger.error(f"[{self.solver_name}] {message}")
             results = {'status': 'error', 'message': str(e)}
-        return results
\ No newline at end of file
+        return results
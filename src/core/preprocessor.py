@@ -0,0 +1,334 @@
+import os
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pysat.formula import WCNF
+from utils.logging_helper import get_logger
+from utils.telemetry import phase
+from .clause_simplification import simplify_clauses
+
+logger = get_logger("preprocessor")
+
+# Preprocessing of the hard clauses between encoding and solving.
+#
+# Most variables of a WCNF are Tseitin variables of the clausified formulas and
+# auxiliary variables of the Definitions. Three classic CNF techniques remove a
+# large part of them before the formula is written and handed to the solver:
+#
+#   - unit propagation: a unit clause fixes its literal; satisfied clauses are
+#     dropped and the falsified literal is removed from the others,
+#   - equivalent-literal substitution: literals on a cycle of the binary
+#     implication graph (a strongly connected component) are equivalent and are
+#     replaced by one representative,
+#   - bounded variable elimination: a variable x is replaced by all resolvents of
+#     its clauses on x, if there are no more of them than clauses of x.
+#
+# The variables of the soft clauses are frozen: they are never substituted or
+# eliminated (a fixed frozen variable keeps its unit clause), so every hard
+# model of the result extends to one of the input with the same soft clauses
+# satisfied, and the MaxSAT optimum and its cost do not change. Hard clauses
+# found unsatisfiable are replaced by the empty clause.
+#
+# Every removal is recorded on a reconstruction stack of (witness literal,
+# clause) pairs. reconstruct() walks it backwards and makes the witness true
+# whenever its clause is not yet satisfied, which turns a model of the
+# preprocessed WCNF into a model of the original one (all variables assigned),
+# e.g. for ModelInterpreter. The stage is opt-in and worker processes inherit it:
+#
+#   SATMAS_PREPROCESS=1
+
+PREPROCESS_ENV = "SATMAS_PREPROCESS"
+
+def enabled() -> bool:
+    """
+    Whether the sweep preprocesses the WCNF before solving it (SATMAS_PREPROCESS).
+    """
+    return os.environ.get(PREPROCESS_ENV, "").strip().lower() not in ("", "0", "false", "off")
+
+@dataclass
+class PreprocessingStats:
+    """
+    Sizes of the hard clauses before and after preprocessing and what was removed.
+    """
+    vars_before: int = 0
+    clauses_before: int = 0
+    literals_before: int = 0
+    fixed: int = 0
+    substituted: int = 0
+    eliminated: int = 0
+    vars_after: int = 0
+    clauses_after: int = 0
+    literals_after: int = 0
+    unsat: bool = False
+
+class _Unsatisfiable(Exception):
+    pass
+
+class Preprocessor:
+    """
+    Simplifies hard clauses without touching the frozen variables and
+    reconstructs full models afterwards (see module comment).
+    """
+    def __init__(
+        self,
+        clauses: list[list[int]],
+        frozen: set[int],
+        num_vars: int,
+        max_resolutions: int = 64,
+        max_resolvent_length: int = 16,
+        max_rounds: int = 4
+    ):
+        """
+        Args:
+            clauses: Hard clauses to simplify
+            frozen: Variables that must stay in the formula (e.g. those of the soft clauses)
+            num_vars: Largest variable ID of the formula, for reconstruct
+            max_resolutions: Variables with more pairs of clauses to resolve are not eliminated
+            max_resolvent_length: Variables with longer resolvents are not eliminated
+            max_rounds: Rounds of substitution and elimination at most
+        """
+        self.frozen = set(frozen)
+        self.num_vars = num_vars
+        self.max_resolutions = max_resolutions
+        self.max_resolvent_length = max_resolvent_length
+        self.stats = PreprocessingStats(
+            vars_before=num_vars, clauses_before=len(clauses), literals_before=sum(len(clause) for clause in clauses)
+        )
+        # (witness literal, clause) pairs in the order of the removals
+        self.stack = []
+        self._clauses = []
+        self._occurs = defaultdict(set)
+        self._units = []
+        self._fixed = {}
+        try:
+            for clause in simplify_clauses(clauses)[0]:
+                self._add(clause)
+            self._propagate()
+            for _ in range(max_rounds):
+                changed = self._substitute_equivalences()
+                changed = self._eliminate_variables() or changed
+                if not changed:
+                    break
+        except _Unsatisfiable:
+            # The empty clause is all the solver needs to see
+            self.stats.unsat = True
+            self.stack = []
+            self._clauses = [[]]
+            self._fixed = {}
+        result = self.clauses()
+        self.stats.clauses_after = len(result)
+        self.stats.literals_after = sum(len(clause) for clause in result)
+        self.stats.vars_after = len(set(abs(literal) for clause in result for literal in clause))
+
+    def _add(self, clause):
+        # Adds clause without repeated literals; tautologies are dropped, units queued
+        literals = set(clause)
+        if any(-literal in literals for literal in literals):
+            return
+        if any(self._fixed.get(abs(literal)) == literal for literal in literals):
+            return
+        literals = [literal for literal in literals if abs(literal) not in self._fixed]
+        if not literals:
+            raise _Unsatisfiable()
+        index = len(self._clauses)
+        self._clauses.append(literals)
+        for literal in literals:
+            self._occurs[literal].add(index)
+        if len(literals) == 1:
+            self._units.append(literals[0])
+
+    def _remove(self, index: int) -> list[int]:
+        clause = self._clauses[index]
+        self._clauses[index] = None
+        for literal in clause:
+            self._occurs[literal].discard(index)
+        return clause
+
+    def _propagate(self):
+        while self._units:
+            literal = self._units.pop()
+            var = abs(literal)
+            if var in self._fixed:
+                if self._fixed[var] != literal:
+                    raise _Unsatisfiable()
+                continue
+            self._fixed[var] = literal
+            self.stats.fixed += 1
+            if var not in self.frozen:
+                self.stack.append((literal, [literal]))
+            for index in list(self._occurs[literal]):
+                self._remove(index)
+            for index in list(self._occurs[-literal]):
+                clause = self._remove(index)
+                self._add([other for other in clause if other != -literal])
+
+    def _substitute(self, var: int, literal: int):
+        # Replaces var by the equivalent literal in all clauses
+        self.stack.append((var, [var, -literal]))
+        self.stack.append((-var, [-var, literal]))
+        for index in list(self._occurs[var]) + list(self._occurs[-var]):
+            clause = self._remove(index)
+            self._add([literal if other == var else -literal if other == -var else other for other in clause])
+        self.stats.substituted += 1
+
+    def _substitute_equivalences(self) -> bool:
+        # Equivalent-literal substitution over the strongly connected components
+        # of the binary implication graph (a or b gives -a -> b and -b -> a)
+        implications = defaultdict(list)
+        for clause in self._clauses:
+            if clause is not None and len(clause) == 2:
+                a, b = clause
+                implications[-a].append(b)
+                implications[-b].append(a)
+
+        changed = False
+        for component in h_strongly_connected_components(implications):
+            if len(component) < 2:
+                continue
+            members = set(component)
+            if any(-literal in members for literal in members):
+                raise _Unsatisfiable()
+            # Frozen variables represent their component; every component has a
+            # mirrored one of the negated literals, only the positive representative's is used
+            representative = min(members, key=lambda literal: (abs(literal) not in self.frozen, abs(literal)))
+            if representative < 0:
+                continue
+            for literal in sorted(members, key=abs):
+                var = abs(literal)
+                if literal == representative or var in self.frozen or var in self._fixed:
+                    continue
+                if not self._occurs[var] and not self._occurs[-var]:
+                    continue
+                self._substitute(var, representative if literal > 0 else -representative)
+                changed = True
+            self._propagate()
+        return changed
+
+    def _resolvents(self, var: int) -> list | None:
+        # Non-tautological resolvents on var, or None if there are more than clauses of var
+        positive = [self._clauses[index] for index in self._occurs[var]]
+        negative = [self._clauses[index] for index in self._occurs[-var]]
+        if len(positive) * len(negative) > self.max_resolutions:
+            return None
+        bound = len(positive) + len(negative)
+        resolvents = []
+        for clause in positive:
+            rest = set(clause)
+            rest.discard(var)
+            for other in negative:
+                resolvent = set(rest)
+                tautology = False
+                for literal in other:
+                    if literal == -var:
+                        continue
+                    if -literal in resolvent:
+                        tautology = True
+                        break
+                    resolvent.add(literal)
+                if tautology:
+                    continue
+                if len(resolvent) > self.max_resolvent_length or len(resolvents) == bound:
+                    return None
+                resolvents.append(list(resolvent))
+        return resolvents
+
+    def _eliminate_variables(self) -> bool:
+        candidates = sorted(
+            (var for var in set(abs(literal) for literal, indices in self._occurs.items() if indices)
+             if var not in self.frozen and var not in self._fixed),
+            key=lambda var: len(self._occurs[var]) * len(self._occurs[-var])
+        )
+        changed = False
+        for var in candidates:
+            if var in self._fixed or (not self._occurs[var] and not self._occurs[-var]):
+                continue
+            resolvents = self._resolvents(var)
+            if resolvents is None:
+                continue
+            for literal in (var, -var):
+                for index in list(self._occurs[literal]):
+                    self.stack.append((literal, self._remove(index)))
+            for resolvent in resolvents:
+                self._add(resolvent)
+            self.stats.eliminated += 1
+            changed = True
+            self._propagate()
+        return changed
+
+    def clauses(self) -> list[list[int]]:
+        """
+        The simplified hard clauses (including the units of fixed frozen variables).
+        """
+        units = [[literal] for var, literal in sorted(self._fixed.items()) if var in self.frozen]
+        return units + [clause for clause in self._clauses if clause is not None]
+
+    def reconstruct(self, model: list[int]) -> list[int]:
+        """
+        Model of the original clauses over variables 1..num_vars from a model of
+        the simplified ones (unassigned variables count as false).
+        """
+        values = {abs(literal): literal > 0 for literal in model}
+        for witness, clause in reversed(self.stack):
+            if not any(values.get(abs(literal), False) == (literal > 0) for literal in clause):
+                values[abs(witness)] = witness > 0
+        return [var if values.get(var, False) else -var for var in range(1, self.num_vars + 1)]
+
+def h_strongly_connected_components(graph: dict) -> list[list[int]]:
+    # Iterative Tarjan over the literals of graph (literal -> successor literals)
+    index_of, lowlink = {}, {}
+    on_stack = set()
+    stack, components = [], []
+    counter = 0
+    for root in list(graph):
+        if root in index_of:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, position = work.pop()
+            if position == 0:
+                index_of[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+            successors = graph.get(node, ())
+            if position < len(successors):
+                work.append((node, position + 1))
+                successor = successors[position]
+                if successor not in index_of:
+                    work.append((successor, 0))
+                elif successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+                continue
+            if lowlink[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+    return components
+
+def preprocess_wcnf(wcnf: WCNF, **options) -> tuple[WCNF, Preprocessor]:
+    """
+    WCNF with the preprocessed hard clauses and the soft clauses of wcnf, whose
+    variables are frozen, and the Preprocessor to reconstruct its models with.
+    Emitted as the "preprocess" phase; options are passed on to Preprocessor.
+    """
+    with phase("preprocess") as event:
+        frozen = set(abs(literal) for clause in wcnf.soft for literal in clause)
+        preprocessor = Preprocessor(wcnf.hard, frozen, wcnf.nv, **options)
+        result = WCNF()
+        result.extend(preprocessor.clauses())
+        result.extend(wcnf.soft, weights=wcnf.wght)
+        event.update(asdict(preprocessor.stats))
+    stats = preprocessor.stats
+    logger.info(
+        f"Preprocessed hard clauses: {stats.clauses_before} -> {stats.clauses_after} clauses, "
+        f"{stats.vars_before} -> {stats.vars_after} variables ({stats.fixed} fixed, "
+        f"{stats.substituted} substituted, {stats.eliminated} eliminated)"
+    )
+    return result, preprocessor
@@ -1,12 +1,21 @@
 from pysat.formula import IDPool, Atom as PySATAtom
+from core.encoding_context import active_context
 
-# Global variable pool to manage mapping between string names and integer IDs
-# This should be imported and used by all modules that create or reference SAT variables.
+# Global variable pool to manage mapping between string names and integer IDs.
+# Encodings that run in a core.encoding_context.EncodingContext use the pool of
+# that context instead; this one is used when no context is active.
 vpool = IDPool()
 
+def current_vpool() -> IDPool:
+    """
+    Pool of the active EncodingContext, or the global vpool if there is none.
+    """
+    context = active_context()
+    return context.vpool if context is not None else vpool
+
 def Atom(name: str):
     """
     Creates or retrieves a PySAT Atom (variable) for a given string name.
-    Uses the global vpool for consistent ID management.
+    Uses the pool of the active encoding context (see current_vpool) for consistent ID management.
     """
-    return PySATAtom(vpool.id(name))
\ No newline at end of file
+    return PySATAtom(current_vpool().id(name))
@@ -0,0 +1,65 @@
+import json
+import os
+from utils.logging_helper import get_logger
+
+logger = get_logger("variable_index")
+
+VARIABLE_INDEX_FILENAME = "variables.json"
+
+class VariableIndex:
+    """
+    Variable ID -> name index of an encoding, persisted next to a cached result
+    so that its model can be interpreted without re-encoding. Provides the
+    obj() lookup of the pool it was taken from, so it can be passed to
+    ModelInterpreter in place of the pool.
+
+    Stored as JSON: {"top": <largest ID>, "names": [<name of ID 1>, ...]}, with
+    null for the IDs without a name (e.g. Tseitin auxiliary variables).
+    """
+    def __init__(self, names: dict[int, str], top: int | None = None):
+        self.names = names
+        self.top = top if top is not None else max(names, default=0)
+
+    @classmethod
+    def from_pool(cls, vpool) -> "VariableIndex":
+        names = {var_id: obj for var_id, obj in vpool.id2obj.items() if isinstance(obj, str)}
+        return cls(names, max(vpool.top, max(names, default=0)))
+
+    def obj(self, var_id: int) -> str | None:
+        return self.names.get(var_id)
+
+    def save(self, path: str):
+        names = [None] * self.top
+        for var_id, name in self.names.items():
+            names[var_id - 1] = name
+        with open(path, 'w') as f:
+            json.dump({'top': self.top, 'names': names}, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> "VariableIndex":
+        with open(path) as f:
+            data = json.load(f)
+        names = {var_id: name for var_id, name in enumerate(data['names'], start=1) if name is not None}
+        return cls(names, data['top'])
+
+def save_variable_index(vpool, cache_dir: str) -> str:
+    """
+    Writes the index of vpool to cache_dir and returns its path.
+    """
+    path = os.path.join(cache_dir, VARIABLE_INDEX_FILENAME)
+    VariableIndex.from_pool(vpool).save(path)
+    return path
+
+def load_variable_index(cache_dir: str) -> VariableIndex | None:
+    """
+    Loads the index stored in cache_dir, or returns None if there is none
+    (e.g. results cached before indexes were stored) or it cannot be read.
+    """
+    path = os.path.join(cache_dir, VARIABLE_INDEX_FILENAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        return VariableIndex.load(path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Could not load variable index {path}: {e}")
+        return None
@@ -8,6 +8,7 @@ from encoding.SBMF_2021.definition_15 import encode_protocol
 from .definition_2 import encode_m_loop
 from .definition_3 import encode_infinite_goal_reachability
 from .definition_4 import encode_optimal_goal_reachability
+from core.instrumentation import instrumented
 
 # \begin{definition}[Overall Encoding]
 # \[
@@ -22,6 +23,7 @@ from .definition_4 import encode_optimal_goal_reachability
 # \end{itemize}
 # \end{definition}
 
+@instrumented
 def encode_overall_formula_f_agt_infinity(mra: MRA, k: int) -> WCNF:
     """
     Encodes the overall formula F_Agt_infinity for MaxSAT.
@@ -42,6 +44,7 @@ def encode_overall_formula_f_agt_infinity(mra: MRA, k: int) -> WCNF:
 
     return enrich_formula_f_agt_infinity_with_soft_clauses(hard_clauses, mra, k)
 
+@instrumented
 def encode_formula_f_agt_infinity_hard_clauses(mra: MRA, k: int) -> Formula:
     return And(
         encode_optimal_goal_reachability(mra, k),
@@ -5,6 +5,7 @@ from .definition_2_1 import encode_valid_states
 from encoding.SBMF_2021.definition_13 import encode_evolution
 from .definition_2_2 import encode_looped
 from .definition_2_3 import encode_aux_loop_closed
+from core.instrumentation import instrumented
 
 # \begin{definition}[Encoding of Loops]
 # \[
@@ -19,6 +20,7 @@ from .definition_2_3 import encode_aux_loop_closed
 # \end{itemize}
 # \end{definition}
 
+@instrumented
 def encode_m_loop(mra: MRA, k: int) -> Formula:
     """
     Encodes the overall condition for a loop in an MRA system up to k steps.
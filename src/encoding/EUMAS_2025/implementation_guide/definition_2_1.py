@@ -2,6 +2,7 @@ from mra.problem import MRA
 from encoding.SBMF_2021.definition_17 import encode_resource_state_at_t
 from encoding.SBMF_2021.definition_19 import all_selections_of_k_elements_from_set
 from pysat.formula import And, Formula, Neg, Or
+from core.instrumentation import instrumented
 
 # \begin{subdefinition} \textbf{(Encoding of Valid States)}
 # The encoding of valid states of an MRA $M$ at time step $0$ is $[Valid]_0 = [Access]_0  
@@ -23,6 +24,7 @@ from pysat.formula import And, Formula, Neg, Or
 # The sub encoding $[r = a]_0$ has been defined in \cite{timm2021model} (Definition 17, already implemented).
 # \end{subdefinition}
 
+@instrumented
 def encode_valid_states(mra: MRA) -> Formula:
     """
     This function encodes the valid states of an MRA at time step 0.
@@ -34,6 +36,7 @@ def encode_valid_states(mra: MRA) -> Formula:
         encode_demand(mra)
     )
 
+@instrumented
 def encode_access(mra: MRA) -> Formula:
     """
     This function encodes the access condition for valid states of an MRA.
@@ -47,6 +50,7 @@ def encode_access(mra: MRA) -> Formula:
         for agent in mra.agt
     ))
 
+@instrumented
 def encode_unique(mra: MRA) -> Formula:
     """
     This function encodes the uniqueness condition for valid states of an MRA.
@@ -60,6 +64,7 @@ def encode_unique(mra: MRA) -> Formula:
         for resource in mra.res
     ))
 
+@instrumented
 def encode_demand(mra: MRA) -> Formula:
     """
     This function encodes the demand condition for valid states of an MRA.
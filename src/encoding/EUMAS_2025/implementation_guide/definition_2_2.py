@@ -1,6 +1,7 @@
 from mra.problem import MRA
 from encoding.SBMF_2021.definition_17 import encode_resource_state_at_t
 from pysat.formula import And, Or, Formula, Equals
+from core.instrumentation import instrumented
 
 # \begin{subdefinition} \textbf{(Encoding of Repeated States)}
 # \[
@@ -14,6 +15,7 @@ from pysat.formula import And, Or, Formula, Equals
 # The sub encoding $[r = a]_t$has been defined in \cite{timm2021model} (Definition 17, already implemented).
 # \end{subdefinition}
 
+@instrumented
 def encode_looped(mra: MRA, k: int) -> Formula:
     """
     Encodes that the state at some time step t (from 1 to k) is the same as the state at time step 0.
@@ -24,6 +26,7 @@ def encode_looped(mra: MRA, k: int) -> Formula:
         for t_val in range(1, k + 1) # Iterates t from 1 to k
     ))
 
+@instrumented
 def encode_state_equality_at_t_and_0(mra: MRA, t: int) -> Formula:
     """
     Encodes that the resource state at time step t is identical to the resource state at time step 0.
@@ -2,6 +2,7 @@ from mra.problem import MRA
 from pysat.formula import And, Or, Neg, Formula, Equals
 from core.pysat_constructs import Atom
 from .definition_2_2 import encode_state_equality_at_t_and_0
+from core.instrumentation import instrumented
 
 # \begin{subdefinition} \textbf{(Encoding of Loop Closed)}
 # $[Aux_{loopClosed}]$ is an auxiliary encoding that 
@@ -17,6 +18,7 @@ from .definition_2_2 import encode_state_equality_at_t_and_0
 # The sub encoding $[r = a]_t$has been defined in \cite{timm2021model} (Definition 17, already implemented).
 # \end{subdefinition}
 
+@instrumented
 def encode_aux_loop_closed(mra: MRA, k: int) -> Formula:
     """
     Encodes the auxiliary variables loopClosed_t for t from 0 to k.
@@ -2,6 +2,7 @@ from mra.problem import MRA
 from pysat.formula import And, Or, Neg, Formula
 from core.pysat_constructs import Atom
 from encoding.SBMF_2021.definition_19 import encode_goal
+from core.instrumentation import instrumented
 
 # \begin{definition}[Infinite Goal-Reachability]
 # \[
@@ -14,6 +15,7 @@ from encoding.SBMF_2021.definition_19 import encode_goal
 # \end{itemize}
 # \end{definition}
 
+@instrumented
 def encode_infinite_goal_reachability(mra: MRA, k: int) -> Formula:
     """
     Encodes the infinite goal-reachability condition.
@@ -2,6 +2,7 @@ from mra.problem import MRA
 from pysat.formula import And, Formula
 from .definition_4_1 import encode_aux_loop_size
 from .definition_4_2 import encode_aux_goal
+from core.instrumentation import instrumented
 
 # \begin{definition}[Optimal Goal-Reachability]
 # \[
@@ -18,6 +19,7 @@ from .definition_4_2 import encode_aux_goal
 # \end{itemize}
 # \end{definition}
 
+@instrumented
 def encode_optimal_goal_reachability(mra: MRA, k: int) -> Formula:
     """
     Encodes the optimal goal-reachability condition as a WCNF formula.
@@ -1,5 +1,6 @@
 from pysat.formula import And, Neg, Formula, Equals
 from core.pysat_constructs import Atom
+from core.instrumentation import instrumented
 
 # \begin{subdefinition} \textbf{(Encoding of Loop Size)}
 # $[Aux_{loopSize}]$  introduces new Boolean variables $loopSize_t$ with $t \leq t \leq k$ such that $loopSize_t$ solely evaluates to \emph{true} for truth assignments that characterise loops of size $t$.
@@ -9,6 +10,7 @@ from core.pysat_constructs import Atom
 # where $loopClosed_t$ are Boolean variables introduced in Definition 2.3.
 # \end{subdefinition}
 
+@instrumented
 def encode_aux_loop_size(k: int) -> Formula:
     """
     Encodes auxiliary variables loopSize_t for t from 1 to k.
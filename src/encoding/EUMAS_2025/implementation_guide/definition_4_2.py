@@ -2,6 +2,7 @@ from mra.problem import MRA
 from pysat.formula import And, Formula, Equals
 from core.pysat_constructs import Atom
 from encoding.SBMF_2021.definition_19 import encode_goal
+from core.instrumentation import instrumented
 
 # \begin{subdefinition} \textbf{(Auxiliary Encoding for Goals)}
 # $[Aux_{goal}]$ introduces new Boolean variables $_{a}goal^t_{t'} $ indicating goal-achievement of agent $a$ at time step $t'$, assuming a loop of size $t$.
@@ -15,6 +16,7 @@ from encoding.SBMF_2021.definition_19 import encode_goal
 # \end{itemize}
 # \end{subdefinition}
 
+@instrumented
 def encode_aux_goal(mra: MRA, k: int) -> Formula:
     """
     Encodes auxiliary variables _{a}goal^t_{t'} for agent goals within loops.
@@ -0,0 +1,168 @@
+import multiprocessing
+import os
+from mra.problem import MRA
+from pysat.formula import And, Formula, IDPool
+from core.encoding_context import EncodingContext
+from core.instrumentation import instrumented
+
+from encoding.SBMF_2021.definition_13 import encode_evolution
+from encoding.SBMF_2021.definition_15 import encode_protocol_at_t, h_get_all_observed_resource_states
+from encoding.SBMF_2021.definition_17 import encode_resource_state_at_t
+from encoding.SBMF_2021.definition_20 import encode_action
+from encoding.SBMF_2021.definition_21 import encode_strategic_decision
+
+from .definition_2_1 import encode_valid_states
+from .definition_2_2 import encode_looped
+from .definition_2_3 import encode_aux_loop_closed
+from .definition_3 import encode_infinite_goal_reachability
+from .definition_4 import encode_optimal_goal_reachability
+
+# Encoding F_Agt^inf in time layers on several processes.
+#
+# The protocol [a.protocol]_t (Definition 15) and the evolution [Evolution]_{t,t+1}
+# (Definition 13) only refer to the variables of time steps t and t+1 and to the
+# time-independent strategic decisions, and they make up most of the encoding
+# time. Layer t = [coop_Agt]_t AND [Evolution]_{t,t+1} (the last layer, t = k, has
+# no evolution) is therefore built and clausified in a worker process:
+#
+#   1. The parent allocates the IDs of all named variables of the layers (resource
+#      states and actions of every time step, strategic decisions) and builds the
+#      remaining Definitions, so all named IDs are fixed, 1..named_top.
+#   2. Every worker gets the name -> ID map and encodes its layers in a context
+#      seeded with it; its Tseitin variables start at named_top + 1. A layer that
+#      would name a new variable is an error, as its ID would collide.
+#   3. While the workers run, the parent clausifies the remaining Definitions.
+#      The Tseitin variables of the layers are then moved, layer by layer, to
+#      the next free contiguous range and the clause lists are concatenated.
+#
+# The result is equisatisfiable with encode_formula_f_agt_infinity_hard_clauses
+# and agrees with it on the named variables; only the clauses and IDs of the
+# Tseitin variables differ (every layer is clausified as a formula of its own).
+
+@instrumented
+def encode_time_layer(mra: MRA, t: int, k: int) -> Formula:
+    """
+    Layer t of F_Agt^inf for loops up to k: the protocol at t and, for t < k, the
+    evolution from t to t+1.
+    """
+    protocol = encode_protocol_at_t(mra.agt, mra.num_agents_plus(), mra.num_resources(), t)
+    if t == k:
+        return protocol
+    return And(protocol, encode_evolution(mra, t))
+
+def reserve_time_layer_variables(mra: MRA, k: int):
+    """
+    Allocates the IDs of the named variables of all time layers up to k in the
+    active encoding context, by encoding one value of every variable group.
+    """
+    num_agents_plus = mra.num_agents_plus()
+    num_resources = mra.num_resources()
+    for agent in mra.agt:
+        for observation in h_get_all_observed_resource_states(agent, mra.agt):
+            encode_strategic_decision("idle", observation, agent, num_resources, 0)
+    # The evolution names resources 1..|Res|, the protocol those the agents access
+    resources = sorted(set(range(1, num_resources + 1)) | set(mra.res) | set().union(*(agent.acc for agent in mra.agt)))
+    for t in range(k + 1):
+        for r in resources:
+            encode_resource_state_at_t(r, 0, t, num_agents_plus)
+        for agent in mra.agt:
+            encode_action("idle", agent, num_resources, t)
+
+def h_named_pool(names: dict, top: int) -> IDPool:
+    # IDPool that maps the given names to their IDs and names new objects from top + 1
+    vpool = IDPool(start_from=top + 1)
+    for name, var_id in names.items():
+        vpool.obj2id[name] = var_id
+        vpool.id2obj[var_id] = name
+    return vpool
+
+def h_shift(clauses: list, named_top: int, offset: int) -> list:
+    # Moves the variables above named_top (the Tseitin variables of a layer) by offset
+    if offset == 0:
+        return clauses
+    return [
+        [literal + offset if literal > named_top else literal - offset if literal < -named_top else literal for literal in clause]
+        for clause in clauses
+    ]
+
+# Layer settings of the current worker process, see _init_layer_worker
+_worker_settings = None
+
+def _init_layer_worker(mra: MRA, k: int, names: dict, named_top: int):
+    global _worker_settings
+    _worker_settings = (mra, k, names, named_top)
+
+def _close_layer_worker():
+    global _worker_settings
+    _worker_settings = None
+
+def _encode_layer(t: int) -> tuple:
+    # Clauses of layer t and their largest variable ID (see module comment, step 2)
+    mra, k, names, named_top = _worker_settings
+    with EncodingContext(h_named_pool(names, named_top)) as context:
+        context.occupy(1, named_top)
+        formula = context.encode(encode_time_layer, mra, t, k)
+        if context.vpool.top > named_top:
+            raise RuntimeError(f"Time layer {t} names variables that were not reserved: {context.vpool.top - named_top} new")
+        clauses = context.clausify(formula)
+        return clauses, context.top
+
+def encode_formula_f_agt_infinity_hard_clauses_in_layers(
+    context: EncodingContext,
+    mra: MRA,
+    k: int,
+    processes: int | None = None,
+    extra_formulas: tuple = ()
+) -> list:
+    """
+    Clauses of encode_formula_f_agt_infinity_hard_clauses(mra, k) AND extra_formulas
+    in context, with the time layers encoded on worker processes (see module comment).
+
+    Args:
+        context: Encoding context the variables are named in
+        mra: The MRA problem instance
+        k: The maximum number of time steps
+        processes: Number of worker processes (None = one per CPU, at most k + 1;
+                   0 = encode the layers in the calling process)
+        extra_formulas: Further formulas conjoined to the hard clauses (e.g. loopSize_k)
+
+    Returns:
+        List of clauses
+    """
+    with context.active():
+        reserve_time_layer_variables(mra, k)
+        remaining = And(
+            encode_optimal_goal_reachability(mra, k),
+            encode_valid_states(mra),
+            encode_looped(mra, k),
+            encode_aux_loop_closed(mra, k),
+            encode_infinite_goal_reachability(mra, k),
+            *extra_formulas
+        )
+    names = dict(context.vpool.obj2id)
+    named_top = context.vpool.top
+    if processes is None:
+        processes = min(os.cpu_count() or 1, k + 1)
+
+    if processes:
+        pool = multiprocessing.Pool(processes=processes, initializer=_init_layer_worker, initargs=(mra, k, names, named_top))
+        layers = pool.imap(_encode_layer, range(k + 1))
+    else:
+        pool = None
+        _init_layer_worker(mra, k, names, named_top)
+        layers = map(_encode_layer, range(k + 1))
+    try:
+        # Step 3 (the workers are already running)
+        clauses = context.clausify(remaining)
+        first_layer_id = next_id = context.top + 1
+        for layer_clauses, layer_top in layers:
+            clauses.extend(h_shift(layer_clauses, named_top, next_id - (named_top + 1)))
+            next_id += layer_top - named_top
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        else:
+            _close_layer_worker()
+    context.occupy(first_layer_id, next_id - 1)
+    return clauses
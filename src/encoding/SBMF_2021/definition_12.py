@@ -1,6 +1,7 @@
 from mra.problem import MRA
 from pysat.formula import And, Formula
 from .definition_17 import encode_resource_state_at_t
+from core.instrumentation import instrumented
 
 ################################################
 # By Definition 12 in Paper
@@ -13,6 +14,7 @@ from .definition_17 import encode_resource_state_at_t
 # where $[r = a_0]_0$ is defined according to the encoding of resource states (Sec. 3.2).
 # \end{definition}
 
+@instrumented
 def encode_initial_state(mra_problem: MRA, num_agent_states: int) -> Formula:
 
     return And(*(
@@ -6,7 +6,9 @@ from .definition_20 import encode_action
 from .definition_12 import encode_initial_state
 from .definition_17 import encode_resource_state_at_t
 from .definition_19 import all_selections_of_k_elements_from_set
+from core.instrumentation import instrumented
 
+@instrumented
 def encode_m_k(mra: MRA, k: int):
     return And(
         encode_initial_state(mra, mra.num_agents_plus()),
@@ -47,12 +49,14 @@ def encode_m_k(mra: MRA, k: int):
 # and the sub encodings are defined according to the encoding of resource states and actions (Sec. 3.2). 
 # \end{definition}
 
+@instrumented
 def encode_evolution(mra_problem: MRA, t: int):
     return And(*(
         encode_resource_evolution(r_val, mra_problem, t) 
         for r_val in range(1, mra_problem.num_resources() + 1)
     ))
 
+@instrumented
 def encode_resource_evolution(r_val: int, mra_problem: MRA, t: int):
     num_resources = mra_problem.num_resources()
     num_agents_plus_val = mra_problem.num_agents_plus()
@@ -126,6 +130,7 @@ def h_encode_no_agents_requesting_r(agents: List[Agent], num_resources: int, r_v
     return And(*[item for item in to_conjunct if item is not None]) if to_conjunct else PYSAT_TRUE
 
 
+@instrumented
 def encode_all_pairs_of_agents_requesting_r(agents: List[Agent], num_resources: int, r_val: int, t: int):
     accessible_agents = [agt for agt in agents if r_val in agt.acc]
     
@@ -2,8 +2,10 @@ from .definition_19 import encode_goal
 from pysat.formula import And, Or
 from typing import List
 from mra.agent import Agent
+from core.instrumentation import instrumented
 
 # By Definition 14 in Paper
+@instrumented
 def encode_goal_reachability_formula(agents: List[Agent], total_num_agents: int, k: int):
     to_conjunct = []
     for agt_a in agents:
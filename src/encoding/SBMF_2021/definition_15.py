@@ -8,6 +8,7 @@ from .definition_20 import encode_action
 from .definition_19 import encode_goal
 from .definition_18 import encode_state_observation_by_agent_at_t
 from .definition_21 import encode_strategic_decision
+from core.instrumentation import instrumented
 
 ####################################################
 # By Definition 15 in Paper
@@ -34,6 +35,7 @@ from .definition_21 import encode_strategic_decision
 # and the sub encodings are defined according to the encoding of actions with uniformity constraints, goals, and resource states (Sec. 3.2).
 # \end{definition}
 
+@instrumented
 def encode_protocol(agents: List[Agent], num_agents: int, num_resources: int, k: int):
     to_conjunct = []
     state_observations_cache = {}
@@ -47,48 +49,11 @@ def encode_protocol(agents: List[Agent], num_agents: int, num_resources: int, k:
     # For 'relall' and 'idle', resource_id_or_None can be a placeholder like 'all' or None.
     uniform_action_terms = {
         t: {
-            a.id: {
-                "req": {r_acc: [] for r_acc in a.acc},
-                "rel": {r_acc: [] for r_acc in a.acc},
-                "relall": [], # No specific resource for relall
-                "idle": []    # No specific resource for idle
-            } for a in agents
+            agt_a.id: h_uniform_action_terms(agt_a, state_observations_cache[agt_a.id], num_agents, num_resources, t)
+            for agt_a in agents
         } for t in range(0, k + 1)
     }
 
-    for t in range(0, k + 1):
-        for agt_a in agents:
-            agent_obs_list = state_observations_cache[agt_a.id]
-            for state_observation in agent_obs_list:
-                # For req<resource> and rel<resource>
-                for r_acc in agt_a.acc:
-                    uniform_action_terms[t][agt_a.id]["req"][r_acc].append(
-                        And(
-                            encode_state_observation_by_agent_at_t(state_observation, num_agents, t), # num_agents_plus
-                            encode_strategic_decision(f"req{r_acc}", state_observation, agt_a, num_resources, t)
-                        )
-                    )
-                    uniform_action_terms[t][agt_a.id]["rel"][r_acc].append(
-                        And(
-                            encode_state_observation_by_agent_at_t(state_observation, num_agents, t), # num_agents_plus
-                            encode_strategic_decision(f"rel{r_acc}", state_observation, agt_a, num_resources, t)
-                        )
-                    )
-                # For relall
-                uniform_action_terms[t][agt_a.id]["relall"].append(
-                    And(
-                        encode_state_observation_by_agent_at_t(state_observation, num_agents, t), # num_agents_plus
-                        encode_strategic_decision("relall", state_observation, agt_a, num_resources, t)
-                    )
-                )
-                # For idle
-                uniform_action_terms[t][agt_a.id]["idle"].append(
-                    And(
-                        encode_state_observation_by_agent_at_t(state_observation, num_agents, t), # num_agents_plus
-                        encode_strategic_decision("idle", state_observation, agt_a, num_resources, t)
-                    )
-                )
-
     for t in range(0, k + 1):
         for agt_a in agents:
             # Pass the precomputed terms for this agent at this timestep
@@ -101,6 +66,59 @@ def encode_protocol(agents: List[Agent], num_agents: int, num_resources: int, k:
             to_conjunct.append(encode_agent_protocol(agt_a, agents, num_agents, num_resources, t, agent_specific_terms))
     return And(*[item for item in to_conjunct if item is not None])
 
+@instrumented
+def encode_protocol_at_t(agents: List[Agent], num_agents: int, num_resources: int, t: int):
+    """
+    [a.protocol]_t for all agents a, i.e. time step t of encode_protocol on its own
+    (used to encode the time steps independently, see EUMAS_2025 time_layers).
+    """
+    to_conjunct = []
+    for agt_a in agents:
+        terms = h_uniform_action_terms(agt_a, h_get_all_observed_resource_states(agt_a, agents), num_agents, num_resources, t)
+        agent_specific_terms = (terms["req"], terms["rel"], terms["relall"], terms["idle"])
+        to_conjunct.append(encode_agent_protocol(agt_a, agents, num_agents, num_resources, t, agent_specific_terms))
+    return And(*[item for item in to_conjunct if item is not None])
+
+# Helper: Terms of encode_uniform_action's Or part for one agent at time step t
+# {action_type: {resource_id: [PySAT_formula]}} for req/rel, {action_type: [PySAT_formula]} for relall/idle
+def h_uniform_action_terms(agt_a: Agent, agent_obs_list: List[List[State]], num_agents: int, num_resources: int, t: int) -> dict:
+    terms = {
+        "req": {r_acc: [] for r_acc in agt_a.acc},
+        "rel": {r_acc: [] for r_acc in agt_a.acc},
+        "relall": [], # No specific resource for relall
+        "idle": []    # No specific resource for idle
+    }
+    for state_observation in agent_obs_list:
+        # For req<resource> and rel<resource>
+        for r_acc in agt_a.acc:
+            terms["req"][r_acc].append(
+                And(
+                    encode_state_observation_by_agent_at_t(state_observation, num_agents, t), # num_agents_plus
+                    encode_strategic_decision(f"req{r_acc}", state_observation, agt_a, num_resources, t)
+                )
+            )
+            terms["rel"][r_acc].append(
+                And(
+                    encode_state_observation_by_agent_at_t(state_observation, num_agents, t), # num_agents_plus
+                    encode_strategic_decision(f"rel{r_acc}", state_observation, agt_a, num_resources, t)
+                )
+            )
+        # For relall
+        terms["relall"].append(
+            And(
+                encode_state_observation_by_agent_at_t(state_observation, num_agents, t), # num_agents_plus
+                encode_strategic_decision("relall", state_observation, agt_a, num_resources, t)
+            )
+        )
+        # For idle
+        terms["idle"].append(
+            And(
+                encode_state_observation_by_agent_at_t(state_observation, num_agents, t), # num_agents_plus
+                encode_strategic_decision("idle", state_observation, agt_a, num_resources, t)
+            )
+        )
+    return terms
+
 # Helper: Gets all possible state observations for an agent
 # Each observation is a list of State objects, one for each resource in agent.acc
 def h_get_all_observed_resource_states(agent: Agent, all_agents: List[Agent]) -> List[List[State]]:
@@ -123,6 +141,7 @@ def h_get_all_observed_resource_states(agent: Agent, all_agents: List[Agent]) ->
     # Convert list of tuples of States to list of lists of States
     return [list(obs_tuple) for obs_tuple in all_observation_tuples]
 
+@instrumented
 def encode_agent_protocol(agt_a: Agent, agents: List[Agent], num_agents: int, num_resources: int, t: int, precomputed_terms):
     to_or = []
     
@@ -1,6 +1,7 @@
 from math import ceil, log
 from pysat.formula import And, Neg, Formula
 from core.pysat_constructs import Atom
+from core.instrumentation import instrumented
 
 ########################################
 # By Definition 17 in Paper
@@ -17,6 +18,7 @@ from core.pysat_constructs import Atom
 # where $[r_j]^l_t$ with $0 \leq l < m$ are the Boolean variables introduced for the encoding. 
 # \end{definition}
 
+@instrumented
 def encode_resource_state_at_t(resource: int, agent_id: int, t: int, total_num_agents: int):
     return binary_encode(
         to_binary_string(agent_id, total_num_agents),
@@ -32,7 +34,7 @@ def to_binary_string(number: int, x: int) -> str:
 def binary_encode(binary_string: str, name_prefix: str) -> Formula:
     to_conjunct = []
     for index, char in enumerate(reversed(binary_string)):
-        # Use the Atom wrapper which uses the global vpool
+        # Use the Atom wrapper, which uses the pool of the active encoding context
         new_var = Atom(f"{name_prefix}b{index}")
         to_conjunct.append(
             new_var if char == '1' else Neg(new_var)
@@ -2,6 +2,7 @@ from typing import List
 from pysat.formula import And, Formula
 from mra.state import State
 from .definition_17 import encode_resource_state_at_t
+from core.instrumentation import instrumented
 
 #################################################
 # By Definition 18 in Paper
@@ -16,6 +17,7 @@ from .definition_17 import encode_resource_state_at_t
 # where $[r_j = s_{a}(r_j)]_t$ is defined according to the encoding of resource states.
 # \end{definition}
 
+@instrumented
 def encode_state_observation_by_agent_at_t(state_observation: List[State], total_num_agents: int, t: int) -> Formula:
     clauses = []
     for state_item in state_observation:
@@ -2,6 +2,7 @@ from typing import List, Set
 from pysat.formula import And, Or, PYSAT_FALSE, PYSAT_TRUE
 from mra.agent import Agent
 from .definition_17 import encode_resource_state_at_t
+from core.instrumentation import instrumented
 
 ###################################################
 # By Definition 19 in Paper
@@ -17,6 +18,7 @@ from .definition_17 import encode_resource_state_at_t
 # where $[r = a]_t$ is defined according to the encoding of resource states. 
 # \end{definition}
 
+@instrumented
 def encode_goal(agent: Agent, t: int, total_num_agents: int):
     if len(agent.acc) < agent.d:
         return PYSAT_FALSE
@@ -1,5 +1,6 @@
 from mra.agent import Agent
 from .definition_17 import binary_encode, to_binary_string
+from core.instrumentation import instrumented
 
 ##################################################
 # By Definition 20 in Paper
@@ -16,6 +17,7 @@ from .definition_17 import binary_encode, to_binary_string
 # where $[ac_i]^l_t$ with $0 \leq l < m$ are the Boolean variables introduced for the encoding. 
 # \end{definition}
 
+@instrumented
 def encode_action(action: str, agent: Agent, num_resources: int, t: int):
     # Max action number is for req<max_resource_id> or rel<max_resource_id>
     # If num_resources is count, max_resource_id might be num_resources.
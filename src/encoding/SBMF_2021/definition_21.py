@@ -3,6 +3,7 @@ from mra.agent import Agent
 from mra.state import State
 from .definition_20 import action_number
 from typing import List
+from core.instrumentation import instrumented
 
 ######################################################
 # By Definition 21 in Paper
@@ -20,6 +21,7 @@ from typing import List
 # \]
 # where $[sac_i]^l$ with $0 \leq l < m$ are the Boolean variables  for the encoding. 
 # \end{definition}
+@instrumented
 def encode_strategic_decision(action: str, state_observation: List[State], agent: Agent, num_resources: int, t: int):
     # t (timestep) is not part of the variable name for strategic decisions,
     # as strategy is time-independent based on observation.
@@ -2,6 +2,7 @@ from pysat.formula import And, Equals, Neg
 from mra.problem import MRA
 from core.pysat_constructs import Atom
 from ..SBMF_2021.definition_14 import encode_goal
+from core.instrumentation import instrumented
 
 ###################################################
 # By Definition 33 in Paper 2
@@ -21,6 +22,7 @@ from ..SBMF_2021.definition_14 import encode_goal
 # \]
 # where $g^a_t$ with $a \in Agt$ and $0 \leq t \leq k$ are the Boolean variables introduced in the frequency  auxiliary encoding.  
 # \end{df}
+@instrumented
 def encode_frequency_optimisation(mra_problem: MRA, k: int, to_fix_agt_id: int = -1):
     agents_to_process = mra_problem.agt
     if to_fix_agt_id != -1:
@@ -4,7 +4,9 @@ from .SBMF_2021.definition_13 import encode_m_k
 from .SBMF_2021.definition_14 import encode_goal_reachability_formula
 from .SCP_2023.definition_33 import encode_frequency_optimisation
 from pysat.formula import And, Formula
+from core.instrumentation import instrumented
 
+@instrumented
 def encode_mra(mra: MRA, k: int) -> Formula:
     return And(
         encode_goal_reachability_formula(mra.agt, mra.num_agents_plus(), k),
@@ -0,0 +1,205 @@
+import os
+import re
+from math import ceil, comb, log2
+from mra.problem import MRA
+from utils.logging_helper import get_logger
+
+try:
+    import psutil
+except ImportError:  # optional dependency, see [project.optional-dependencies] monitoring
+    psutil = None
+
+logger = get_logger("admission")
+
+# Memory model for solving one loop size k: a fitted estimate, not an exact count.
+#
+# encoding_size_units approximates the number of literals of the hard clauses of
+# the k encoding: per time step the protocol terms (which scale with the number
+# of observations and actions of every agent) and the evolution and state
+# equality terms (which scale with the agents accessing each resource), plus one
+# goal term per pair t' < t <= k. The unit count is therefore linear in k for the
+# per-layer terms and quadratic only in the goal terms, and its constants depend
+# on the observation and agent counts of the MRA.
+#
+# The bytes per unit were fitted on the end-to-end regression corpus
+# (benchmarks/regression/corpus.yml: the EUMAS 2025 and SBMF 2021 examples and
+# the legacy input, articulation, ring, separable and timebound scenarios,
+# k = 1..5 or the scenario's range; 1.2k-76k units), measured with
+# benchmarks/end_to_end.py on one Linux machine (Python 3.11, open-wbo release
+# build):
+#
+#   - encoder: 530-1000 bytes per unit above the ~20 MiB of an idle worker,
+#     higher on the small examples (ENCODER_BYTES_PER_UNIT = 768),
+#   - open-wbo: 280-480 bytes per unit on the legacy scenarios, more on the small
+#     examples, where its fixed ~3 MiB dominates (SOLVER_BYTES_PER_UNIT = 384),
+#   - WORKER_BASELINE_BYTES covers the idle worker and the solver's fixed part
+#     with a margin, so the estimate stayed above the measured peak on the whole
+#     corpus (65-147 MiB estimated against 21-79 MiB measured).
+#
+# Other MRA shapes or solver builds may deviate; with monitor_rss the admission
+# also checks the measured memory (requires psutil).
+ENCODER_BYTES_PER_UNIT = 768
+SOLVER_BYTES_PER_UNIT = 384
+WORKER_BASELINE_BYTES = 64 * 1024 * 1024
+
+_MEMORY_UNITS = {
+    '': 1,
+    'B': 1,
+    'K': 1024,
+    'M': 1024 ** 2,
+    'G': 1024 ** 3,
+    'T': 1024 ** 4,
+}
+
+def parse_memory_size(value) -> int:
+    """
+    Parses a memory size such as 512M, 4G, 1.5GiB or a plain number of bytes.
+
+    Returns:
+        The size in bytes
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([KMGT]?)(?:I?B)?\s*", str(value).upper())
+    if match is None:
+        raise ValueError(f"Invalid memory size: {value}")
+    return int(float(match.group(1)) * _MEMORY_UNITS[match.group(2)])
+
+def _layer_and_pair_units(mra: MRA) -> tuple:
+    agent_bits = ceil(log2(mra.num_agents_plus()))
+    action_bits = ceil(log2(2 * mra.num_resources() + 2))
+    accessing_agents = {r: [a for a in mra.agt if r in a.acc] for r in mra.res}
+
+    layer_units = 0
+    pair_units = 0
+    for agent in mra.agt:
+        # Protocol: one (observation AND strategic decision) term per observation and action.
+        observations = 1
+        for r in agent.acc:
+            observations *= len(accessing_agents.get(r, [])) + 1
+        num_actions = 2 * len(agent.acc) + 2
+        layer_units += observations * num_actions * (len(agent.acc) * agent_bits + action_bits)
+
+        goal_units = comb(len(agent.acc), agent.d) * agent.d * agent_bits if len(agent.acc) >= agent.d else 0
+        layer_units += goal_units
+        pair_units += goal_units + 5
+
+    for agents in accessing_agents.values():
+        # Evolution: four cases per accessing agent, plus the unrequested and conflict cases.
+        n = len(agents)
+        layer_units += n * 4 * (2 * agent_bits + (n + 1) * action_bits)
+        layer_units += (n + n * (n - 1)) * action_bits + 4 * agent_bits
+        # State equality [s_t = s_0]
+        layer_units += n * 2 * agent_bits
+
+    return layer_units, pair_units
+
+def encoding_size_units(mra: MRA, k: int) -> int:
+    """
+    Size of the hard clauses of the loop size k encoding, in literals (approximately).
+    """
+    layer_units, pair_units = _layer_and_pair_units(mra)
+    k = max(k, 0)
+    return layer_units * (k + 1) + pair_units * k * (k + 1) // 2
+
+def estimate_solve_memory(mra: MRA, k: int) -> int:
+    """
+    Estimated peak memory in bytes of one worker solving loop size k, including
+    its open-wbo child process.
+    """
+    return WORKER_BASELINE_BYTES + encoding_size_units(mra, k) * (ENCODER_BYTES_PER_UNIT + SOLVER_BYTES_PER_UNIT)
+
+def process_tree_rss(pid: int | None = None) -> int | None:
+    """
+    Resident memory in bytes of a process and all its descendants (workers and
+    their open-wbo children). Returns None if psutil is not installed.
+    """
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(pid or os.getpid())
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            # The process exited between listing and measuring it
+            pass
+    return total
+
+class MemoryAdmissionController:
+    """
+    Decides whether another k may be started without exceeding a memory budget.
+
+    Every running k reserves its estimated memory. With monitor_rss, the measured
+    resident memory of this process tree is used instead whenever it is higher
+    than the reservations, so underestimates are corrected while the sweep runs.
+    A k is always admitted when nothing else is running, so a sweep whose single
+    largest k exceeds the budget still makes progress (one k at a time).
+    """
+    def __init__(self, budget_bytes: int, monitor_rss: bool = False, poll_interval: float = 0.5, estimator=estimate_solve_memory):
+        """
+        Args:
+            budget_bytes: Memory budget for all running k values together
+            monitor_rss: Whether to measure the resident memory of the process tree (requires psutil)
+            poll_interval: Seconds between re-evaluations while a k is waiting for memory
+            estimator: Function (mra, k) -> bytes used to reserve memory per k
+        """
+        if monitor_rss and psutil is None:
+            logger.warning("psutil is not installed, RSS monitoring is disabled (install satmas[monitoring])")
+            monitor_rss = False
+        self.budget_bytes = budget_bytes
+        self.monitor_rss = monitor_rss
+        self.poll_interval = poll_interval
+        self.estimator = estimator
+        self.reservations = {}
+        self.peak_bytes = 0
+
+    def estimate(self, mra: MRA, k: int) -> int:
+        return self.estimator(mra, k)
+
+    def reserved_bytes(self) -> int:
+        return sum(self.reservations.values())
+
+    def used_bytes(self) -> int:
+        """
+        Memory currently attributed to running k values.
+        """
+        used = self.reserved_bytes()
+        if self.monitor_rss:
+            measured = process_tree_rss()
+            if measured is not None:
+                used = max(used, measured)
+        self.peak_bytes = max(self.peak_bytes, used)
+        return used
+
+    def try_admit(self, mra: MRA, k: int) -> bool:
+        """
+        Reserves memory for k if it fits into the budget (or nothing is running).
+        """
+        estimate = self.estimate(mra, k)
+        if not self.reservations:
+            if estimate > self.budget_bytes:
+                logger.warning(
+                    f"Estimated memory for k={k} ({estimate / 2**20:.0f} MiB) exceeds the budget "
+                    f"({self.budget_bytes / 2**20:.0f} MiB), running it alone"
+                )
+        elif self.used_bytes() + estimate > self.budget_bytes:
+            return False
+        self.reservations[k] = estimate
+        self.peak_bytes = max(self.peak_bytes, self.reserved_bytes())
+        return True
+
+    def release(self, k: int):
+        self.reservations.pop(k, None)
+
+    def wait_timeout(self) -> float | None:
+        """
+        How long the dispatcher may block waiting for a result before re-checking
+        the budget (None = until the next k finishes).
+        """
+        return self.poll_interval if self.monitor_rss else None
+
@@ -0,0 +1,241 @@
+import os
+import sys
+import csv
+import glob
+import time
+import queue
+import logging
+import argparse
+from mra.problem import MRA
+from utils.logging_helper import get_logger, set_log_level
+from utils.telemetry import configure_telemetry
+from utils.yaml_parser import parse_mra_from_yaml
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import (
+    _solve_for_k,
+    _error_result,
+    generate_scenario_hash,
+    get_cache_paths,
+    default_open_wbo_binary_path
+)
+from .admission import encoding_size_units
+from .worker_pool import WarmWorkerPool
+
+try:
+    import pandas
+except ImportError:  # optional dependency, only needed for Parquet output
+    pandas = None
+
+logger = get_logger("batch_runner")
+
+SUMMARY_COLUMNS = [
+    "scenario",
+    "scenario_hash",
+    "num_agents",
+    "num_resources",
+    "k_start",
+    "k_end",
+    "best_k",
+    "cost",
+    "num_sat",
+    "num_unsat",
+    "num_errors",
+    "encoding_time",
+    "solving_time",
+    "computation_time",
+    "finished_after",
+    "max_num_vars",
+    "max_num_clauses",
+]
+
+def find_scenario_files(patterns: list) -> list:
+    """
+    Expands glob patterns (recursive ** allowed) and directories into a sorted list of YAML files.
+    """
+    files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "**", "*.y*ml")
+        files.update(path for path in glob.glob(pattern, recursive=True) if path.endswith((".yml", ".yaml")))
+    return sorted(files)
+
+def _schedule(scenarios: list) -> list:
+    """
+    Orders all (scenario, k) tasks of the batch, largest encoding first, so that
+    long tasks of every scenario start early and short ones fill the gaps at the
+    end (longest processing time first).
+    """
+    tasks = [
+        (index, k)
+        for index, (_, mra, k_start, k_end) in enumerate(scenarios)
+        for k in range(k_start, k_end + 1)
+    ]
+    return sorted(tasks, key=lambda task: (-encoding_size_units(scenarios[task[0]][1], task[1]), task[0], task[1]))
+
+def _summarise(scenario_file: str, mra: MRA, k_start: int, k_end: int, results: list, finished_after: float) -> dict:
+    best = None
+    for result in results:
+        if not result['error'] and result['status'] == 'success' and result['cost'] is not None:
+            if best is None or result['cost'] < best['cost']:
+                best = result
+
+    def total(key):
+        return sum(r.get(key) or 0 for r in results)
+
+    def maximum(key):
+        return max((r.get(key) for r in results if r.get(key) is not None), default=None)
+
+    return {
+        "scenario": scenario_file,
+        "scenario_hash": generate_scenario_hash(mra),
+        "num_agents": mra.num_agents,
+        "num_resources": mra.num_resources(),
+        "k_start": k_start,
+        "k_end": k_end,
+        "best_k": best['k'] if best else -1,
+        "cost": best['cost'] if best else None,
+        "num_sat": sum(1 for r in results if not r['error'] and r['status'] == 'success'),
+        "num_unsat": sum(1 for r in results if r['status'] == 'no solution (UNSAT)'),
+        "num_errors": sum(1 for r in results if r['error']),
+        "encoding_time": total('encoding_time'),
+        "solving_time": total('solving_time'),
+        "computation_time": total('computation_time'),
+        "finished_after": finished_after,
+        "max_num_vars": maximum('num_vars'),
+        "max_num_clauses": maximum('num_clauses'),
+    }
+
+def run_batch(
+    scenario_files: list,
+    pool: WarmWorkerPool | None = None,
+    num_processes: int | None = None,
+    use_cache: bool = True,
+    cache_root: str | None = None,
+    open_wbo_binary_path: str | None = None,
+    log_level: int = logging.INFO
+) -> list:
+    """
+    Runs the loop-size sweep of every scenario on one shared worker pool and cache.
+
+    The (scenario, k) tasks of all scenarios are dispatched together, so workers
+    never idle while a single scenario waits for its largest k.
+
+    Args:
+        scenario_files: YAML scenario files
+        pool: Shared worker pool (None = start a WarmWorkerPool for this batch)
+        num_processes: Number of workers when the batch starts its own pool
+        use_cache: Whether to use cached results when available
+        cache_root: Cache directory shared by all scenarios (None = ./cache)
+        open_wbo_binary_path: Path to the OpenWBO solver binary (None = bundled binary)
+        log_level: Logging level (use logging.DEBUG for verbose output)
+
+    Returns:
+        List of summary rows (one dictionary with SUMMARY_COLUMNS per scenario).
+        Times are summed over the k values of a scenario, except finished_after
+        (seconds from the start of the batch until the scenario's last k finished).
+    """
+    logger.setLevel(log_level)
+    open_wbo_binary_path = open_wbo_binary_path or default_open_wbo_binary_path()
+
+    scenarios = []
+    for scenario_file in scenario_files:
+        try:
+            mra, k_start, k_end = parse_mra_from_yaml(scenario_file)
+        except Exception as e:
+            logger.error(f"Skipping {scenario_file}: {e}")
+            continue
+        scenarios.append((scenario_file, mra, k_start, k_end))
+
+    if pool is None:
+        with WarmWorkerPool(processes=num_processes) as own_pool:
+            return _run_scheduled(scenarios, own_pool, use_cache, cache_root, open_wbo_binary_path)
+    return _run_scheduled(scenarios, pool, use_cache, cache_root, open_wbo_binary_path)
+
+def _run_scheduled(scenarios: list, pool, use_cache: bool, cache_root: str | None, open_wbo_binary_path: str) -> list:
+    # Tasks are keyed on their cache entry (scenario hash, k and maxbound), so
+    # scenarios sharing one are solved only once and never write it concurrently.
+    subscribers = {}
+    for index, k in _schedule(scenarios):
+        _, mra, _, k_end = scenarios[index]
+        cache_dir, _, _ = get_cache_paths(mra, k, k_end, cache_root)
+        subscribers.setdefault((cache_dir, k), []).append(index)
+    logger.info(f"Running {len(subscribers)} tasks of {len(scenarios)} scenarios on {pool.processes} workers")
+
+    batch_start_time = time.time()
+    completed = queue.Queue()
+    for key, indices in subscribers.items():
+        _, mra, _, k_end = scenarios[indices[0]]
+        k = key[1]
+        pool.apply_async(
+            _solve_for_k,
+            (k, mra, k_end, open_wbo_binary_path, use_cache, cache_root),
+            callback=lambda result, key=key: completed.put((key, result)),
+            error_callback=lambda e, key=key, k=k: completed.put((key, _error_result(k, e)))
+        )
+
+    results = {index: [] for index in range(len(scenarios))}
+    outstanding = {index: k_end - k_start + 1 for index, (_, _, k_start, k_end) in enumerate(scenarios)}
+    rows = [None] * len(scenarios)
+    for _ in range(len(subscribers)):
+        key, result = completed.get()
+        for index in subscribers[key]:
+            results[index].append(result)
+            outstanding[index] -= 1
+            if outstanding[index] == 0:
+                scenario_file, mra, k_start, k_end = scenarios[index]
+                rows[index] = _summarise(scenario_file, mra, k_start, k_end, results[index], time.time() - batch_start_time)
+                logger.info(f"Finished {scenario_file}: best k = {rows[index]['best_k']}, cost = {rows[index]['cost']}")
+
+    logger.info(f"Batch finished in {time.time() - batch_start_time:.4f}s")
+    return [row for row in rows if row is not None]
+
+def write_summary(rows: list, output_path: str):
+    """
+    Writes summary rows as CSV, or as Parquet if output_path ends in .parquet
+    (requires pandas with pyarrow or fastparquet).
+    """
+    if output_path.endswith(".parquet"):
+        if pandas is None:
+            raise ImportError("Parquet output requires pandas and pyarrow (install satmas[batch])")
+        pandas.DataFrame(rows, columns=SUMMARY_COLUMNS).to_parquet(output_path, index=False)
+    else:
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+    logger.info(f"Summary of {len(rows)} scenarios written to {output_path}")
+
+def main(argv: list | None = None):
+    parser = argparse.ArgumentParser(description="Run the optimal loop synthesis on a batch of scenario files.")
+    parser.add_argument("patterns", nargs="+", help="YAML files, directories or glob patterns (use quotes for **)")
+    parser.add_argument("--output", "-o", default="summary.csv", help="Summary file (.csv or .parquet)")
+    parser.add_argument("--processes", "-p", type=int, default=None, help="Number of workers (default: CPU count)")
+    parser.add_argument("--cache_root", default=None, help="Cache directory (default: ./cache)")
+    parser.add_argument("--open_wbo", default=None, help="Path to the open-wbo binary")
+    parser.add_argument("--no_cache", action="store_true", help="Recompute cached results")
+    parser.add_argument("--telemetry", default=None, help="Append JSON-lines telemetry events to this file")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose (debug) logging")
+    args = parser.parse_args(argv)
+
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    set_log_level(log_level)
+    if args.telemetry:
+        configure_telemetry(args.telemetry)
+
+    scenario_files = find_scenario_files(args.patterns)
+    if not scenario_files:
+        logger.error(f"No scenario files match {args.patterns}")
+        return 1
+
+    rows = run_batch(
+        scenario_files,
+        num_processes=args.processes,
+        use_cache=not args.no_cache,
+        cache_root=args.cache_root,
+        open_wbo_binary_path=args.open_wbo,
+        log_level=log_level
+    )
+    write_summary(rows, args.output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
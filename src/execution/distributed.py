@@ -0,0 +1,239 @@
+import os
+import sys
+import time
+import pickle
+import socket
+import logging
+import argparse
+import threading
+from mra.problem import MRA
+from utils.logging_helper import get_logger, set_log_level
+from utils.yaml_parser import parse_mra_from_yaml
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import (
+    _solve_for_k,
+    _error_result,
+    generate_scenario_hash,
+    get_cache_paths,
+    default_open_wbo_binary_path
+)
+from .job_queue import (
+    JobQueue,
+    JobCoordinator,
+    SweepTask,
+    SQLiteJobQueue,
+    make_task_id,
+    default_worker_id,
+    open_job_queue
+)
+
+logger = get_logger("distributed")
+
+def submit_sweep(job_queue: JobQueue, mra: MRA, k_start: int, k_end: int) -> list:
+    """
+    Enqueues one task per loop size k_start..k_end (soft clause maxbound k_end).
+
+    Returns:
+        List of task ids (including tasks that had been submitted before)
+    """
+    scenario_hash = generate_scenario_hash(mra)
+    task_ids = []
+    for k in range(k_start, k_end + 1):
+        task_id = make_task_id(scenario_hash, k, k_end)
+        job_queue.submit(SweepTask(task_id=task_id, scenario_hash=scenario_hash, k=k, maxbound=k_end, mra=mra))
+        task_ids.append(task_id)
+    logger.info(f"Submitted k={k_start}..{k_end} of scenario {scenario_hash}")
+    return task_ids
+
+def _result_summary(output: dict, maxbound: int) -> dict:
+    # The model stays in the result cache, the queue only carries what the
+    # coordinator needs to rank the loop sizes. Costs are only comparable
+    # within one maxbound, so the summary records it.
+    summary = {key: value for key, value in output.items() if key != 'model'}
+    summary['maxbound'] = maxbound
+    return summary
+
+def _sweep_results(job_queue: JobQueue, scenario_hash: str, k_start: int, k_end: int) -> list:
+    # Sweeps of the same scenario with another k_end (maxbound) share the hash
+    return [
+        r for r in job_queue.results(scenario_hash)
+        if k_start <= r['k'] <= k_end and r.get('maxbound') == k_end
+    ]
+
+class ClaimHeartbeat:
+    """
+    Renews the claim of a task every interval seconds in a background thread
+    while the worker solves it (see JobQueue.heartbeat).
+    """
+    def __init__(self, job_queue: JobQueue, task_id: str, interval: float):
+        self.job_queue = job_queue
+        self.task_id = task_id
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.job_queue.heartbeat(self.task_id)
+            except Exception as e:
+                logger.warning(f"Could not renew the claim of task {self.task_id}: {e}")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stopped.set()
+        self._thread.join()
+
+def run_worker(
+    job_queue: JobQueue,
+    cache_root: str,
+    open_wbo_binary_path: str | None = None,
+    worker_id: str | None = None,
+    exit_when_idle: bool = True,
+    poll_interval: float = 2.0,
+    max_tasks: int | None = None,
+    heartbeat_interval: float = 60.0
+) -> int:
+    """
+    Claims tasks from the queue and solves them until the queue is empty (or
+    forever with exit_when_idle=False). Full results are written to the shared
+    cache below cache_root, the queue receives a summary without the model.
+    The claim of the running task is renewed every heartbeat_interval seconds,
+    so requeue_stale should only be called with older_than well above it.
+
+    Returns:
+        Number of tasks processed
+    """
+    worker_id = worker_id or default_worker_id()
+    open_wbo_binary_path = open_wbo_binary_path or default_open_wbo_binary_path()
+    processed = 0
+
+    while max_tasks is None or processed < max_tasks:
+        task = job_queue.claim(worker_id)
+        if task is None:
+            if exit_when_idle:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        logger.info(f"Worker {worker_id} solving k={task.k} of scenario {task.scenario_hash}")
+        try:
+            with ClaimHeartbeat(job_queue, task.task_id, heartbeat_interval):
+                output = _solve_for_k(task.k, task.mra, task.maxbound, open_wbo_binary_path, True, cache_root)
+        except Exception as e:
+            logger.warning(f"Worker {worker_id} failed on task {task.task_id}: {e}")
+            output = _error_result(task.k, e)
+        job_queue.complete(task.task_id, _result_summary(output, task.maxbound))
+        processed += 1
+
+    logger.info(f"Worker {worker_id} processed {processed} tasks")
+    return processed
+
+def wait_for_sweep(job_queue: JobQueue, mra: MRA, k_start: int, k_end: int, timeout: float | None = None, poll_interval: float = 2.0) -> list:
+    """
+    Blocks until all loop sizes of a submitted sweep are done.
+
+    Returns:
+        The result summaries sorted by k
+    """
+    scenario_hash = generate_scenario_hash(mra)
+    expected = set(range(k_start, k_end + 1))
+    deadline = None if timeout is None else time.time() + timeout
+    while True:
+        results = _sweep_results(job_queue, scenario_hash, k_start, k_end)
+        if {r['k'] for r in results} >= expected:
+            return sorted(results, key=lambda r: r['k'])
+        if deadline is not None and time.time() > deadline:
+            raise TimeoutError(f"Sweep of scenario {scenario_hash} did not finish within {timeout}s")
+        time.sleep(poll_interval)
+
+def collect_best_loop(job_queue: JobQueue, mra: MRA, k_start: int, k_end: int, cache_root: str):
+    """
+    Aggregates the finished tasks of a sweep and loads the model of the best loop
+    from the shared cache.
+
+    Returns:
+        Tuple of (best_k_value, best_payoff, best_k_loop_model), as returned by
+        iterative_optimal_loop_synthesis_parallel
+    """
+    scenario_hash = generate_scenario_hash(mra)
+    best_k_value, best_payoff = -1, float('inf')
+    for result in _sweep_results(job_queue, scenario_hash, k_start, k_end):
+        if result['error']:
+            logger.warning(f"Error encountered for k={result['k']}. Status: {result['status']}, Message: {result['message']}")
+        elif result['status'] == 'success' and result['cost'] is not None and result['cost'] < best_payoff:
+            best_k_value, best_payoff = result['k'], result['cost']
+
+    if best_k_value == -1:
+        logger.warning(f"No optimal loop found within the given k range ({k_start} to {k_end}).")
+        return -1, float('inf'), None
+
+    _, _, result_path = get_cache_paths(mra, best_k_value, k_end, cache_root)
+    with open(result_path, 'rb') as f:
+        best_k_loop = pickle.load(f)['model']
+    logger.info(f"Best optimal loop found for k = {best_k_value} with pay-off (cost): {best_payoff}")
+    return best_k_value, best_payoff, best_k_loop
+
+def main(argv: list | None = None):
+    parser = argparse.ArgumentParser(description="Distribute loop-size sweeps over several nodes.")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose (debug) logging")
+    parser.add_argument(
+        "--authkey",
+        default=os.environ.get("SATMAS_AUTHKEY"),
+        help="Shared secret of the coordinator and its tcp clients (default: $SATMAS_AUTHKEY); required for tcp queues"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    coordinator_parser = subparsers.add_parser("coordinator", help="Serve a job queue over TCP")
+    coordinator_parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (0.0.0.0 = all; only on a trusted network)")
+    coordinator_parser.add_argument("--port", type=int, default=5555)
+    coordinator_parser.add_argument("--db", default=":memory:", help="SQLite file backing the queue")
+
+    submit_parser = subparsers.add_parser("submit", help="Enqueue the loop sizes of scenario YAML files")
+    submit_parser.add_argument("queue", help="fs:<dir>, sqlite:<file> or tcp:<host>:<port>")
+    submit_parser.add_argument("yaml_files", nargs="+")
+
+    worker_parser = subparsers.add_parser("worker", help="Solve tasks from a queue")
+    worker_parser.add_argument("queue", help="fs:<dir>, sqlite:<file> or tcp:<host>:<port>")
+    worker_parser.add_argument("--cache_root", required=True, help="Result cache shared by all nodes")
+    worker_parser.add_argument("--open_wbo", default=None, help="Path to the open-wbo binary")
+    worker_parser.add_argument("--wait", action="store_true", help="Keep polling when the queue is empty")
+
+    collect_parser = subparsers.add_parser("collect", help="Report the best loop of each scenario")
+    collect_parser.add_argument("queue", help="fs:<dir>, sqlite:<file> or tcp:<host>:<port>")
+    collect_parser.add_argument("yaml_files", nargs="+")
+    collect_parser.add_argument("--cache_root", required=True, help="Result cache shared by all nodes")
+
+    args = parser.parse_args(argv)
+    set_log_level(logging.DEBUG if args.verbose else logging.INFO)
+    # Requests to the coordinator are unpickled, so it never runs with a guessable key
+    if not args.authkey and (args.command == "coordinator" or args.queue.startswith("tcp:")):
+        parser.error("--authkey or SATMAS_AUTHKEY is required for the coordinator and tcp queues")
+    authkey = args.authkey.encode() if args.authkey else None
+
+    if args.command == "coordinator":
+        coordinator = JobCoordinator(SQLiteJobQueue(args.db), args.host, args.port, authkey=authkey)
+        logger.info(f"Job coordinator listening on {socket.gethostname()}:{coordinator.address[1]}")
+        try:
+            coordinator.serve_forever()
+        except KeyboardInterrupt:
+            coordinator.close()
+        return
+
+    with open_job_queue(args.queue, authkey=authkey) as job_queue:
+        if args.command == "submit":
+            for yaml_file in args.yaml_files:
+                mra, k_start, k_end = parse_mra_from_yaml(yaml_file)
+                submit_sweep(job_queue, mra, k_start, k_end)
+        elif args.command == "worker":
+            run_worker(job_queue, args.cache_root, args.open_wbo, exit_when_idle=not args.wait)
+        elif args.command == "collect":
+            for yaml_file in args.yaml_files:
+                mra, k_start, k_end = parse_mra_from_yaml(yaml_file)
+                best_k_value, best_payoff, _ = collect_best_loop(job_queue, mra, k_start, k_end, args.cache_root)
+                print(f"{yaml_file}: best k = {best_k_value}, pay-off (cost) = {best_payoff}")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,451 @@
+import os
+import time
+import uuid
+import pickle
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from multiprocessing.connection import Listener, Client
+from mra.problem import MRA
+from utils.logging_helper import get_logger
+
+logger = get_logger("job_queue")
+
+# Job queues for distributing the per-k unit of work (_solve_for_k) over several
+# nodes. Every backend implements the same interface (JobQueue): a submitter
+# enqueues (scenario, k) tasks, workers claim them one at a time and report a
+# small result summary, and the full result (including the model) is written by
+# the worker to the shared, content-addressed result cache.
+#
+#   FileSystemJobQueue  one file per task, claimed by an atomic rename; works on a
+#                       shared NFS directory next to the cache
+#   SQLiteJobQueue      one database file; fine on a local disk or for many
+#                       workers on one host (SQLite locking is unreliable on NFS)
+#   JobCoordinator      TCP server exposing any backend to RemoteJobQueue clients
+
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+
+@dataclass
+class SweepTask:
+    """
+    One loop size k of one scenario.
+    """
+    task_id: str
+    scenario_hash: str
+    k: int
+    maxbound: int
+    mra: MRA
+    worker_id: str | None = None
+    claimed_at: float | None = None
+    result: dict | None = field(default=None, repr=False)
+
+def make_task_id(scenario_hash: str, k: int, maxbound: int) -> str:
+    """
+    Deterministic task id, so submitting the same sweep twice does not duplicate work.
+    """
+    return f"{scenario_hash}_k{k}_m{maxbound}"
+
+def default_worker_id() -> str:
+    return f"{os.uname().nodename}-{os.getpid()}"
+
+class JobQueue(ABC):
+    """
+    Interface of all job queue backends.
+    """
+    @abstractmethod
+    def submit(self, task: SweepTask) -> bool:
+        """
+        Enqueues a task. Returns False if a task with the same id already exists.
+        """
+
+    @abstractmethod
+    def claim(self, worker_id: str) -> SweepTask | None:
+        """
+        Atomically takes the next pending task, or returns None if there is none.
+        """
+
+    @abstractmethod
+    def complete(self, task_id: str, result: dict):
+        """
+        Marks a claimed task as done and stores its result summary.
+        """
+
+    @abstractmethod
+    def heartbeat(self, task_id: str):
+        """
+        Renews the claim of a task, so requeue_stale does not take it from a
+        worker that is still solving it.
+        """
+
+    @abstractmethod
+    def requeue_stale(self, older_than: float) -> int:
+        """
+        Returns tasks claimed (or renewed by heartbeat) more than older_than
+        seconds ago to the pending state (e.g. after a worker crashed). Returns
+        the number of requeued tasks.
+        """
+
+    @abstractmethod
+    def counts(self) -> dict:
+        """
+        Number of tasks per state (pending, claimed, done).
+        """
+
+    @abstractmethod
+    def results(self, scenario_hash: str | None = None) -> list:
+        """
+        Result summaries of all done tasks (of one scenario if given).
+        """
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def _write_atomically(path: str, data: bytes):
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+class FileSystemJobQueue(JobQueue):
+    """
+    Job queue in a (shared) directory with one pickle file per task.
+
+    A task is claimed by renaming it from pending/ to claimed/, which succeeds for
+    exactly one worker because rename is atomic within a file system.
+    """
+    def __init__(self, root: str):
+        self.root = root
+        for state in (PENDING, CLAIMED, DONE):
+            os.makedirs(os.path.join(root, state), exist_ok=True)
+
+    def _path(self, state: str, task_id: str) -> str:
+        return os.path.join(self.root, state, f"{task_id}.pkl")
+
+    def _exists(self, task_id: str) -> bool:
+        return any(os.path.exists(self._path(state, task_id)) for state in (PENDING, CLAIMED, DONE))
+
+    def submit(self, task: SweepTask) -> bool:
+        if self._exists(task.task_id):
+            return False
+        _write_atomically(self._path(PENDING, task.task_id), pickle.dumps(task))
+        return True
+
+    def claim(self, worker_id: str) -> SweepTask | None:
+        for file_name in sorted(os.listdir(os.path.join(self.root, PENDING))):
+            if not file_name.endswith(".pkl"):
+                continue
+            task_id = file_name[:-len(".pkl")]
+            claimed_path = self._path(CLAIMED, task_id)
+            try:
+                os.rename(self._path(PENDING, task_id), claimed_path)
+            except FileNotFoundError:
+                # Another worker claimed it first
+                continue
+            # The rename keeps the submission time, which requeue_stale would
+            # take for the claim time
+            os.utime(claimed_path)
+            with open(claimed_path, 'rb') as f:
+                task = pickle.load(f)
+            task.worker_id = worker_id
+            task.claimed_at = time.time()
+            _write_atomically(claimed_path, pickle.dumps(task))
+            return task
+        return None
+
+    def complete(self, task_id: str, result: dict):
+        claimed_path = self._path(CLAIMED, task_id)
+        if not os.path.exists(claimed_path) and not os.path.exists(self._path(DONE, task_id)):
+            # The claim was requeued meanwhile; take the task back, unless another
+            # worker has claimed it already (its result is then kept as well)
+            try:
+                os.rename(self._path(PENDING, task_id), claimed_path)
+            except FileNotFoundError:
+                pass
+        try:
+            with open(claimed_path, 'rb') as f:
+                task = pickle.load(f)
+        except FileNotFoundError:
+            # Already completed
+            return
+        task.result = result
+        _write_atomically(self._path(DONE, task_id), pickle.dumps(task))
+        try:
+            os.remove(claimed_path)
+        except FileNotFoundError:
+            pass
+
+    def heartbeat(self, task_id: str):
+        try:
+            os.utime(self._path(CLAIMED, task_id))
+        except FileNotFoundError:
+            pass
+
+    def requeue_stale(self, older_than: float) -> int:
+        requeued = 0
+        for file_name in os.listdir(os.path.join(self.root, CLAIMED)):
+            if not file_name.endswith(".pkl"):
+                continue
+            claimed_path = os.path.join(self.root, CLAIMED, file_name)
+            try:
+                if time.time() - os.path.getmtime(claimed_path) < older_than:
+                    continue
+                os.rename(claimed_path, os.path.join(self.root, PENDING, file_name))
+                requeued += 1
+            except FileNotFoundError:
+                continue
+        return requeued
+
+    def counts(self) -> dict:
+        return {
+            state: sum(1 for name in os.listdir(os.path.join(self.root, state)) if name.endswith(".pkl"))
+            for state in (PENDING, CLAIMED, DONE)
+        }
+
+    def results(self, scenario_hash: str | None = None) -> list:
+        results = []
+        for file_name in sorted(os.listdir(os.path.join(self.root, DONE))):
+            if not file_name.endswith(".pkl"):
+                continue
+            if scenario_hash is not None and not file_name.startswith(f"{scenario_hash}_"):
+                continue
+            with open(os.path.join(self.root, DONE, file_name), 'rb') as f:
+                results.append(pickle.load(f).result)
+        return results
+
+class SQLiteJobQueue(JobQueue):
+    """
+    Job queue in a SQLite database. Claims run in an IMMEDIATE transaction, so
+    concurrent workers (threads or processes) never take the same task.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            " task_id TEXT PRIMARY KEY,"
+            " scenario_hash TEXT NOT NULL,"
+            " k INTEGER NOT NULL,"
+            " state TEXT NOT NULL,"
+            " worker_id TEXT,"
+            " claimed_at REAL,"
+            " task BLOB NOT NULL,"
+            " result BLOB)"
+        )
+
+    def submit(self, task: SweepTask) -> bool:
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO tasks (task_id, scenario_hash, k, state, task) VALUES (?, ?, ?, ?, ?)",
+                (task.task_id, task.scenario_hash, task.k, PENDING, pickle.dumps(task))
+            )
+            return cursor.rowcount == 1
+
+    def claim(self, worker_id: str) -> SweepTask | None:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT task_id, task FROM tasks WHERE state = ? ORDER BY k, task_id LIMIT 1", (PENDING,)
+                ).fetchone()
+                if row is None:
+                    self._connection.execute("COMMIT")
+                    return None
+                claimed_at = time.time()
+                self._connection.execute(
+                    "UPDATE tasks SET state = ?, worker_id = ?, claimed_at = ? WHERE task_id = ?",
+                    (CLAIMED, worker_id, claimed_at, row[0])
+                )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        task = pickle.loads(row[1])
+        task.worker_id = worker_id
+        task.claimed_at = claimed_at
+        return task
+
+    def complete(self, task_id: str, result: dict):
+        with self._lock:
+            self._connection.execute(
+                "UPDATE tasks SET state = ?, result = ? WHERE task_id = ?",
+                (DONE, pickle.dumps(result), task_id)
+            )
+
+    def heartbeat(self, task_id: str):
+        with self._lock:
+            self._connection.execute(
+                "UPDATE tasks SET claimed_at = ? WHERE task_id = ? AND state = ?",
+                (time.time(), task_id, CLAIMED)
+            )
+
+    def requeue_stale(self, older_than: float) -> int:
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE tasks SET state = ?, worker_id = NULL, claimed_at = NULL WHERE state = ? AND claimed_at < ?",
+                (PENDING, CLAIMED, time.time() - older_than)
+            )
+            return cursor.rowcount
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._connection.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state").fetchall()
+        counts = {PENDING: 0, CLAIMED: 0, DONE: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def results(self, scenario_hash: str | None = None) -> list:
+        with self._lock:
+            if scenario_hash is None:
+                rows = self._connection.execute(
+                    "SELECT result FROM tasks WHERE state = ? ORDER BY scenario_hash, k", (DONE,)
+                ).fetchall()
+            else:
+                rows = self._connection.execute(
+                    "SELECT result FROM tasks WHERE state = ? AND scenario_hash = ? ORDER BY k", (DONE, scenario_hash)
+                ).fetchall()
+        return [pickle.loads(row[0]) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+_REMOTE_METHODS = ("submit", "claim", "complete", "heartbeat", "requeue_stale", "counts", "results")
+
+class JobCoordinator:
+    """
+    TCP server that exposes a job queue to workers on other nodes.
+
+    Connections are authenticated with authkey (HMAC challenge, see
+    multiprocessing.connection). Requests are unpickled, so whoever knows the
+    authkey can run code on the coordinator: there is no default key, and the
+    coordinator only listens on the loopback interface unless told otherwise.
+    """
+    def __init__(self, backend: JobQueue | None = None, host: str = "127.0.0.1", port: int = 0, *, authkey: bytes):
+        """
+        Args:
+            backend: Queue that holds the tasks (None = in-memory SQLite queue)
+            host: Interface to listen on ("0.0.0.0" = all interfaces)
+            port: Port to listen on (0 = pick a free port, see .address)
+            authkey: Shared secret of coordinator and workers (must not be empty)
+        """
+        if not authkey:
+            raise ValueError("JobCoordinator requires a non-empty authkey")
+        self.backend = backend or SQLiteJobQueue(":memory:")
+        self._listener = Listener((host, port), authkey=authkey)
+        self.address = self._listener.address
+        self._thread = None
+        self._closed = False
+
+    def start(self) -> 'JobCoordinator':
+        """
+        Starts serving in a background thread.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Job coordinator listening on {self.address[0]}:{self.address[1]}")
+        return self
+
+    def serve_forever(self):
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except Exception as e:
+                if not self._closed:
+                    logger.warning(f"Rejected connection: {e}")
+                continue
+            threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+
+    def _handle(self, connection):
+        with connection:
+            while True:
+                try:
+                    method, args = connection.recv()
+                except (EOFError, OSError):
+                    return
+                if method not in _REMOTE_METHODS:
+                    connection.send(('error', f"Unknown method: {method}"))
+                    continue
+                try:
+                    connection.send(('ok', getattr(self.backend, method)(*args)))
+                except Exception as e:
+                    connection.send(('error', f"{type(e).__name__}: {e}"))
+
+    def close(self):
+        self._closed = True
+        self._listener.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class RemoteJobQueue(JobQueue):
+    """
+    Client of a JobCoordinator.
+    """
+    def __init__(self, host: str, port: int, authkey: bytes):
+        if not authkey:
+            raise ValueError("RemoteJobQueue requires a non-empty authkey")
+        self._connection = Client((host, port), authkey=authkey)
+        self._lock = threading.Lock()
+
+    def _call(self, method: str, *args):
+        with self._lock:
+            self._connection.send((method, args))
+            status, value = self._connection.recv()
+        if status != 'ok':
+            raise RuntimeError(f"Job coordinator error in {method}: {value}")
+        return value
+
+    def submit(self, task: SweepTask) -> bool:
+        return self._call("submit", task)
+
+    def claim(self, worker_id: str) -> SweepTask | None:
+        return self._call("claim", worker_id)
+
+    def complete(self, task_id: str, result: dict):
+        return self._call("complete", task_id, result)
+
+    def heartbeat(self, task_id: str):
+        return self._call("heartbeat", task_id)
+
+    def requeue_stale(self, older_than: float) -> int:
+        return self._call("requeue_stale", older_than)
+
+    def counts(self) -> dict:
+        return self._call("counts")
+
+    def results(self, scenario_hash: str | None = None) -> list:
+        return self._call("results", scenario_hash)
+
+    def close(self):
+        self._connection.close()
+
+def open_job_queue(spec: str, authkey: bytes | None = None) -> JobQueue:
+    """
+    Opens a job queue from a spec string:
+
+        fs:<directory>       FileSystemJobQueue
+        sqlite:<file>        SQLiteJobQueue
+        tcp:<host>:<port>    RemoteJobQueue connected to a JobCoordinator (needs authkey)
+    """
+    scheme, _, location = spec.partition(":")
+    if scheme == "fs" and location:
+        return FileSystemJobQueue(location)
+    if scheme == "sqlite" and location:
+        return SQLiteJobQueue(location)
+    if scheme == "tcp" and location:
+        host, _, port = location.rpartition(":")
+        return RemoteJobQueue(host, int(port), authkey=authkey)
+    raise ValueError(f"Invalid job queue spec: {spec} (expected fs:<dir>, sqlite:<file> or tcp:<host>:<port>)")
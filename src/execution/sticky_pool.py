@@ -0,0 +1,86 @@
+import os
+import multiprocessing
+from typing import Callable, Hashable, Iterable
+from utils.logging_helper import get_logger
+
+logger = get_logger("sticky_pool")
+
+class _InlineResult:
+    # Result of a task that already ran in the calling process (see StickyPool)
+    def __init__(self, value):
+        self._value = value
+
+    def get(self, timeout: float | None = None):
+        return self._value
+
+class StickyPool:
+    """
+    Worker processes that keep per-process state between tasks, e.g. an encoding
+    loaded into an incremental solver by the initializer or by the first task.
+
+    Every key is bound to one worker, and tasks submitted with that key always
+    run there, so the state a worker built for a key is reused by the later
+    tasks of the key. Keys are spread round-robin over the workers.
+
+    With processes=0 the initializer and all tasks run in the calling process;
+    the finalizer (if any) then runs on terminate to release their state.
+    """
+    def __init__(
+        self,
+        keys: Iterable[Hashable],
+        processes: int | None = None,
+        initializer: Callable | None = None,
+        initargs: tuple = (),
+        finalizer: Callable | None = None
+    ):
+        """
+        Args:
+            keys: Keys tasks are submitted with
+            processes: Number of worker processes (None = one per key, at most the CPU count)
+            initializer: Called with initargs in every worker when it starts
+            initargs: Arguments of the initializer
+            finalizer: Called on terminate in the calling process (processes=0 only)
+        """
+        keys = list(keys)
+        self.processes = min(len(keys), os.cpu_count() or 1) if processes is None else processes
+        self._worker_of = {key: i % self.processes for i, key in enumerate(keys)} if self.processes else {}
+        # One single-process pool per worker, so that a key always reaches the same process
+        self._pools = [
+            multiprocessing.Pool(processes=1, initializer=initializer, initargs=initargs)
+            for _ in range(self.processes)
+        ]
+        self._inline = not self._pools
+        self._closed = False
+        self._finalizer = finalizer if self._inline else None
+        if self._inline and initializer is not None:
+            initializer(*initargs)
+        logger.debug(f"Started {self.processes} sticky workers for {len(keys)} keys")
+
+    def apply_async(self, key: Hashable, func: Callable, args: tuple = ()):
+        """
+        Submits func(*args) to the worker of key; returns an object with get().
+        """
+        if self._closed:
+            raise RuntimeError("Sticky pool is closed")
+        if self._inline:
+            return _InlineResult(func(*args))
+        return self._pools[self._worker_of[key]].apply_async(func, args)
+
+    def terminate(self):
+        """
+        Stops all workers, discarding running tasks and their state.
+        """
+        for pool in self._pools:
+            pool.terminate()
+            pool.join()
+        self._pools = []
+        self._closed = True
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.terminate()
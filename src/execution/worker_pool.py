@@ -0,0 +1,166 @@
+import os
+import sys
+import time
+import importlib
+import multiprocessing
+from utils.logging_helper import get_logger
+
+logger = get_logger("worker_pool")
+
+# Modules every sweep worker needs. Importing pysat and building the encoder
+# modules dominates the start-up of a fresh worker, so they are loaded once in
+# the forkserver and inherited by every worker forked from it.
+DEFAULT_PRELOAD_MODULES = (
+    "pysat.formula",
+    "core.pysat_constructs",
+    "core.open_wbo_solver",
+    "encoding.SBMF_2021.definition_15",
+    "encoding.EUMAS_2025.implementation_guide.definition_1",
+    "algorithms.EUMAS_2025.implemenation_guide.algorithm_1",
+)
+
+def _warm_worker(preload_modules: tuple):
+    """
+    Pool initializer. Imports the preload modules in the worker (a no-op when they
+    were already inherited from the forkserver).
+    """
+    for module_name in preload_modules:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logger.warning(f"Worker {os.getpid()} could not preload {module_name}: {e}")
+
+def worker_status(preload_modules: tuple) -> dict:
+    """
+    Reports the PID of the worker that runs it and which preload modules it is missing.
+    """
+    return {
+        'pid': os.getpid(),
+        'missing_modules': [name for name in preload_modules if name not in sys.modules],
+    }
+
+class WarmWorkerPool:
+    """
+    Long-lived process pool that can be shared by many sweeps and scenarios.
+
+    Workers are started from a forkserver with the solver and encoder modules
+    preloaded, and each worker is replaced after max_tasks_per_child tasks to
+    bound memory growth from pysat's formula registry.
+    """
+    def __init__(
+        self,
+        processes: int | None = None,
+        max_tasks_per_child: int | None = 8,
+        preload_modules: tuple = DEFAULT_PRELOAD_MODULES,
+        start_method: str = "forkserver"
+    ):
+        """
+        Args:
+            processes: Number of worker processes (None = use CPU count)
+            max_tasks_per_child: Tasks after which a worker is recycled (None = never)
+            preload_modules: Modules imported once before workers are started
+            start_method: multiprocessing start method ("forkserver", "spawn" or "fork")
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child
+        self.preload_modules = tuple(preload_modules)
+        self.start_method = start_method
+        self.tasks_submitted = 0
+        self._context = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            self._context.set_forkserver_preload(list(self.preload_modules))
+        self._pool = None
+        self._start()
+
+    def _start(self):
+        start_time = time.time()
+        self._pool = self._context.Pool(
+            processes=self.processes,
+            initializer=_warm_worker,
+            initargs=(self.preload_modules,),
+            maxtasksperchild=self.max_tasks_per_child
+        )
+        logger.debug(f"Started {self.processes} {self.start_method} workers in {time.time() - start_time:.4f}s")
+
+    def apply_async(self, func, args=(), callback=None, error_callback=None):
+        """
+        Submits one task, see multiprocessing.pool.Pool.apply_async.
+        """
+        if self._pool is None:
+            raise RuntimeError("Worker pool is closed")
+        self.tasks_submitted += 1
+        return self._pool.apply_async(func, args, callback=callback, error_callback=error_callback)
+
+    def starmap(self, func, iterable) -> list:
+        """
+        Runs func for every argument tuple and returns the results in order.
+        """
+        if self._pool is None:
+            raise RuntimeError("Worker pool is closed")
+        tasks = list(iterable)
+        self.tasks_submitted += len(tasks)
+        return self._pool.starmap(func, tasks)
+
+    def health_check(self, timeout: float = 30.0) -> bool:
+        """
+        Checks that the pool completes tasks within timeout seconds and that its
+        workers are still warm (all preload modules imported).
+        """
+        if self._pool is None:
+            return False
+        try:
+            pending = [
+                self._pool.apply_async(worker_status, (self.preload_modules,))
+                for _ in range(self.processes)
+            ]
+            deadline = time.time() + timeout
+            for result in pending:
+                status = result.get(timeout=max(0.0, deadline - time.time()))
+                if status['missing_modules']:
+                    logger.warning(f"Worker {status['pid']} is missing modules {status['missing_modules']}")
+                    return False
+            return True
+        except Exception as e:
+            logger.warning(f"Worker pool health check failed: {e}")
+            return False
+
+    def ensure_healthy(self, timeout: float = 30.0):
+        """
+        Runs a health check and replaces all workers if it fails.
+        """
+        if not self.health_check(timeout):
+            logger.warning("Recycling unhealthy worker pool")
+            self.recycle()
+
+    def recycle(self):
+        """
+        Replaces all workers with fresh ones.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+        self._start()
+
+    def close(self):
+        """
+        Waits for submitted tasks to finish and shuts the workers down.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self):
+        """
+        Stops all workers immediately, discarding running tasks.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.terminate()
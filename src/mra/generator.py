@@ -0,0 +1,201 @@
+import os
+import sys
+import random
+import argparse
+from typing import Callable, Dict, List, Set, Tuple, Union
+
+from .agent import Agent
+from .problem import MRA
+
+# Demand of the agents: a constant, an inclusive (low, high) range drawn uniformly,
+# or a list of demands repeated over the agents (e.g. [2, 1] alternates).
+DemandSpec = Union[int, Tuple[int, int], List[int]]
+
+def h_demands(num_agents: int, demand: DemandSpec, rng: random.Random) -> List[int]:
+    if isinstance(demand, int):
+        return [demand] * num_agents
+    if isinstance(demand, tuple):
+        low, high = demand
+        return [rng.randint(low, high) for _ in range(num_agents)]
+    if not demand:
+        raise ValueError("Demand list must not be empty")
+    return [demand[i % len(demand)] for i in range(num_agents)]
+
+def h_build_mra(access: List[Set[int]], num_resources: int, demand: DemandSpec, rng: random.Random) -> MRA:
+    """
+    Builds the MRA from the access set of every agent. Demands are capped at the
+    size of the access set, so every agent can reach its goal on its own.
+    """
+    demands = h_demands(len(access), demand, rng)
+    return MRA(
+        agt=[Agent(id=i, d=min(d, len(acc)), acc=acc) for i, (d, acc) in enumerate(zip(demands, access), 1)],
+        res=set(range(1, num_resources + 1))
+    )
+
+def ring_mra(num_agents: int, access_degree: int = 2, demand: DemandSpec = 1, seed: int = 0) -> MRA:
+    """
+    Ring of num_agents agents and num_agents resources, in which agent i accesses
+    resources i, ..., i + access_degree - 1 (wrapping around), so neighbouring
+    agents contend for access_degree - 1 resources.
+    """
+    if not 1 <= access_degree <= num_agents:
+        raise ValueError("Access degree must be between 1 and the number of agents")
+    access = [{(i + j) % num_agents + 1 for j in range(access_degree)} for i in range(num_agents)]
+    return h_build_mra(access, num_agents, demand, random.Random(seed))
+
+def full_mra(num_agents: int, num_resources: int, demand: DemandSpec = 1, seed: int = 0) -> MRA:
+    """
+    Full contention: every agent accesses every resource.
+    """
+    access = [set(range(1, num_resources + 1)) for _ in range(num_agents)]
+    return h_build_mra(access, num_resources, demand, random.Random(seed))
+
+def random_mra(num_agents: int, num_resources: int, density: float = 0.5, demand: DemandSpec = 1, seed: int = 0) -> MRA:
+    """
+    Random bipartite access: every agent accesses round(density * num_resources)
+    resources (at least its demand), drawn uniformly with the given seed.
+    """
+    if not 0 <= density <= 1:
+        raise ValueError("Density must be between 0 and 1")
+    rng = random.Random(seed)
+    max_demand = demand if isinstance(demand, int) else max(demand)
+    degree = min(num_resources, max(max_demand, round(density * num_resources)))
+    access = [set(rng.sample(range(1, num_resources + 1), degree)) for _ in range(num_agents)]
+    return h_build_mra(access, num_resources, demand, rng)
+
+def articulation_chain_mra(
+    num_clusters: int,
+    agents_per_cluster: int = 2,
+    resources_per_cluster: int = 1,
+    demand: DemandSpec = 1,
+    seed: int = 0
+) -> MRA:
+    """
+    Chain of clusters joined by articulation resources: the agents of a cluster
+    access its resources_per_cluster private resources and the single resource
+    shared with each neighbouring cluster.
+    """
+    if num_clusters < 1 or agents_per_cluster < 1 or resources_per_cluster < 0:
+        raise ValueError("A chain needs at least one cluster with at least one agent")
+    cluster_size = resources_per_cluster + 1
+    num_resources = num_clusters * cluster_size - 1
+
+    access = []
+    for c in range(num_clusters):
+        # Cluster c owns resources c * cluster_size + 1 ..., followed by the
+        # articulation resource it shares with cluster c + 1.
+        first = c * cluster_size + 1
+        cluster_access = set(range(first, first + resources_per_cluster))
+        if c > 0:
+            cluster_access.add(first - 1)
+        if c < num_clusters - 1:
+            cluster_access.add(first + resources_per_cluster)
+        access.extend(set(cluster_access) for _ in range(agents_per_cluster))
+    return h_build_mra(access, num_resources, demand, random.Random(seed))
+
+def separable_mra(
+    num_clusters: int,
+    agents_per_cluster: int = 2,
+    resources_per_cluster: int = 3,
+    demand: DemandSpec = 1,
+    seed: int = 0
+) -> MRA:
+    """
+    Disjoint clusters: the agents of a cluster access all resources of their own
+    cluster and nothing else, so the problem separates into independent parts.
+    """
+    access = [
+        set(range(c * resources_per_cluster + 1, (c + 1) * resources_per_cluster + 1))
+        for c in range(num_clusters)
+        for _ in range(agents_per_cluster)
+    ]
+    return h_build_mra(access, num_clusters * resources_per_cluster, demand, random.Random(seed))
+
+# Family name -> generator, mirroring the legacy test families.
+FAMILIES: Dict[str, Callable[..., MRA]] = {
+    "ring": ring_mra,
+    "full": full_mra,
+    "random": random_mra,
+    "articulation": articulation_chain_mra,
+    "separable": separable_mra,
+}
+
+def generate_mra(family: str, **params) -> MRA:
+    """
+    Generates an MRA of the given family (see FAMILIES) from its parameters.
+    """
+    if family not in FAMILIES:
+        raise ValueError(f"Unknown family '{family}', expected one of {', '.join(FAMILIES)}")
+    return FAMILIES[family](**params)
+
+def write_scenario(family: str, params: dict, k_start: int, k_end: int, file_path: str) -> MRA:
+    """
+    Generates an MRA and writes it as a YAML scenario with the loop-size range
+    k_start..k_end.
+
+    Returns:
+        The generated MRA
+    """
+    from utils.yaml_parser import write_mra_to_yaml
+
+    mra = generate_mra(family, **params)
+    write_mra_to_yaml(mra, k_start, k_end, file_path)
+    return mra
+
+def main(argv: list | None = None):
+    parser = argparse.ArgumentParser(description="Generate synthetic MRA scenarios as YAML files.")
+    parser.add_argument("family", choices=list(FAMILIES), help="Scenario family")
+    parser.add_argument("--agents", type=int, default=4, help="Number of agents (ring, full, random)")
+    parser.add_argument("--resources", type=int, default=4, help="Number of resources (full, random)")
+    parser.add_argument("--access_degree", type=int, default=2, help="Resources per agent (ring)")
+    parser.add_argument("--density", type=float, default=0.5, help="Fraction of resources per agent (random)")
+    parser.add_argument("--clusters", type=int, default=2, help="Number of clusters (articulation, separable)")
+    parser.add_argument("--agents_per_cluster", type=int, default=2, help="Agents per cluster (articulation, separable)")
+    parser.add_argument("--resources_per_cluster", type=int, default=None, help="Private resources per cluster (articulation: 1, separable: 3)")
+    parser.add_argument(
+        "--demand",
+        default="1",
+        help="Demand: a constant (2), an inclusive range drawn per agent (1:3) or a list repeated over the agents (2,1)"
+    )
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0], help="One scenario is written per seed")
+    parser.add_argument("--k_start", type=int, default=1, help="Smallest loop size of the scenarios")
+    parser.add_argument("--k_end", type=int, default=5, help="Largest loop size of the scenarios")
+    parser.add_argument("--output_dir", default=".", help="Directory for the generated scenarios")
+    args = parser.parse_args(argv)
+
+    if ":" in args.demand:
+        low, high = args.demand.split(":")
+        demand = (int(low), int(high))
+    elif "," in args.demand:
+        demand = [int(d) for d in args.demand.split(",")]
+    else:
+        demand = int(args.demand)
+
+    if args.family == "ring":
+        params = {'num_agents': args.agents, 'access_degree': args.access_degree}
+        name = f"ring_a{args.agents}_d{args.access_degree}"
+    elif args.family == "full":
+        params = {'num_agents': args.agents, 'num_resources': args.resources}
+        name = f"full_a{args.agents}_r{args.resources}"
+    elif args.family == "random":
+        params = {'num_agents': args.agents, 'num_resources': args.resources, 'density': args.density}
+        name = f"random_a{args.agents}_r{args.resources}_p{args.density:g}"
+    else:
+        params = {'num_clusters': args.clusters, 'agents_per_cluster': args.agents_per_cluster}
+        if args.resources_per_cluster is not None:
+            params['resources_per_cluster'] = args.resources_per_cluster
+        name = f"{args.family}_c{args.clusters}_a{args.agents_per_cluster}"
+        if args.resources_per_cluster is not None:
+            name += f"_r{args.resources_per_cluster}"
+
+    name += "_dem" + args.demand.replace(":", "-").replace(",", "+")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for seed in args.seeds:
+        file_path = os.path.join(args.output_dir, f"{name}_s{seed}.yml")
+        write_scenario(args.family, dict(params, demand=demand, seed=seed), args.k_start, args.k_end, file_path)
+        print(file_path)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+from .problem import MRA
+from .strategy import StrategyProfile
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, see [project.optional-dependencies] simulation
+    np = None
+
+# Simulator of the evolution of an MRA (SBMF 2021 Def 13) under strategy profiles.
+#
+# A state is an int array of resource owners: state[r - 1] is the ID of the agent
+# holding resource r (0 = a0, unassigned). A joint action is an int array of
+# action codes (SBMF 2021 Def 20: 0 = idle, 1 = relall, 2r = req<r>, 2r+1 = rel<r>)
+# with one entry per agent in ascending ID order. Batches add a leading axis.
+#
+# One step resolves every resource r independently:
+#   - exactly one agent with access requests r          -> the requester gets r
+#   - two or more agents request r                      -> r keeps its owner (a0 under the protocol)
+#   - the owner performs rel<r> or relall               -> r becomes unassigned
+#   - otherwise                                         -> r keeps its owner
+# Under the protocol (Def 15) requests only happen for unassigned resources and
+# releases only by the owner, which makes these rules coincide with Def 13.
+# Undecided strategy entries (see mra.strategy) act as idle.
+
+def h_require_numpy():
+    if np is None:
+        raise ImportError("The MRA simulator requires numpy (uv pip install -e \".[simulation]\")")
+
+@dataclass
+class Rollout:
+    """
+    Result of Simulator.rollout for a batch of B trajectories.
+
+    states[t, b] is the state of trajectory b at step t. Trajectory b first
+    revisits a state at step loop_start[b] + loop_size[b] (it equals the state at
+    loop_start[b]); both are -1 if it did not loop within the simulated steps.
+    A loop in the sense of EUMAS 2025 Def 2.2 has loop_start 0.
+    """
+    states: "np.ndarray"      # (T, B, R)
+    goals: "np.ndarray"       # (T, B, A) goal flags of the agents
+    loop_start: "np.ndarray"  # (B,)
+    loop_size: "np.ndarray"   # (B,)
+
+    @property
+    def looped(self) -> "np.ndarray":
+        return self.loop_size > 0
+
+    def payoff(self) -> "np.ndarray":
+        """
+        Goal frequency of every trajectory: goal states of all agents in the loop
+        divided by the loop size (NaN without a loop).
+        """
+        steps = np.arange(self.states.shape[0])[:, None]
+        in_loop = (steps >= self.loop_start) & (steps < self.loop_start + self.loop_size) & self.looped
+        goal_count = (self.goals.sum(axis=2) * in_loop).sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.looped, goal_count / np.maximum(self.loop_size, 1), np.nan)
+
+class Simulator:
+    """
+    Vectorised simulator of the MRA evolution. Resources are assumed to be
+    numbered 1..|Res|, as in the encoding.
+    """
+    def __init__(self, mra_problem: MRA, profiles: StrategyProfile | Sequence[StrategyProfile] | None = None):
+        h_require_numpy()
+        self.mra_problem = mra_problem
+        agents = sorted(mra_problem.agt, key=lambda a: a.id)
+        self.num_resources = mra_problem.num_resources()
+        self.agent_ids = np.array([a.id for a in agents], dtype=np.int64)
+        self.demand = np.array([a.d for a in agents], dtype=np.int64)
+        # access[a, r - 1]: agent a (by position) can access resource r
+        self.access = np.zeros((len(agents), self.num_resources), dtype=bool)
+        for i, agent in enumerate(agents):
+            for r in agent.acc:
+                self.access[i, r - 1] = True
+        # Agent ID -> position (-1 for a0)
+        self.agent_index = np.full(int(self.agent_ids.max(initial=0)) + 1, -1, dtype=np.int64)
+        self.agent_index[self.agent_ids] = np.arange(len(agents))
+        resources = np.arange(1, self.num_resources + 1)
+        self._req_codes = 2 * resources
+        self._rel_codes = 2 * resources + 1
+
+        self._policies = []
+        if profiles is not None:
+            self.set_profiles(profiles)
+
+    def set_profiles(self, profiles: StrategyProfile | Sequence[StrategyProfile]):
+        """
+        Compiles one or several strategy profiles into per-agent lookup arrays.
+        """
+        if isinstance(profiles, StrategyProfile):
+            profiles = [profiles]
+        self._policies = []
+        for agent_id in self.agent_ids.tolist():
+            tables = [profile.tables[agent_id] for profile in profiles]
+            first = tables[0]
+            # digits[i][owner]: position of owner among the possible owners of acc[i] (-1 = unobservable)
+            digits = []
+            for owners in first.owners:
+                lookup = np.full(len(self.agent_index), -1, dtype=np.int64)
+                lookup[owners] = np.arange(len(owners))
+                digits.append(lookup)
+            actions = np.stack([np.asarray(table.actions, dtype=np.int64) for table in tables])
+            self._policies.append((np.array(first.acc, dtype=np.int64) - 1, digits, np.array(first.strides, dtype=np.int64), actions))
+
+    @property
+    def num_profiles(self) -> int:
+        return self._policies[0][3].shape[0] if self._policies else 0
+
+    def initial_states(self, batch_size: int = 1) -> "np.ndarray":
+        """
+        Batch of initial states with every resource unassigned (SBMF 2021 Def 12).
+        """
+        return np.zeros((batch_size, self.num_resources), dtype=np.int64)
+
+    def joint_actions(self, states, profile_index=0) -> "np.ndarray":
+        """
+        Action codes of all agents in a batch of states, each under the profile
+        given by profile_index (an int or one index per state).
+        """
+        states = np.asarray(states, dtype=np.int64)
+        profile_index = np.broadcast_to(np.asarray(profile_index, dtype=np.int64), states.shape[:1])
+        actions = np.empty((states.shape[0], len(self.agent_ids)), dtype=np.int64)
+        for i, (acc, digits, strides, table) in enumerate(self._policies):
+            index = np.zeros(states.shape[0], dtype=np.int64)
+            for r, lookup, stride in zip(acc, digits, strides):
+                digit = lookup[states[:, r]]
+                if (digit < 0).any():
+                    raise ValueError(f"Agent {self.agent_ids[i]} cannot observe the owner of resource {r + 1}")
+                index += digit * stride
+            actions[:, i] = table[profile_index, index]
+        return actions
+
+    def step(self, states, actions) -> "np.ndarray":
+        """
+        Successor states of a batch of states (B, R) under joint actions (B, A).
+        """
+        states = np.asarray(states, dtype=np.int64)
+        actions = np.asarray(actions, dtype=np.int64)
+
+        # requests[b, a, r]: agent a requests resource r + 1 (only with access)
+        requests = (actions[:, :, None] == self._req_codes[None, None, :]) & self.access[None]
+        num_requests = requests.sum(axis=1)
+        requester = self.agent_ids[requests.argmax(axis=1)]
+
+        owner_index = self.agent_index[states]
+        owner_action = np.take_along_axis(actions, np.maximum(owner_index, 0), axis=1)
+        released = (owner_index >= 0) & ((owner_action == self._rel_codes[None, :]) | (owner_action == 1))
+
+        kept = np.where(released, 0, states)
+        return np.where(num_requests == 1, requester, kept)
+
+    def goals(self, states) -> "np.ndarray":
+        """
+        Goal flags (..., A) of the agents in states (..., R): an agent holds at
+        least its demand (SBMF 2021 Def 19). Agents with demand 0 are always in
+        their goal, agents demanding more than they can access never are.
+        """
+        states = np.asarray(states, dtype=np.int64)
+        held = ((states[..., None, :] == self.agent_ids[:, None]) & self.access).sum(axis=-1)
+        return (held >= self.demand) & (self.demand <= self.access.sum(axis=1))
+
+    def rollout(self, initial_states=None, profile_index=0, max_steps: int = 1000) -> Rollout:
+        """
+        Executes the compiled strategy profiles from a batch of initial states
+        until every trajectory revisits a state, or for at most max_steps steps.
+
+        Args:
+            initial_states: Batch of states (B, R) (None = one all-unassigned state)
+            profile_index: Profile of every trajectory (an int or one index per trajectory)
+            max_steps: Maximum number of steps
+
+        Returns:
+            Rollout with the visited states, goal flags and detected loops
+        """
+        if not self._policies:
+            raise ValueError("No strategy profile to execute, see set_profiles")
+        states = self.initial_states() if initial_states is None else np.array(initial_states, dtype=np.int64, ndmin=2)
+        batch = states.shape[0]
+        profile_index = np.broadcast_to(np.asarray(profile_index, dtype=np.int64), (batch,))
+        # States are compared as mixed-radix keys over the owners (with a tuple fallback for huge MRAs)
+        radix = len(self.agent_index)
+        use_keys = self.num_resources * np.log2(max(radix, 2)) < 62
+        weights = radix ** np.arange(self.num_resources, dtype=np.int64) if use_keys else None
+
+        history = [states]
+        keys = [states @ weights] if use_keys else None
+        loop_start = np.full(batch, -1, dtype=np.int64)
+        loop_size = np.full(batch, -1, dtype=np.int64)
+        for t in range(1, max_steps + 1):
+            states = self.step(states, self.joint_actions(states, profile_index))
+            history.append(states)
+            open_ = loop_size < 0
+            if use_keys:
+                key = states @ weights
+                matches = np.stack(keys) == key
+                keys.append(key)
+            else:
+                matches = np.stack([(previous == states).all(axis=1) for previous in history[:-1]])
+            found = open_ & matches.any(axis=0)
+            if found.any():
+                first = matches.argmax(axis=0)
+                loop_start[found] = first[found]
+                loop_size[found] = t - first[found]
+            if (loop_size >= 0).all():
+                break
+
+        all_states = np.stack(history)
+        return Rollout(all_states, self.goals(all_states), loop_start, loop_size)
+
+    def replay(self, resource_owners, actions) -> list[int]:
+        """
+        Checks a trace (e.g. the resource_owners and actions of a DecodedModel)
+        against the evolution: returns the steps t whose state at t + 1 differs
+        from the simulated successor of the state and actions at t.
+        """
+        resource_owners = np.asarray(resource_owners, dtype=np.int64)
+        actions = np.asarray(actions, dtype=np.int64)
+        successors = self.step(resource_owners[:-1], actions[:-1])
+        return np.flatnonzero((successors != resource_owners[1:]).any(axis=1)).tolist()
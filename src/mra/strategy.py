@@ -0,0 +1,137 @@
+import json
+from array import array
+from dataclasses import dataclass, field
+from typing import Mapping, Sequence
+
+from .agent import Agent
+from .problem import MRA
+
+# Action code of an observation the model does not decide
+UNDECIDED = -1
+
+def action_name(code: int) -> str:
+    """
+    Name of an action code (SBMF 2021 Def 20): 0 = idle, 1 = relall, 2r = req<r>, 2r+1 = rel<r>.
+    """
+    if code == 0:
+        return "idle"
+    if code == 1:
+        return "relall"
+    if code >= 2:
+        return f"req{code // 2}" if code % 2 == 0 else f"rel{code // 2}"
+    return "undecided"
+
+def h_possible_owners(resource: int, agents: list[Agent]) -> list[int]:
+    # Owners an agent can observe for a resource: a0 (unassigned) and every agent with access
+    return [0] + sorted(agent.id for agent in agents if resource in agent.acc)
+
+@dataclass
+class StrategyTable:
+    """
+    Strategy of one agent as a dense table of action codes (see action_name).
+
+    Observations are indexed in mixed radix over the sorted Acc(a): digit i is
+    the position of the owner of acc[i] in owners[i], and the last resource
+    varies fastest. actions[index] is the action code of that observation, or
+    UNDECIDED.
+    """
+    agent_id: int
+    acc: list[int]
+    owners: list[list[int]]
+    actions: array = field(default_factory=lambda: array('h'))
+
+    def __post_init__(self):
+        self._digits = [{owner: digit for digit, owner in enumerate(owners)} for owners in self.owners]
+        self._strides = [1] * len(self.acc)
+        for i in range(len(self.acc) - 2, -1, -1):
+            self._strides[i] = self._strides[i + 1] * len(self.owners[i + 1])
+        num_observations = self._strides[0] * len(self.owners[0]) if self.acc else 1
+        if not self.actions:
+            self.actions = array('h', [UNDECIDED]) * num_observations
+        elif len(self.actions) != num_observations:
+            raise ValueError(f"Agent {self.agent_id}: expected {num_observations} actions, got {len(self.actions)}")
+
+    @classmethod
+    def for_agent(cls, agent: Agent, mra_problem: MRA) -> "StrategyTable":
+        """
+        Table of agent with every observation UNDECIDED.
+        """
+        acc = sorted(agent.acc)
+        return cls(agent.id, acc, [h_possible_owners(r, mra_problem.agt) for r in acc])
+
+    @property
+    def strides(self) -> list[int]:
+        return list(self._strides)
+
+    @property
+    def num_observations(self) -> int:
+        return len(self.actions)
+
+    def index(self, observation: Mapping[int, int] | Sequence[int]) -> int:
+        """
+        Index of an observation, given as resource -> owner or as the owners in acc order.
+        """
+        if isinstance(observation, Mapping):
+            observation = [observation[r] for r in self.acc]
+        index = 0
+        for digits, stride, owner in zip(self._digits, self._strides, observation):
+            try:
+                index += digits[owner] * stride
+            except KeyError:
+                raise ValueError(f"Agent {self.agent_id} cannot observe owner {owner}") from None
+        return index
+
+    def observation(self, index: int) -> tuple[int, ...]:
+        """
+        Owners in acc order of the observation with the given index.
+        """
+        return tuple(owners[(index // stride) % len(owners)] for owners, stride in zip(self.owners, self._strides))
+
+    def observe(self, resource_owners: Sequence[int]) -> int:
+        """
+        Index of the observation of a full state, given as the owner of every resource r at resource_owners[r - 1].
+        """
+        index = 0
+        for r, digits, stride in zip(self.acc, self._digits, self._strides):
+            index += digits[resource_owners[r - 1]] * stride
+        return index
+
+    def decide(self, observation: Mapping[int, int] | Sequence[int]) -> int:
+        return self.actions[self.index(observation)]
+
+    def to_dict(self) -> dict:
+        return {'agent_id': self.agent_id, 'acc': self.acc, 'owners': self.owners, 'actions': self.actions.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StrategyTable":
+        return cls(data['agent_id'], data['acc'], data['owners'], array('h', data['actions']))
+
+@dataclass
+class StrategyProfile:
+    """
+    Strategy tables of all agents, by agent ID.
+    """
+    tables: dict[int, StrategyTable] = field(default_factory=dict)
+
+    @classmethod
+    def for_mra(cls, mra_problem: MRA) -> "StrategyProfile":
+        return cls({agent.id: StrategyTable.for_agent(agent, mra_problem) for agent in sorted(mra_problem.agt, key=lambda a: a.id)})
+
+    def decide(self, agent_id: int, observation: Mapping[int, int] | Sequence[int]) -> int:
+        return self.tables[agent_id].decide(observation)
+
+    def joint_action(self, resource_owners: Sequence[int]) -> list[int]:
+        """
+        Action codes of all agents (by ascending ID) in a full state (see StrategyTable.observe).
+        """
+        return [table.actions[table.observe(resource_owners)] for table in self.tables.values()]
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump({'agents': [table.to_dict() for table in self.tables.values()]}, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> "StrategyProfile":
+        with open(path) as f:
+            data = json.load(f)
+        return cls({table['agent_id']: StrategyTable.from_dict(table) for table in data['agents']})
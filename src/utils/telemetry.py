@@ -0,0 +1,142 @@
+import os
+import sys
+import json
+import time
+import argparse
+import contextvars
+from contextlib import contextmanager
+
+# Structured telemetry: one JSON object per line and event, e.g.
+#
+#   {"ts": 1760880000.12, "pid": 4711, "event": "phase", "phase": "solve",
+#    "scenario_hash": "3f2a...", "k": 5, "duration": 0.42, "status": "success", "cost": 909}
+#
+# The sink is a file path, "stdout" or "stderr", taken from SATMAS_TELEMETRY or
+# set with configure_telemetry (which also exports it to the environment, so
+# worker processes write to the same sink). File sinks are opened in append mode
+# and every event is written with a single write call, so events of concurrent
+# processes do not interleave. Without a sink, events are dropped.
+TELEMETRY_ENV = "SATMAS_TELEMETRY"
+
+# Fields added to every event of the current run (e.g. scenario hash and k).
+_context = contextvars.ContextVar("telemetry_context", default={})
+
+_sink = None
+_sink_fd = None
+_sink_pid = None
+
+def configure_telemetry(sink: str | None):
+    """
+    Sets the telemetry sink for this process and the processes it starts.
+
+    Args:
+        sink: File path, "stdout", "stderr", or None to turn telemetry off
+    """
+    global _sink, _sink_fd, _sink_pid
+    if _sink_fd is not None and _sink_pid == os.getpid():
+        os.close(_sink_fd)
+    _sink, _sink_fd, _sink_pid = sink, None, None
+    if sink:
+        os.environ[TELEMETRY_ENV] = sink
+    else:
+        os.environ.pop(TELEMETRY_ENV, None)
+
+def telemetry_enabled() -> bool:
+    return bool(_sink if _sink is not None else os.environ.get(TELEMETRY_ENV))
+
+def _write_line(line: str):
+    global _sink, _sink_fd, _sink_pid
+    if _sink is None:
+        _sink = os.environ.get(TELEMETRY_ENV, "")
+    if _sink == "stdout":
+        sys.stdout.write(line)
+        sys.stdout.flush()
+    elif _sink == "stderr":
+        sys.stderr.write(line)
+        sys.stderr.flush()
+    elif _sink:
+        # Reopen after a fork, so every process appends through its own descriptor.
+        if _sink_fd is None or _sink_pid != os.getpid():
+            _sink_fd = os.open(_sink, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            _sink_pid = os.getpid()
+        os.write(_sink_fd, line.encode())
+
+def emit(event: str, **fields):
+    """
+    Writes one event with the current context fields to the sink.
+    """
+    if not telemetry_enabled():
+        return
+    record = {'ts': time.time(), 'pid': os.getpid(), 'event': event, **_context.get(), **fields}
+    _write_line(json.dumps(record, default=str) + "\n")
+
+@contextmanager
+def telemetry_context(**fields):
+    """
+    Adds fields (e.g. scenario_hash and k) to every event emitted inside the block.
+    """
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+@contextmanager
+def phase(name: str, **fields):
+    """
+    Times a phase (encode, clausify, write, solve, parse, interpret) and emits it
+    as a "phase" event. The block can add fields to the yielded dictionary, e.g.
+    the clause count once it is known.
+    """
+    extra = dict(fields)
+    start_time = time.perf_counter()
+    try:
+        yield extra
+    finally:
+        emit("phase", phase=name, duration=time.perf_counter() - start_time, **extra)
+
+def read_events(path: str) -> list:
+    """
+    Reads a JSON-lines telemetry file, skipping incomplete lines.
+    """
+    events = []
+    with open(path) as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return events
+
+def summarise_phases(events: list) -> dict:
+    """
+    Aggregates the phase events per phase.
+
+    Returns:
+        Dictionary mapping each phase to its count, total, mean and maximum duration
+    """
+    summary = {}
+    for event in events:
+        if event.get('event') != 'phase':
+            continue
+        entry = summary.setdefault(event['phase'], {'count': 0, 'total': 0.0, 'max': 0.0})
+        entry['count'] += 1
+        entry['total'] += event['duration']
+        entry['max'] = max(entry['max'], event['duration'])
+    for entry in summary.values():
+        entry['mean'] = entry['total'] / entry['count']
+    return summary
+
+def main(argv: list | None = None):
+    parser = argparse.ArgumentParser(description="Summarise a JSON-lines telemetry file per phase.")
+    parser.add_argument("path", help="Telemetry file")
+    args = parser.parse_args(argv)
+
+    summary = summarise_phases(read_events(args.path))
+    print(f"{'phase':<12} {'count':>7} {'total [s]':>10} {'mean [s]':>10} {'max [s]':>10}")
+    for name, entry in sorted(summary.items(), key=lambda item: -item[1]['total']):
+        print(f"{name:<12} {entry['count']:>7} {entry['total']:>10.3f} {entry['mean']:>10.4f} {entry['max']:>10.4f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -67,4 +67,69 @@ def parse_mra_from_yaml(file_path: str) -> Tuple[MRA, int, int]:
     
     mra_problem = MRA(agt=agents_list, res=resource_set)
     
-    return mra_problem, k_start, k_end
\ No newline at end of file
+    return mra_problem, k_start, k_end
+
+def parse_legacy_mra_from_yaml(file_path: str) -> Tuple[MRA, int]:
+    """
+    Parses an MRA problem definition in the format of the legacy implementation
+    (__legacy/implementation/test), where agents and resources are lists of names
+    and every agent has a top-level entry with its demand and access.
+
+    Args:
+        file_path: Path to the YAML file.
+
+    Returns:
+        A tuple containing the MRA object and the legacy time bound k.
+    """
+    with open(file_path, 'r') as f:
+        data = yaml.safe_load(f)
+
+    if not isinstance(data.get('k'), int):
+        raise ValueError("Missing or invalid 'k' field in legacy YAML file, expected an integer")
+
+    # The legacy implementation derived the resources from the access lists, so
+    # only accessed resources are kept (numbered in the order of the resource list).
+    accessed_names = [
+        str(r_name).strip()
+        for agent_name in data.get('agents', [])
+        for r_name in (data.get(agent_name) or {}).get('access', [])
+    ]
+    resource_name_to_id: Dict[str, int] = {}
+    for r_name in [str(r_name).strip() for r_name in data.get('resources', [])] + accessed_names:
+        if r_name in accessed_names:
+            resource_name_to_id.setdefault(r_name, len(resource_name_to_id) + 1)
+
+    agents_list: List[Agent] = []
+    for i, agent_name in enumerate(data.get('agents', []), 1):
+        agent_data = data.get(agent_name)
+        if not isinstance(agent_data, dict):
+            raise ValueError(f"Missing definition of agent '{agent_name}'")
+        access_resource_ids = {resource_name_to_id[str(r_name).strip()] for r_name in agent_data.get('access', [])}
+        agents_list.append(Agent(id=i, d=agent_data['demand'], acc=access_resource_ids))
+
+    return MRA(agt=agents_list, res=set(resource_name_to_id.values())), data['k']
+
+def write_mra_to_yaml(mra: MRA, k_start: int, k_end: int, file_path: str):
+    """
+    Writes an MRA problem definition in the format read by parse_mra_from_yaml.
+
+    Args:
+        mra: The MRA problem instance.
+        k_start: The start of time horizon k (inclusive).
+        k_end: The end of time horizon k (inclusive).
+        file_path: Path to the YAML file.
+    """
+    data = {
+        'k': {'start': k_start, 'end': k_end},
+        'resources': [f"r{r}" for r in sorted(mra.res)],
+        'agents': [
+            {
+                'id': f"a{agent.id}",
+                'demand': agent.d,
+                'access': [f"r{r}" for r in sorted(agent.acc)],
+            }
+            for agent in sorted(mra.agt, key=lambda a: a.id)
+        ],
+    }
+    with open(file_path, 'w') as f:
+        yaml.safe_dump(data, f, sort_keys=False, default_flow_style=None)
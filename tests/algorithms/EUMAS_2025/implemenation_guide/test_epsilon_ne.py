@@ -0,0 +1,93 @@
+import math
+from array import array
+from fractions import Fraction
+
+from mra.agent import Agent
+from mra.generator import ring_mra
+from mra.problem import MRA
+from mra.strategy import UNDECIDED, StrategyProfile
+from algorithms.EUMAS_2025.implemenation_guide.epsilon_ne import (
+    PartitionSolver,
+    articulation_points,
+    contention_graph,
+    find_epsilon_ne,
+    lift_table,
+    partition_agents,
+    split_agent,
+    sub_problem,
+    update_weights,
+    weight_map,
+)
+from algorithms.EUMAS_2025.implemenation_guide import epsilon_ne
+from algorithms.EUMAS_2025.implemenation_guide.strategy_verification import StrategyVerifier
+
+def h_path_mra(num_agents: int) -> MRA:
+    # Agent i accesses resources i and i + 1, so the agents form a path
+    return MRA(
+        agt=[Agent(id=i, d=1, acc={i, i + 1} if i < num_agents else {i}) for i in range(1, num_agents + 1)],
+        res=set(range(1, num_agents + 1))
+    )
+
+def test_partition_at_articulation_agents():
+    graph = contention_graph(h_path_mra(5))
+    assert graph[2].neighbours == {1, 3} and graph[2].num_common == 2 and graph[2].denominator == 2
+    assert articulation_points(graph, set(graph)) == {2, 3, 4}
+    assert split_agent(graph, set(graph)) == 3
+    assert partition_agents(graph) == [[1, 2, 3], [3, 4, 5]]
+
+    # Without articulation points the most central agent (ties: smallest ID) splits
+    ring = contention_graph(ring_mra(4))
+    assert articulation_points(ring, set(ring)) == set()
+    assert split_agent(ring, set(ring)) == 1
+
+def test_weights():
+    assert weight_map(contention_graph(h_path_mra(3))) == {1: 2, 2: 2, 3: 2}
+    assert update_weights({1: 1.0, 2: 2.0, 3: math.inf}) == {1: 25, 2: 50, 3: 75}
+    assert update_weights({1: 1.0, 2: 1.0}) == {1: 1, 2: 1}
+
+def test_lift_table():
+    mra = h_path_mra(3)
+    sub = sub_problem(mra, [2, 3])
+    assert sub.resource_ids == [2, 3] and sub.mra.agt[0].acc == {1, 2}
+
+    sub_table = StrategyProfile.for_mra(sub.mra).tables[1]
+    sub_table.actions = array('h', [4]) * sub_table.num_observations    # req2 of the sub-problem
+    table = StrategyProfile.for_mra(mra).tables[2]
+    lift_table(sub, sub_table, table)
+    assert table.decide({2: 0, 3: 0}) == 6                              # req3 of the full MRA
+    assert table.decide({2: 1, 3: 0}) == UNDECIDED                      # agent 1 is outside the part
+
+def test_partition_profile_is_liftable():
+    # 4 resources: the action bits encode codes up to 15, of which only 0..9 are
+    # actions; observations off the loop must not keep the others
+    mra = MRA(
+        agt=[Agent(id=i, d=1, acc={i, i % 4 + 1}) for i in range(1, 5)] + [Agent(id=5, d=1, acc={1, 3})],
+        res={1, 2, 3, 4}
+    )
+    sub = sub_problem(mra, [1, 2, 3, 4, 5])
+    _, _, sub_profile = PartitionSolver(sub, 4).solve({agent_id: 1 for agent_id in sub.agent_ids})
+    profile = StrategyProfile.for_mra(mra)
+    for i, agent_id in enumerate(sub.agent_ids):
+        lift_table(sub, sub_profile.tables[i + 1], profile.tables[agent_id])
+    for agent in mra.agt:
+        for action in profile.tables[agent.id].actions:
+            assert action in (0, 1) or action // 2 in agent.acc
+
+def test_find_epsilon_ne():
+    mra = h_path_mra(3)
+    result = find_epsilon_ne(mra, 3, num_processes=0, min_size=1)
+    assert result.partitions == [[1, 2], [2, 3]]
+    assert result.epsilon == max(result.fractions.values()) >= 1
+
+    # The fractions are the best-response payoffs over the payoffs of the profile
+    with StrategyVerifier(mra, 3) as verifier:
+        for agent_id, payoff in result.payoffs.items():
+            response = verifier.max_payoff(result.profile, agents=[agent_id], free_agents=[agent_id])
+            assert float(Fraction(response.goal_count, response.loop_size) / payoff) == result.fractions[agent_id]
+
+def test_find_epsilon_ne_keeps_first_profile_with_infinite_epsilon(monkeypatch):
+    # As if an agent without payoff had a positive best response in every iteration
+    monkeypatch.setattr(epsilon_ne, "h_fraction", lambda response, payoff: math.inf)
+    result = find_epsilon_ne(h_path_mra(3), 3, num_processes=0, min_size=1)
+    assert result.epsilon == math.inf
+    assert result.profile is not None and result.iterations == 1
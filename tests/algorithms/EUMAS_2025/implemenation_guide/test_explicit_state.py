@@ -0,0 +1,99 @@
+import os
+
+from pysat.examples.rc2 import RC2
+from pysat.formula import And
+
+from core.encoding_context import EncodingContext
+from core.pysat_constructs import Atom
+from core.model_interpreter import ModelInterpreter
+from core.variable_index import load_variable_index
+from mra.agent import Agent
+from mra.problem import MRA
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import enrich_formula_f_agt_infinity_with_maxbound_soft_clauses
+from algorithms.EUMAS_2025.implemenation_guide.explicit_state import (
+    ExplicitStateSearch,
+    ExplicitStateTimeout,
+    cross_check,
+    estimate_state_count,
+    explicit_state_sweep
+)
+
+def h_solve_cost(mra: MRA, k: int, maxbound: int):
+    with EncodingContext() as context, context.active():
+        wcnf = enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(
+            And(encode_formula_f_agt_infinity_hard_clauses(mra, k), Atom(f"loopSize_{k}")),
+            mra,
+            k,
+            maxbound
+        )
+    with RC2(wcnf) as rc2:
+        return rc2.cost if rc2.compute() is not None else None
+
+def test_estimate_state_count():
+    mra = MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+    assert estimate_state_count(mra) == 2 * 3
+    # a1 (d = 1) cannot hold both resources at the start of a loop
+    assert ExplicitStateSearch(mra).initial_states() == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 2)]
+
+def test_explicit_state_matches_maxsat(tmp_path):
+    scenarios = [
+        MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2}),
+        MRA(agt=[Agent(id=1, d=2, acc={1, 2}), Agent(id=2, d=2, acc={1, 2})], res={1, 2}),
+        MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=2, acc={2, 3}), Agent(id=3, d=1, acc={1, 3})], res={1, 2, 3}),
+        # Demand above |Acc(a)|: a2 never reaches its goal
+        MRA(agt=[Agent(id=1, d=1, acc={1}), Agent(id=2, d=3, acc={1, 2})], res={1, 2}),
+    ]
+    for i, mra in enumerate(scenarios):
+        results = explicit_state_sweep(range(0, 5), mra, 4, cache_root=str(tmp_path / str(i)))
+        assert [result['cost'] for result in results] == [h_solve_cost(mra, k, 4) for k in range(0, 5)]
+
+def test_explicit_state_model_is_interpretable(tmp_path):
+    mra = MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+    result, = explicit_state_sweep([2], mra, 2, cache_root=str(tmp_path))
+    assert result['status'] == 'success' and result['engine'] == 'explicit'
+
+    cache_dir, = [os.path.join(root, name) for root, dirs, _ in os.walk(tmp_path) for name in dirs if name == "k_2_mb2"]
+    interpreter = ModelInterpreter(result['model'], load_variable_index(cache_dir), mra)
+
+    assert interpreter.loop_size == 2 and interpreter.calculate_payoff() == 1.0
+    assert interpreter.decoded.resource_owners[2] == interpreter.decoded.resource_owners[0]
+    profile = interpreter.extract_strategies()
+    for t in range(2):
+        assert profile.joint_action(interpreter.decoded.resource_owners[t]) == interpreter.decoded.actions[t]
+
+def test_cross_check_reports_differences():
+    explicit = [{'k': 1, 'status': 'success', 'cost': 4}, {'k': 2, 'status': 'no solution (UNSAT)', 'cost': None}]
+    sat = [{'k': 1, 'status': 'success', 'cost': 4, 'error': False}, {'k': 2, 'status': 'success', 'cost': 7, 'error': False}]
+    mismatches = cross_check(explicit, sat)
+    assert len(mismatches) == 1 and mismatches[0].startswith("k=2")
+
+def test_explicit_state_sweep_time_limit(tmp_path):
+    mra = MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+    try:
+        explicit_state_sweep([1, 2, 3], mra, 3, cache_root=str(tmp_path), time_limit=0)
+    except ExplicitStateTimeout as timeout:
+        assert timeout.results == [] and timeout.remaining == [1, 2, 3]
+    else:
+        assert False, "expected ExplicitStateTimeout"
+
+def test_auto_engine_falls_back_to_maxsat(tmp_path, monkeypatch):
+    from algorithms.EUMAS_2025.implemenation_guide import algorithm_1
+
+    mra = MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+    solved = []
+    def fake_solve_for_k(k, *args):
+        solved.append(k)
+        return {'k': k, 'cost': 10 * k, 'model': [1], 'status': 'success', 'error': False, 'message': None}
+    monkeypatch.setattr(algorithm_1, "_solve_for_k", fake_solve_for_k)
+
+    class InlinePool:
+        processes = 1
+        def starmap(self, function, tasks_args):
+            return [function(*args) for args in tasks_args]
+
+    best_k, best_cost, _ = algorithm_1.iterative_optimal_loop_synthesis_parallel(
+        mra, 1, 3, use_cache=False, pool=InlinePool(), cache_root=str(tmp_path),
+        engine="auto", explicit_state_time_limit=0
+    )
+    assert sorted(solved) == [1, 2, 3] and (best_k, best_cost) == (1, 10)
@@ -0,0 +1,30 @@
+import os
+
+from core.model_interpreter import ModelInterpreter
+from core.variable_index import load_variable_index
+from mra.agent import Agent
+from mra.problem import MRA
+from algorithms.EUMAS_2025.implemenation_guide.explicit_state import explicit_state_sweep
+from algorithms.EUMAS_2025.implemenation_guide.incremental_sweep import incremental_sweep
+
+def test_incremental_sweep_matches_explicit_state(tmp_path):
+    scenarios = [
+        MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2}),
+        MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=2, acc={2, 3}), Agent(id=3, d=1, acc={1, 3})], res={1, 2, 3}),
+        # Demand above |Acc(a)|: a2 never reaches its goal
+        MRA(agt=[Agent(id=1, d=1, acc={1}), Agent(id=2, d=3, acc={1, 2})], res={1, 2}),
+    ]
+    for i, mra in enumerate(scenarios):
+        incremental = incremental_sweep(range(0, 5), mra, 4, cache_root=str(tmp_path / f"incremental{i}"))
+        explicit = explicit_state_sweep(range(0, 5), mra, 4, cache_root=str(tmp_path / f"explicit{i}"))
+        assert [(r['status'], r['cost']) for r in incremental] == [(r['status'], r['cost']) for r in explicit]
+
+def test_incremental_sweep_prunes_and_is_interpretable(tmp_path):
+    mra = MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+    # The loop of size 2 (payoff 1) cannot be beaten by any larger k
+    results = incremental_sweep([2, 3, 4], mra, 4, prune=True, cache_root=str(tmp_path))
+    assert [result['k'] for result in results] == [2] and results[0]['engine'] == 'incremental'
+
+    cache_dir, = [os.path.join(root, name) for root, dirs, _ in os.walk(tmp_path) for name in dirs if name == "k_2_mb4"]
+    interpreter = ModelInterpreter(results[0]['model'], load_variable_index(cache_dir), mra)
+    assert interpreter.loop_size == 2 and interpreter.calculate_payoff() == 1.0
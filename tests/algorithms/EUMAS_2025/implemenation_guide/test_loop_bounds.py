@@ -0,0 +1,78 @@
+from pysat.examples.rc2 import RC2
+from pysat.formula import And
+
+from core.encoding_context import EncodingContext
+from core.pysat_constructs import Atom
+from mra.agent import Agent
+from mra.problem import MRA
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import enrich_formula_f_agt_infinity_with_maxbound_soft_clauses
+from algorithms.EUMAS_2025.implemenation_guide.loop_bounds import (
+    soft_clause_weight,
+    total_soft_weight,
+    max_goal_hits,
+    max_simultaneous_goals,
+    payoff_upper_bound,
+    is_trivially_infeasible,
+    cost_lower_bound
+)
+
+def h_solve_cost(mra: MRA, k: int, maxbound: int):
+    with EncodingContext() as context, context.active():
+        wcnf = enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(
+            And(
+                encode_formula_f_agt_infinity_hard_clauses(mra, k),
+                Atom(f"loopSize_{k}")
+            ),
+            mra,
+            k,
+            maxbound
+        )
+    with RC2(wcnf) as rc2:
+        model = rc2.compute()
+        return (rc2.cost if model is not None else None), wcnf
+
+def test_max_goal_hits():
+    assert max_goal_hits(Agent(id=1, d=2, acc={1, 2}), 5) == 1
+    assert max_goal_hits(Agent(id=1, d=2, acc={1, 2}), 6) == 2
+    assert max_goal_hits(Agent(id=1, d=1, acc={1}), 2) == 1
+    assert max_goal_hits(Agent(id=1, d=0, acc={1}), 3) == 3
+
+def test_max_goal_hits_unreachable_demand():
+    assert max_goal_hits(Agent(id=1, d=3, acc={1, 2}), 10) == 0
+
+def test_max_simultaneous_goals():
+    mra = MRA(
+        agt=[Agent(id=1, d=2, acc={1, 2}), Agent(id=2, d=2, acc={2, 3}), Agent(id=3, d=1, acc={3})],
+        res={1, 2, 3}
+    )
+    # Demands 1 and 2 fit into three resources, a third agent cannot be served.
+    assert max_simultaneous_goals(mra) == 2
+    assert payoff_upper_bound(mra, 6) == min(2 + 2 + 3, 6 * 2)
+
+def test_total_soft_weight_matches_wcnf():
+    mra = MRA(agt=[Agent(id=1, d=1, acc={1}), Agent(id=2, d=1, acc={1})], res={1})
+    _, wcnf = h_solve_cost(mra, 3, 5)
+    assert sum(wcnf.wght) == total_soft_weight(mra, 3, 5)
+    assert soft_clause_weight(3, 5) == 8
+
+def test_trivially_infeasible():
+    mra = MRA(agt=[Agent(id=1, d=2, acc={1, 2})], res={1, 2})
+    assert is_trivially_infeasible(mra, 0)
+    assert is_trivially_infeasible(mra, 2)
+    assert not is_trivially_infeasible(mra, 3)
+    assert cost_lower_bound(mra, 2, 4) == float('inf')
+
+def test_lower_bound_is_tight_for_single_agent():
+    mra = MRA(agt=[Agent(id=1, d=1, acc={1})], res={1})
+    cost, _ = h_solve_cost(mra, 2, 3)
+    assert cost == cost_lower_bound(mra, 2, 3)
+
+def test_lower_bound_never_exceeds_optimal_cost():
+    mra = MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+    maxbound = 4
+    for k in range(0, maxbound + 1):
+        cost, _ = h_solve_cost(mra, k, maxbound)
+        if cost is None:
+            continue
+        assert cost_lower_bound(mra, k, maxbound) <= cost
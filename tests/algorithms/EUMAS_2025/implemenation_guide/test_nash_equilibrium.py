@@ -0,0 +1,41 @@
+from array import array
+from fractions import Fraction
+
+from mra.agent import Agent
+from mra.problem import MRA
+from mra.strategy import UNDECIDED, StrategyProfile
+from algorithms.EUMAS_2025.implemenation_guide.nash_equilibrium import complete_profile, find_nash_equilibrium
+from algorithms.EUMAS_2025.implemenation_guide.strategy_verification import StrategyVerifier
+
+def h_mra() -> MRA:
+    return MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+
+def test_complete_profile_follows_protocol():
+    mra = h_mra()
+    profile = StrategyProfile.for_mra(mra)
+    table = profile.tables[1]
+    table.actions = array('h', [5]) * table.num_observations  # rel2
+    complete_profile(profile, mra)
+
+    assert table.decide({1: 0, 2: 1}) == 1      # at its goal: relall
+    assert table.decide({1: 0, 2: 0}) == 0      # rel2 without holding r2: idle
+    assert all(action != UNDECIDED for action in profile.tables[2].actions)
+
+def test_find_nash_equilibrium():
+    mra = h_mra()
+    result = find_nash_equilibrium(mra, 3, num_processes=0)
+    assert result.found and result.payoffs == {1: Fraction(1, 2), 2: Fraction(1, 2)}
+
+    # No agent gains by deviating alone
+    with StrategyVerifier(mra, 3) as verifier:
+        for agent_id, payoff in result.payoffs.items():
+            response = verifier.max_payoff(result.profile, agents=[agent_id], free_agents=[agent_id])
+            assert Fraction(response.goal_count, response.loop_size) == payoff
+
+    pooled = find_nash_equilibrium(mra, 3, num_processes=2)
+    assert pooled.found and pooled.payoffs == result.payoffs
+
+def test_no_loop_no_equilibrium():
+    # Demand 2 needs loops of size >= 3
+    mra = MRA(agt=[Agent(id=1, d=2, acc={1, 2})], res={1, 2})
+    assert not find_nash_equilibrium(mra, 2, num_processes=0).found
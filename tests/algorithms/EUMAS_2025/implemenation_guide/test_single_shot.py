@@ -0,0 +1,59 @@
+from pysat.examples.rc2 import RC2
+from pysat.formula import And
+
+from core.encoding_context import EncodingContext
+from core.pysat_constructs import Atom
+from mra.agent import Agent
+from mra.problem import MRA
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import enrich_formula_f_agt_infinity_with_maxbound_soft_clauses
+from algorithms.EUMAS_2025.implemenation_guide.single_shot import (
+    encode_single_shot_wcnf,
+    single_shot_cost_offset,
+    _find_loop_size
+)
+
+def h_sweep_costs(mra: MRA, k_start: int, k_end: int) -> dict:
+    costs = {}
+    for k in range(k_start, k_end + 1):
+        with EncodingContext() as context, context.active():
+            wcnf = enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(
+                And(encode_formula_f_agt_infinity_hard_clauses(mra, k), Atom(f"loopSize_{k}")),
+                mra,
+                k,
+                k_end
+            )
+        with RC2(wcnf) as rc2:
+            if rc2.compute() is not None:
+                costs[k] = rc2.cost
+    return costs
+
+def h_single_shot(mra: MRA, k_start: int, k_end: int):
+    with EncodingContext() as context:
+        wcnf = context.encode(encode_single_shot_wcnf, mra, k_start, k_end)
+    with RC2(wcnf) as rc2:
+        model = rc2.compute()
+        if model is None:
+            return None, None
+        return _find_loop_size(model, k_end, context.vpool), rc2.cost - single_shot_cost_offset(mra, k_end)
+
+def test_single_shot_matches_sweep_optimum():
+    mra = MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+    sweep_costs = h_sweep_costs(mra, 0, 4)
+    loop_size, cost = h_single_shot(mra, 0, 4)
+
+    assert cost == min(sweep_costs.values())
+    assert sweep_costs[loop_size] == cost
+
+def test_single_shot_respects_k_start():
+    # The only loop of this agent has size 3 (two requests, then relall).
+    mra = MRA(agt=[Agent(id=1, d=2, acc={1, 2})], res={1, 2})
+    sweep_costs = h_sweep_costs(mra, 3, 5)
+
+    assert h_single_shot(mra, 3, 5) == (3, sweep_costs[3])
+    assert h_single_shot(mra, 4, 5) == (None, None)
+
+def test_single_shot_unsat():
+    # Demand 2 needs loops of size >= 3.
+    mra = MRA(agt=[Agent(id=1, d=2, acc={1, 2})], res={1, 2})
+    assert h_single_shot(mra, 0, 2) == (None, None)
@@ -0,0 +1,49 @@
+from array import array
+
+import pytest
+from pysat.formula import IDPool
+
+from core.model_interpreter import ModelInterpreter
+from core.variable_index import VariableIndex
+from mra.agent import Agent
+from mra.problem import MRA
+from mra.strategy import StrategyProfile
+from algorithms.EUMAS_2025.implemenation_guide.explicit_state import ExplicitStateSearch
+from algorithms.EUMAS_2025.implemenation_guide.strategy_verification import StrategyVerifier
+
+def h_mra() -> MRA:
+    return MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+
+def h_optimal_profile(mra: MRA, k: int):
+    search = ExplicitStateSearch(mra)
+    goal_count, states, joint_actions = search.optimal_loop(k)
+    vpool = IDPool()
+    model = [vpool.id(name) if value else -vpool.id(name) for name, value in search.named_model(k, states, joint_actions).items()]
+    return goal_count, ModelInterpreter(model, VariableIndex.from_pool(vpool), mra).extract_strategies()
+
+def test_verify_optimal_profile():
+    mra = h_mra()
+    goal_count, profile = h_optimal_profile(mra, 2)
+    with StrategyVerifier(mra, 4) as verifier:
+        result = verifier.verify(profile, goal_count / 2, loop_sizes=[2])
+        assert result.holds and result.loop_size == 2 and result.goal_count == goal_count
+        # No loop of size 2 beats the optimum, whatever the undecided observations do
+        assert not verifier.verify(profile, (goal_count + 1) / 2, loop_sizes=[2]).holds
+        assert verifier.max_payoff(profile, loop_sizes=[2]).goal_count == goal_count
+        with pytest.raises(ValueError):
+            verifier.verify(profile, loop_sizes=[5])
+
+def test_verify_many_profiles():
+    mra = h_mra()
+    with StrategyVerifier(mra, 4) as verifier:
+        idle = StrategyProfile.for_mra(mra)
+        for table in idle.tables.values():
+            table.actions = array('h', [0]) * table.num_observations
+        # Idling agents never reach their goals (infinite goal-reachability fails)
+        assert not verifier.verify(idle).holds
+        assert verifier.max_payoff(StrategyProfile.for_mra(mra)).holds
+
+        goal_count, profile = h_optimal_profile(mra, 2)
+        # Agent 1 deviating alone can do at least as well for itself as in the profile
+        own = verifier.max_payoff(profile, loop_sizes=[2], agents=[1], free_agents=[1])
+        assert own.holds and own.payoff >= verifier.verify(profile, loop_sizes=[2], agents=[1]).payoff
@@ -0,0 +1,33 @@
+from pysat.examples.rc2 import RC2
+from pysat.formula import And
+
+from core.clause_simplification import simplify_clauses
+from core.encoding_context import EncodingContext
+from core.pysat_constructs import Atom
+from mra.generator import random_mra
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import enrich_formula_f_agt_infinity_with_maxbound_soft_clauses
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+
+def test_simplify_clauses():
+    clauses = [[1, 2, 2], [2, 1], [1, -1, 3], [1], [1, 3, 4], [-2, 3], [3, -2, 4], []]
+    simplified, stats = simplify_clauses(clauses)
+
+    assert simplified == [[1], [-2, 3], []]
+    assert (stats.clauses_before, stats.duplicates, stats.tautologies, stats.subsumed, stats.clauses_after) == (8, 1, 1, 3, 3)
+    assert simplify_clauses(clauses, subsumption=False)[0] == [[1, 2], [1], [1, 3, 4], [-2, 3], [3, -2, 4], []]
+
+def test_simplified_wcnf_has_same_optimum():
+    mra = random_mra(3, 3, 0.6, seed=2)
+    for k in range(1, 5):
+        costs = []
+        for simplify in (False, True):
+            with EncodingContext() as context:
+                with context.active():
+                    formula = And(encode_formula_f_agt_infinity_hard_clauses(mra, k), Atom(f"loopSize_{k}"))
+                    wcnf = enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(formula, mra, k, 4, simplify=simplify)
+            with RC2(wcnf) as rc2:
+                costs.append(rc2.cost if rc2.compute() is not None else None)
+            if simplify:
+                assert len(wcnf.hard) < num_hard
+            num_hard = len(wcnf.hard)
+        assert costs[0] == costs[1]
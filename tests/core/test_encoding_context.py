@@ -0,0 +1,53 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pysat.formula import Formula
+
+import core.pysat_constructs
+from core.encoding_context import EncodingContext, active_context
+from core.pysat_constructs import Atom, current_vpool
+from mra.agent import Agent
+from mra.problem import MRA
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+
+def h_mra() -> MRA:
+    return MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+
+def h_encode(k: int) -> tuple:
+    # Clauses and variable names of one encoding in its own context
+    with EncodingContext() as context:
+        clauses = context.clausify(context.encode(encode_formula_f_agt_infinity_hard_clauses, h_mra(), k))
+    return clauses, dict(context.vpool.id2obj)
+
+class TestEncodingContext:
+    def test_contexts_are_independent_of_the_global_pool(self):
+        global_top = core.pysat_constructs.vpool.top
+        first, second = h_encode(2), h_encode(2)
+
+        assert first == second
+        assert core.pysat_constructs.vpool.top == global_top
+        assert current_vpool() is core.pysat_constructs.vpool and active_context() is None
+
+    def test_atom_uses_the_active_context(self):
+        with EncodingContext() as context:
+            with context.active():
+                assert Atom("loopSize_1").name == context.id("loopSize_1") == 1
+                assert current_vpool() is context.vpool
+            assert active_context() is None
+        # Its formulas are released on close
+        assert context.name not in Formula._instances
+
+    def test_concurrent_encodings_in_threads_and_tasks(self):
+        expected = {k: h_encode(k) for k in (2, 3)}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(h_encode, [2, 3, 2, 3]))
+        assert results == [expected[2], expected[3], expected[2], expected[3]]
+
+        async def h_encode_task(k: int):
+            return await asyncio.to_thread(h_encode, k)
+
+        async def h_gather():
+            return await asyncio.gather(*(h_encode_task(k) for k in (3, 2)))
+
+        assert asyncio.run(h_gather()) == [expected[3], expected[2]]
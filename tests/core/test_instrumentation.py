@@ -0,0 +1,44 @@
+import pytest
+from pysat.formula import And
+import core.instrumentation
+from core.encoding_context import EncodingContext
+from core.pysat_constructs import Atom
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(core.instrumentation, "ENABLED", True)
+    with EncodingContext() as context, context.active():
+        core.instrumentation.start_run()
+        yield
+        core.instrumentation.finish_run()
+
+def h_encode_inner(name: str):
+    return And(Atom(f"{name}_x"), Atom(f"{name}_y"))
+
+class TestInstrumentation:
+    def test_disabled_returns_function_unchanged(self, monkeypatch):
+        """Test that the decorator adds no wrapper when instrumentation is off."""
+        monkeypatch.setattr(core.instrumentation, "ENABLED", False)
+        assert core.instrumentation.instrumented(h_encode_inner) is h_encode_inner
+
+    def test_report_per_definition(self, enabled):
+        """Test that calls, variables and clauses are attributed per Definition."""
+        inner = core.instrumentation.instrumented(h_encode_inner)
+
+        def h_encode_outer():
+            return And(inner("a"), inner("b"), Atom("z"))
+
+        outer = core.instrumentation.instrumented(h_encode_outer)
+        clauses = list(And(outer(), Atom("root")))
+
+        report = core.instrumentation.finish_run()
+        inner_entry = report["test_instrumentation.h_encode_inner"]
+        outer_entry = report["test_instrumentation.h_encode_outer"]
+
+        assert list(report) == ["test_instrumentation.h_encode_outer", "test_instrumentation.h_encode_inner"]
+        assert inner_entry['calls'] == 2 and outer_entry['calls'] == 1
+        assert inner_entry['vars'] == 4 and inner_entry['self_vars'] == 4
+        assert outer_entry['vars'] == 5 and outer_entry['self_vars'] == 1
+        assert outer_entry['self_time'] <= outer_entry['time']
+        assert 0 < inner_entry['clauses'] < outer_entry['clauses'] < len(clauses)
+        assert outer_entry['peak_bytes'] is None
@@ -0,0 +1,96 @@
+import io
+from pysat.formula import IDPool
+from mra.agent import Agent
+from mra.problem import MRA
+from mra.strategy import UNDECIDED
+from core.model_decoder import decode_assignments, decode_model, decode_strategies, h_split_number
+from core.model_interpreter import ModelInterpreter
+
+def h_mra() -> MRA:
+    return MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=2, acc={1, 2})], res={1, 2})
+
+# Two agents (2 agent-ID bits), two resources (6 actions, 3 action bits), loop of size 1.
+NAMED_MODEL = {
+    "t0r1b0": True, "t0r1b1": False, "t0r2b0": False, "t0r2b1": True,
+    "t1r1b0": False, "t1r1b1": True, "t1r2b0": False, "t1r2b1": True,
+    "t0act_a1b0": False, "t0act_a1b1": True, "t0act_a1b2": False,  # a1 req1 (2)
+    "t0act_a2b0": True, "t0act_a2b1": True, "t0act_a2b2": False,   # a2 rel1 (3)
+    "t1act_a1b0": False, "t1act_a1b1": False, "t1act_a1b2": False, # a1 idle (0)
+    "t1act_a2b0": False, "t1act_a2b1": False, "t1act_a2b2": True,  # a2 req2 (4)
+    "t1_g_a2": True,
+    "loopSize_1": True, "loopClosed_0": False, "loopClosed_1": True,
+    "agent2_goal_loop1_at_t_prime0": True, "agent1_goal_loop1_at_t_prime0": False,
+    "so_r1_a0_sdec_a1b0": True, "t2act_a9b0": True, "t3r7b0": False,
+}
+
+class TestModelDecoder:
+    def test_split_number(self):
+        """Test that leading numbers are split off without regular expressions."""
+        assert h_split_number("12r3b0") == (12, "r3b0")
+        assert h_split_number("act_a1") == (None, "act_a1")
+        assert h_split_number("7") == (7, "")
+
+    def test_decode_assignments(self):
+        """Test that one pass fills the dense per-time-step arrays."""
+        decoded = decode_assignments(NAMED_MODEL.items(), h_mra())
+
+        assert decoded.max_time_step == 3
+        assert decoded.resource_owners == [[1, 2], [2, 2], [0, 0], [0, 0]]
+        assert decoded.actions == [[2, 3], [0, 4], [0, 0], [0, 0]]
+        assert decoded.goal_flags[1] == [False, True]
+        assert (decoded.loop_size, decoded.loop_closed_steps) == (1, [1])
+        assert decoded.loop_goals == {2: [(1, 0)]}
+
+    def test_decode_model_uses_pool(self):
+        """Test that raw models are decoded through the variable pool."""
+        vpool = IDPool()
+        raw_model = [vpool.id(name) if value else -vpool.id(name) for name, value in NAMED_MODEL.items()]
+        raw_model.append(vpool.top + 1)  # auxiliary variable without a name
+
+        decoded = decode_model(raw_model, vpool, h_mra())
+
+        assert decoded == decode_assignments(NAMED_MODEL.items(), h_mra())
+
+    def test_interpreter_time_steps(self):
+        """Test that the interpreter builds its time steps from the decoded model."""
+        vpool = IDPool()
+        raw_model = [vpool.id(name) if value else -vpool.id(name) for name, value in NAMED_MODEL.items()]
+
+        interpreter = ModelInterpreter(raw_model, vpool, h_mra())
+
+        assert interpreter.loop_size == 1 and interpreter.loop_closed_steps == [1]
+        step_0, step_1 = interpreter.time_steps[:2]
+        assert step_0.resource_states == {0: 1, 1: 2}
+        assert step_0.agent_actions == {1: "req1", 2: "rel1"}
+        assert step_1.demand_fulfillment == {1: (0, 1), 2: (2, 2)}
+        assert step_1.satisfied_agents == {2}
+        assert interpreter.calculate_payoff() == 2.0
+
+    def test_time_steps_are_lazy(self):
+        """Test that time steps are only built when accessed and the trace can be streamed."""
+        vpool = IDPool()
+        raw_model = [vpool.id(name) if value else -vpool.id(name) for name, value in NAMED_MODEL.items()]
+
+        interpreter = ModelInterpreter(raw_model, vpool, h_mra())
+
+        assert len(interpreter.time_steps) == 4 and not interpreter.time_steps._cache
+        assert interpreter.time_steps[-1] is interpreter.time_steps[3]
+        assert list(interpreter.time_steps._cache) == [3]
+
+        stream = io.StringIO()
+        interpreter.write_trace(stream)
+        assert stream.getvalue() == interpreter.format_complete_trace() + "\n"
+        assert "┏━━━ Time Step 0 (Loop Start) ━━━┓" in stream.getvalue()
+
+    def test_decode_strategies(self):
+        """Test that strategic decisions are decoded into the strategy tables."""
+        profile = decode_strategies(NAMED_MODEL.items(), h_mra())
+
+        # so_r1_a0_sdec_a1b0 misses r2 of Acc(a1), so it is not a complete observation
+        assert all(action == UNDECIDED for action in profile.tables[2].actions)
+        assert list(profile.tables[1].actions).count(UNDECIDED) == profile.tables[1].num_observations
+
+        named = {"so_r2_a2_r1_a0_sdec_a1b0": False, "so_r2_a2_r1_a0_sdec_a1b1": True, "so_r1_a0_r2_a2_sdec_a1b2": False}
+        profile = decode_strategies(named.items(), h_mra())
+        assert profile.decide(1, {1: 0, 2: 2}) == 2
+        assert list(profile.tables[1].actions).count(UNDECIDED) == profile.tables[1].num_observations - 1
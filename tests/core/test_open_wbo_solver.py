@@ -0,0 +1,61 @@
+import os
+import signal
+import time
+import multiprocessing
+
+from core.open_wbo_solver import OpenWBOSolver
+
+def h_is_running(pid: int) -> bool:
+    # Killed solvers may stay zombies if nothing reaps them
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split(")")[-1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+def h_wait_for(path: str, timeout: float = 10.0) -> str:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if os.path.exists(path) and open(path).read().strip():
+            return open(path).read().strip()
+        time.sleep(0.05)
+    raise TimeoutError(path)
+
+def test_solve_parses_solver_output(tmp_path):
+    solver = tmp_path / "solver.sh"
+    solver.write_text("#!/bin/sh\necho 'o 3'\necho 's OPTIMUM FOUND'\necho 'v 1 -2 3'\n")
+    solver.chmod(0o755)
+    result = OpenWBOSolver(str(solver)).solve(str(tmp_path / "problem.wcnf"))
+    assert (result['status'], result['cost'], result['model']) == ('success', 3, [1, -2, 3])
+
+def test_peak_rss_is_the_solvers(tmp_path):
+    # The calling process holds far more memory than the solver
+    ballast = bytearray(256 * 2**20)
+    for i in range(0, len(ballast), 4096):
+        ballast[i] = 1
+    solver = tmp_path / "solver.sh"
+    solver.write_text("#!/bin/sh\nsleep 0.2\necho 's UNSATISFIABLE'\n")
+    solver.chmod(0o755)
+    result = OpenWBOSolver(str(solver)).solve(str(tmp_path / "problem.wcnf"))
+    assert result['status'] == 'no solution (UNSAT)'
+    assert result['peak_rss_mib'] is not None and result['peak_rss_mib'] < 64
+
+def test_terminating_the_worker_kills_the_solver(tmp_path):
+    # The solver writes its PID and then keeps running
+    solver = tmp_path / "solver.sh"
+    solver.write_text("#!/bin/sh\necho $$ > \"$1.pid\"\nexec sleep 60\n")
+    solver.chmod(0o755)
+    wcnf_path = str(tmp_path / "problem.wcnf")
+
+    worker = multiprocessing.Process(target=OpenWBOSolver(str(solver)).solve, args=(wcnf_path,))
+    worker.start()
+    solver_pid = int(h_wait_for(f"{wcnf_path}.pid"))
+    assert h_is_running(solver_pid)
+
+    worker.terminate()
+    worker.join(10)
+    assert worker.exitcode == -signal.SIGTERM
+    deadline = time.time() + 10
+    while h_is_running(solver_pid) and time.time() < deadline:
+        time.sleep(0.05)
+    assert not h_is_running(solver_pid)
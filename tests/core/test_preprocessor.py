@@ -0,0 +1,56 @@
+from itertools import product
+
+from pysat.examples.rc2 import RC2
+from pysat.formula import And
+
+from core.encoding_context import EncodingContext
+from core.pysat_constructs import Atom
+from core.preprocessor import Preprocessor, preprocess_wcnf
+from mra.generator import random_mra
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import enrich_formula_f_agt_infinity_with_maxbound_soft_clauses
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+
+def h_satisfies(model: list, clauses: list) -> bool:
+    true_literals = set(model)
+    return all(any(literal in true_literals for literal in clause) for clause in clauses)
+
+def test_preprocessor_reconstructs_models():
+    # 1 is a unit, 2 <-> 3, 4 <-> (2 and 5) is eliminated; 5 and 6 are frozen
+    clauses = [[1], [-1, 2, 6], [-2, 3], [-3, 2], [-4, 2], [-4, 5], [4, -2, -5], [3, 5, 6]]
+    preprocessor = Preprocessor(clauses, frozen={5, 6}, num_vars=6)
+    simplified = preprocessor.clauses()
+
+    assert preprocessor.stats.fixed >= 1 and preprocessor.stats.substituted >= 1 and preprocessor.stats.eliminated >= 1
+    assert len(simplified) < len(clauses)
+    assert all(abs(literal) in (2, 3, 5, 6) for clause in simplified for literal in clause)
+    # Every model of the simplified clauses extends to the same frozen values
+    variables = sorted(set(abs(literal) for clause in simplified for literal in clause))
+    for values in product((False, True), repeat=len(variables)):
+        model = [var if value else -var for var, value in zip(variables, values)]
+        if h_satisfies(model, simplified):
+            full_model = preprocessor.reconstruct(model)
+            assert h_satisfies(full_model, clauses)
+            assert {5, 6} & set(model) == {5, 6} & set(full_model)
+
+def test_preprocessor_reduces_unsat_to_the_empty_clause():
+    preprocessor = Preprocessor([[1, 2], [-1], [-2]], frozen=set(), num_vars=2)
+    assert preprocessor.stats.unsat and preprocessor.clauses() == [[]]
+
+def test_preprocessed_wcnf_has_same_optimum():
+    mra = random_mra(3, 3, 0.6, seed=2)
+    for k in range(1, 4):
+        with EncodingContext() as context, context.active():
+            formula = And(encode_formula_f_agt_infinity_hard_clauses(mra, k), Atom(f"loopSize_{k}"))
+            wcnf = enrich_formula_f_agt_infinity_with_maxbound_soft_clauses(formula, mra, k, 4)
+        preprocessed, preprocessor = preprocess_wcnf(wcnf)
+        assert len(preprocessed.hard) < len(wcnf.hard) and preprocessed.soft == wcnf.soft
+
+        with RC2(wcnf) as rc2:
+            cost = rc2.cost if rc2.compute() is not None else None
+        with RC2(preprocessed) as rc2:
+            model = rc2.compute()
+            assert (rc2.cost if model is not None else None) == cost
+        if model is not None:
+            full_model = preprocessor.reconstruct(model)
+            assert len(full_model) == wcnf.nv and h_satisfies(full_model, wcnf.hard)
+            assert sum(weight for clause, weight in zip(wcnf.soft, wcnf.wght) if not h_satisfies(full_model, [clause])) == cost
@@ -0,0 +1,28 @@
+from pysat.formula import IDPool
+from core.variable_index import VariableIndex, load_variable_index, save_variable_index
+
+class TestVariableIndex:
+    def test_round_trip(self, tmp_path):
+        """Test that the stored index names the same IDs as the pool it was taken from."""
+        vpool = IDPool()
+        vpool.id("t0r1b0")
+        vpool.id(("tuple", "name"))  # not a variable name, not stored
+        vpool.id("loopSize_2")
+        vpool.occupy(4, 6)  # IDs without a name
+
+        save_variable_index(vpool, str(tmp_path))
+        index = load_variable_index(str(tmp_path))
+
+        assert index.top == vpool.top
+        assert [index.obj(i) for i in range(1, 5)] == ["t0r1b0", None, "loopSize_2", None]
+        assert index.obj(vpool.top + 1) is None
+
+    def test_missing_or_broken_index(self, tmp_path):
+        """Test that results cached without a readable index load as None."""
+        assert load_variable_index(str(tmp_path)) is None
+        (tmp_path / "variables.json").write_text("{")
+        assert load_variable_index(str(tmp_path)) is None
+
+    def test_from_names(self):
+        """Test that the top ID defaults to the largest named ID."""
+        assert VariableIndex({3: "a", 7: "b"}).top == 7
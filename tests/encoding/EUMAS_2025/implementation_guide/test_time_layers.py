@@ -0,0 +1,38 @@
+from pysat.examples.rc2 import RC2
+from pysat.formula import And
+
+from core.encoding_context import EncodingContext
+from core.pysat_constructs import Atom
+from mra.agent import Agent
+from mra.generator import random_mra
+from mra.problem import MRA
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import enrich_formula_f_agt_infinity_with_maxbound_soft_clauses
+from encoding.EUMAS_2025.implementation_guide.definition_1 import encode_formula_f_agt_infinity_hard_clauses
+from encoding.EUMAS_2025.implementation_guide.time_layers import encode_formula_f_agt_infinity_hard_clauses_in_layers
+
+def h_optimum(mra: MRA, k: int, processes: int | None) -> tuple:
+    # Optimal cost of loop size k (None if UNSAT) and the variable names, encoded
+    # as a whole (processes=None) or in time layers
+    with EncodingContext() as context:
+        with context.active():
+            loop_size = Atom(f"loopSize_{k}")
+        if processes is None:
+            hard_clauses = context.encode(lambda: And(encode_formula_f_agt_infinity_hard_clauses(mra, k), loop_size))
+        else:
+            hard_clauses = encode_formula_f_agt_infinity_hard_clauses_in_layers(context, mra, k, processes, (loop_size,))
+        wcnf = context.encode(enrich_formula_f_agt_infinity_with_maxbound_soft_clauses, hard_clauses, mra, k, 4)
+        assert wcnf.nv <= context.top
+    with RC2(wcnf) as rc2:
+        cost = rc2.cost if rc2.compute() is not None else None
+    return cost, set(context.vpool.obj2id)
+
+def test_layers_match_whole_encoding():
+    for mra in [MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2}), random_mra(3, 3, 0.6, seed=2)]:
+        for k in range(4):
+            cost, names = h_optimum(mra, k, None)
+            assert h_optimum(mra, k, 0) == (cost, names)
+    assert cost is not None
+
+def test_layers_on_worker_processes():
+    mra = random_mra(3, 3, 0.6, seed=2)
+    assert h_optimum(mra, 3, 2) == h_optimum(mra, 3, None)
@@ -3,7 +3,7 @@ from pysat.formula import And, Or, Neg, PYSAT_FALSE, PYSAT_TRUE
 
 from mra.agent import Agent
 from mra.state import State
-from encoding.SBMF_2021.definition_15 import encode_protocol
+from encoding.SBMF_2021.definition_15 import encode_protocol, encode_protocol_at_t
 from encoding.SBMF_2021.definition_17 import encode_resource_state_at_t
 from encoding.SBMF_2021.definition_18 import encode_state_observation_by_agent_at_t
 from encoding.SBMF_2021.definition_19 import encode_goal
@@ -214,3 +214,19 @@ def test_encode_protocol_one_agent_one_acc_d_one_k0():
     # Assert
     assert actual_formula.simplified() == expected_formula.simplified(), \
         f"Expected (simplified for comparison):\n{expected_formula}\nBut got (simplified for comparison):\n{actual_formula}"
+
+def test_encode_protocol_at_t_is_time_step_of_protocol():
+    """
+    encode_protocol_at_t encodes the time step t of encode_protocol on its own.
+    """
+    agents_list = [Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})]
+    num_agents_plus_val = 3
+    num_resources_val = 2
+
+    protocol_k0 = encode_protocol(agents_list, num_agents_plus_val, num_resources_val, 0)
+    protocol_k1 = encode_protocol(agents_list, num_agents_plus_val, num_resources_val, 1)
+    protocol_t0 = encode_protocol_at_t(agents_list, num_agents_plus_val, num_resources_val, 0)
+    protocol_t1 = encode_protocol_at_t(agents_list, num_agents_plus_val, num_resources_val, 1)
+
+    assert protocol_t0 == protocol_k0
+    assert protocol_k1 == And(*protocol_t0.subformulas, *protocol_t1.subformulas)
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from mra.agent import Agent
+from mra.problem import MRA
+from execution.admission import (
+    MemoryAdmissionController,
+    parse_memory_size,
+    encoding_size_units,
+    estimate_solve_memory
+)
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import _dispatch_sweep
+
+class h_DelayedPool:
+    """Completes every task with a fake successful result after a short delay."""
+    def __init__(self, admission):
+        self.admission = admission
+        self.max_concurrent = 0
+
+    def apply_async(self, func, args=(), callback=None, error_callback=None):
+        self.max_concurrent = max(self.max_concurrent, len(self.admission.reservations))
+        k = args[0]
+        result = {'k': k, 'cost': 100 - k, 'model': [], 'status': 'success', 'message': None, 'error': False, 'computation_time': 0}
+        threading.Timer(0.01, callback, (result,)).start()
+
+def h_mra() -> MRA:
+    return MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+
+def test_parse_memory_size():
+    assert parse_memory_size(1024) == 1024
+    assert parse_memory_size("512") == 512
+    assert parse_memory_size("4K") == 4096
+    assert parse_memory_size("16G") == 16 * 1024 ** 3
+    assert parse_memory_size("1.5GiB") == int(1.5 * 1024 ** 3)
+    assert parse_memory_size("256mb") == 256 * 1024 ** 2
+    with pytest.raises(ValueError):
+        parse_memory_size("lots")
+
+def test_estimate_grows_with_k():
+    mra = h_mra()
+    sizes = [encoding_size_units(mra, k) for k in range(0, 6)]
+    assert sizes == sorted(sizes)
+    assert len(set(sizes)) == len(sizes)
+    assert estimate_solve_memory(mra, 5) > estimate_solve_memory(mra, 1)
+
+def test_controller_reserves_until_budget():
+    mra = h_mra()
+    admission = MemoryAdmissionController(250, estimator=lambda mra, k: 100)
+    assert admission.try_admit(mra, 1)
+    assert admission.try_admit(mra, 2)
+    assert not admission.try_admit(mra, 3)
+    admission.release(1)
+    assert admission.try_admit(mra, 3)
+    assert admission.reserved_bytes() == 200
+
+def test_controller_always_admits_when_idle():
+    mra = h_mra()
+    admission = MemoryAdmissionController(50, estimator=lambda mra, k: 100)
+    assert admission.try_admit(mra, 1)
+    assert not admission.try_admit(mra, 2)
+
+def test_sweep_stays_within_budget():
+    mra = h_mra()
+    admission = MemoryAdmissionController(300, estimator=lambda mra, k: 100)
+    pool = h_DelayedPool(admission)
+
+    results = _dispatch_sweep(pool, 8, list(range(1, 9)), mra, 8, "open-wbo", float('inf'), prune=False, admission=admission)
+
+    assert [r['k'] for r in results] == list(range(1, 9))
+    assert pool.max_concurrent == 3
+    assert admission.reservations == {}
@@ -0,0 +1,123 @@
+import os
+import csv
+import pickle
+
+import pytest
+
+from utils.yaml_parser import parse_mra_from_yaml
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import get_cache_paths
+from execution.worker_pool import WarmWorkerPool
+from execution.batch_runner import (
+    SUMMARY_COLUMNS,
+    find_scenario_files,
+    _schedule,
+    run_batch,
+    write_summary
+)
+
+SCENARIO_SMALL = """
+k:
+  start: 1
+  end: 3
+resources: [r1]
+agents:
+  - id: a1
+    demand: 1
+    access: [r1]
+"""
+
+SCENARIO_LARGE = """
+k:
+  start: 2
+  end: 4
+resources: [r1, r2]
+agents:
+  - id: a1
+    demand: 1
+    access: [r1, r2]
+  - id: a2
+    demand: 1
+    access: [r2]
+"""
+
+def h_write_scenarios(directory) -> list:
+    paths = []
+    for name, content in (("small.yml", SCENARIO_SMALL), ("nested/large.yaml", SCENARIO_LARGE)):
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        paths.append(str(path))
+    (directory / "notes.txt").write_text("not a scenario")
+    return sorted(paths)
+
+def h_cache_results(scenario_file: str, cache_root: str, costs: dict):
+    mra, _, k_end = parse_mra_from_yaml(scenario_file)
+    for k, cost in costs.items():
+        _, _, result_path = get_cache_paths(mra, k, k_end, cache_root)
+        os.makedirs(os.path.dirname(result_path), exist_ok=True)
+        with open(result_path, 'wb') as f:
+            pickle.dump({
+                'k': k, 'cost': cost, 'model': [1] if cost is not None else None,
+                'status': 'success' if cost is not None else 'no solution (UNSAT)',
+                'message': None, 'error': False, 'computation_time': 0.5,
+                'encoding_time': 0.25, 'solving_time': 0.25, 'num_vars': 10 * k, 'num_clauses': 100 * k,
+            }, f)
+
+def test_find_scenario_files(tmp_path):
+    paths = h_write_scenarios(tmp_path)
+    assert find_scenario_files([str(tmp_path)]) == paths
+    assert find_scenario_files([str(tmp_path / "**" / "*.y*ml")]) == paths
+    assert find_scenario_files([str(tmp_path / "*.yml"), str(tmp_path / "small.yml")]) == [paths[1]]
+
+def test_schedule_interleaves_scenarios_largest_first(tmp_path):
+    small, large = [parse_mra_from_yaml(path) for path in sorted(h_write_scenarios(tmp_path), reverse=True)]
+    scenarios = [("small.yml", *small), ("large.yaml", *large)]
+
+    tasks = _schedule(scenarios)
+
+    assert sorted(tasks) == [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (1, 4)]
+    assert tasks[0] == (1, 4)
+    assert tasks[-1] == (0, 1)
+
+def test_run_batch_with_shared_cache(tmp_path):
+    large, small = h_write_scenarios(tmp_path)
+    cache_root = str(tmp_path / "cache")
+    h_cache_results(small, cache_root, {1: None, 2: 5, 3: 4})
+    h_cache_results(large, cache_root, {2: None, 3: 30, 4: 20})
+
+    duplicate = str(tmp_path / "duplicate.yml")
+    with open(duplicate, 'w') as f:
+        f.write(SCENARIO_SMALL)
+
+    with WarmWorkerPool(processes=1) as pool:
+        rows = run_batch([small, large, duplicate], pool=pool, cache_root=cache_root, open_wbo_binary_path="unused")
+        # The duplicate scenario shares the tasks of the first one.
+        assert pool.tasks_submitted == 6
+
+    assert [(row['scenario'], row['best_k'], row['cost']) for row in rows] == [(small, 3, 4), (large, 4, 20), (duplicate, 3, 4)]
+    assert rows[0]['num_sat'] == 2 and rows[0]['num_unsat'] == 1
+    assert rows[1]['max_num_clauses'] == 400
+    assert rows[1]['encoding_time'] == pytest.approx(0.75)
+
+    output_path = str(tmp_path / "summary.csv")
+    write_summary(rows, output_path)
+    with open(output_path, newline='') as f:
+        written = list(csv.DictReader(f))
+    assert list(written[0].keys()) == SUMMARY_COLUMNS
+    assert written[1]['best_k'] == "4"
+
+def test_maxbound_separates_cache_entries(tmp_path):
+    # Same MRA, but the soft clause weights (and costs) depend on k_end
+    small, = [path for path in h_write_scenarios(tmp_path) if path.endswith("small.yml")]
+    longer = str(tmp_path / "longer.yml")
+    with open(longer, 'w') as f:
+        f.write(SCENARIO_SMALL.replace("end: 3", "end: 4"))
+    cache_root = str(tmp_path / "cache")
+    h_cache_results(small, cache_root, {1: None, 2: 5, 3: 4})
+    h_cache_results(longer, cache_root, {1: None, 2: 9, 3: 7, 4: 8})
+
+    with WarmWorkerPool(processes=1) as pool:
+        rows = run_batch([small, longer], pool=pool, cache_root=cache_root, open_wbo_binary_path="unused")
+        assert pool.tasks_submitted == 7
+
+    assert [(row['best_k'], row['cost']) for row in rows] == [(3, 4), (3, 7)]
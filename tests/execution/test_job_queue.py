@@ -0,0 +1,180 @@
+import os
+import time
+import pickle
+import threading
+
+import pytest
+
+from mra.agent import Agent
+from mra.problem import MRA
+from algorithms.EUMAS_2025.implemenation_guide.algorithm_1 import get_cache_paths, generate_scenario_hash
+from execution.job_queue import (
+    JobQueue,
+    FileSystemJobQueue,
+    SQLiteJobQueue,
+    JobCoordinator,
+    RemoteJobQueue,
+    SweepTask,
+    make_task_id,
+    open_job_queue
+)
+from execution.distributed import submit_sweep, run_worker, wait_for_sweep, collect_best_loop
+
+def h_mra() -> MRA:
+    return MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+
+def h_task(k: int) -> SweepTask:
+    mra = h_mra()
+    scenario_hash = generate_scenario_hash(mra)
+    return SweepTask(task_id=make_task_id(scenario_hash, k, 4), scenario_hash=scenario_hash, k=k, maxbound=4, mra=mra)
+
+def h_result(k: int, cost) -> dict:
+    status = 'success' if cost is not None else 'no solution (UNSAT)'
+    return {'k': k, 'cost': cost, 'model': [k] if cost is not None else None, 'status': status,
+            'message': None, 'error': False, 'computation_time': 0.0}
+
+@pytest.fixture(params=["fs", "sqlite", "tcp"])
+def job_queue(request, tmp_path):
+    if request.param == "fs":
+        queue = FileSystemJobQueue(str(tmp_path / "queue"))
+        yield queue
+    elif request.param == "sqlite":
+        queue = SQLiteJobQueue(str(tmp_path / "queue.db"))
+        yield queue
+        queue.close()
+    else:
+        coordinator = JobCoordinator(host="127.0.0.1", port=0, authkey=b"test").start()
+        queue = RemoteJobQueue(*coordinator.address, authkey=b"test")
+        yield queue
+        queue.close()
+        coordinator.close()
+
+def test_submit_is_idempotent(job_queue):
+    assert job_queue.submit(h_task(1))
+    assert not job_queue.submit(h_task(1))
+    assert job_queue.submit(h_task(2))
+    assert job_queue.counts() == {'pending': 2, 'claimed': 0, 'done': 0}
+
+def test_claim_and_complete(job_queue):
+    job_queue.submit(h_task(1))
+    task = job_queue.claim("w1")
+    assert task.k == 1 and task.worker_id == "w1"
+    assert job_queue.claim("w2") is None
+    job_queue.complete(task.task_id, h_result(1, 7))
+    assert job_queue.counts() == {'pending': 0, 'claimed': 0, 'done': 1}
+    assert job_queue.results(task.scenario_hash) == [h_result(1, 7)]
+    assert job_queue.results("other") == []
+
+def test_concurrent_claims_are_unique(job_queue):
+    for k in range(20):
+        job_queue.submit(h_task(k))
+    claimed = []
+    lock = threading.Lock()
+
+    def h_claim_all(worker_id):
+        while (task := job_queue.claim(worker_id)) is not None:
+            with lock:
+                claimed.append(task.k)
+
+    threads = [threading.Thread(target=h_claim_all, args=(f"w{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == list(range(20))
+
+def test_requeue_stale(job_queue):
+    job_queue.submit(h_task(1))
+    job_queue.claim("crashed")
+    assert job_queue.requeue_stale(older_than=3600) == 0
+    assert job_queue.requeue_stale(older_than=-1) == 1
+    assert job_queue.claim("w2").k == 1
+
+def test_heartbeat_keeps_claim(job_queue):
+    job_queue.submit(h_task(1))
+    task = job_queue.claim("w1")
+    time.sleep(0.2)
+    job_queue.heartbeat(task.task_id)
+    assert job_queue.requeue_stale(older_than=0.1) == 0
+    assert job_queue.counts()['claimed'] == 1
+
+def test_complete_after_requeue(job_queue):
+    job_queue.submit(h_task(1))
+    task = job_queue.claim("slow")
+    assert job_queue.requeue_stale(older_than=-1) == 1
+    job_queue.complete(task.task_id, h_result(1, 7))
+    job_queue.complete(task.task_id, h_result(1, 7))
+    assert job_queue.counts() == {'pending': 0, 'claimed': 0, 'done': 1}
+    assert job_queue.results(task.scenario_hash) == [h_result(1, 7)]
+
+def test_incomplete_backend_cannot_be_instantiated():
+    class NoHeartbeatJobQueue(JobQueue):
+        def submit(self, task):
+            return True
+        def claim(self, worker_id):
+            return None
+        def complete(self, task_id, result):
+            pass
+        def requeue_stale(self, older_than):
+            return 0
+        def counts(self):
+            return {}
+        def results(self, scenario_hash=None):
+            return []
+
+    with pytest.raises(TypeError):
+        NoHeartbeatJobQueue()
+
+def test_coordinator_requires_authkey():
+    with pytest.raises(ValueError):
+        JobCoordinator(authkey=b"")
+    with pytest.raises(ValueError):
+        open_job_queue("tcp:127.0.0.1:5555")
+
+def test_open_job_queue(tmp_path):
+    assert isinstance(open_job_queue(f"fs:{tmp_path / 'q'}"), FileSystemJobQueue)
+    assert isinstance(open_job_queue(f"sqlite:{tmp_path / 'q.db'}"), SQLiteJobQueue)
+    with pytest.raises(ValueError):
+        open_job_queue("redis://localhost")
+
+def test_workers_share_cache_and_coordinator_aggregates(job_queue, tmp_path):
+    mra = h_mra()
+    cache_root = str(tmp_path / "cache")
+    costs = {1: None, 2: 12, 3: 9, 4: 10}
+    # Pre-populated cache entries stand in for the solver.
+    for k, cost in costs.items():
+        _, _, result_path = get_cache_paths(mra, k, 4, cache_root)
+        os.makedirs(os.path.dirname(result_path), exist_ok=True)
+        with open(result_path, 'wb') as f:
+            pickle.dump(h_result(k, cost), f)
+
+    submit_sweep(job_queue, mra, 1, 4)
+    workers = [threading.Thread(target=run_worker, args=(job_queue, cache_root), kwargs={'worker_id': f"w{i}"}) for i in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    results = wait_for_sweep(job_queue, mra, 1, 4, timeout=10)
+    assert [r['k'] for r in results] == [1, 2, 3, 4]
+    assert all('model' not in r for r in results)
+    assert collect_best_loop(job_queue, mra, 1, 4, cache_root) == (3, 9, [3])
+
+def test_sweeps_with_another_maxbound_stay_apart(job_queue, tmp_path):
+    mra = h_mra()
+    cache_root = str(tmp_path / "cache")
+    costs = {4: {1: None, 2: 12, 3: 9, 4: 10}, 3: {1: None, 2: 5, 3: 6}}
+    for maxbound, sweep_costs in costs.items():
+        for k, cost in sweep_costs.items():
+            _, _, result_path = get_cache_paths(mra, k, maxbound, cache_root)
+            os.makedirs(os.path.dirname(result_path), exist_ok=True)
+            with open(result_path, 'wb') as f:
+                pickle.dump(h_result(k, cost), f)
+
+    submit_sweep(job_queue, mra, 1, 4)
+    submit_sweep(job_queue, mra, 1, 3)
+    run_worker(job_queue, cache_root)
+
+    assert [r['cost'] for r in wait_for_sweep(job_queue, mra, 1, 3, timeout=10)] == [None, 5, 6]
+    assert collect_best_loop(job_queue, mra, 1, 4, cache_root) == (3, 9, [3])
+    assert collect_best_loop(job_queue, mra, 1, 3, cache_root) == (2, 5, [2])
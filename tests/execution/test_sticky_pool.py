@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+from execution.sticky_pool import StickyPool
+
+_state = []
+
+def h_init(value):
+    _state.append(value)
+
+def h_read_state():
+    return list(_state)
+
+def h_clear_state():
+    _state.clear()
+
+def test_keys_stay_on_their_worker():
+    with StickyPool(["a", "b", "c"], processes=2, initializer=h_init, initargs=(1,)) as pool:
+        pids = {key: {pool.apply_async(key, os.getpid).get(timeout=60) for _ in range(3)} for key in "abc"}
+        assert all(len(key_pids) == 1 for key_pids in pids.values())
+        assert pids["a"] == pids["c"] != pids["b"]
+        assert pool.apply_async("b", h_read_state).get(timeout=60) == [1]
+
+def test_inline_pool():
+    pool = StickyPool(["a"], processes=0, initializer=h_init, initargs=(2,), finalizer=h_clear_state)
+    assert pool.apply_async("a", os.getpid).get() == os.getpid()
+    assert pool.apply_async("a", h_read_state).get() == [2]
+    pool.terminate()
+    assert _state == []
+    with pytest.raises(RuntimeError):
+        pool.apply_async("a", os.getpid)
@@ -0,0 +1,29 @@
+import os
+
+from execution.worker_pool import WarmWorkerPool, worker_status
+
+def test_pool_runs_tasks_and_passes_health_check():
+    with WarmWorkerPool(processes=2, max_tasks_per_child=None) as pool:
+        assert pool.health_check(timeout=60)
+        assert pool.starmap(pow, [(2, 3), (3, 2)]) == [8, 9]
+        assert pool.apply_async(pow, (2, 5)).get(timeout=60) == 32
+        assert pool.tasks_submitted == 3
+
+def test_workers_have_encoders_preloaded():
+    with WarmWorkerPool(processes=1) as pool:
+        status = pool.apply_async(worker_status, (pool.preload_modules,)).get(timeout=60)
+        assert "algorithms.EUMAS_2025.implemenation_guide.algorithm_1" in pool.preload_modules
+        assert status['missing_modules'] == []
+
+def test_workers_are_recycled_after_max_tasks():
+    with WarmWorkerPool(processes=1, max_tasks_per_child=1) as pool:
+        pids = {pool.apply_async(os.getpid).get(timeout=60) for _ in range(3)}
+        assert len(pids) == 3
+
+def test_recycle_and_close():
+    pool = WarmWorkerPool(processes=1, max_tasks_per_child=None)
+    first_pid = pool.apply_async(os.getpid).get(timeout=60)
+    pool.recycle()
+    assert pool.apply_async(os.getpid).get(timeout=60) != first_pid
+    pool.close()
+    assert not pool.health_check()
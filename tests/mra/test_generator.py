@@ -0,0 +1,74 @@
+import pytest
+from mra.generator import (
+    ring_mra,
+    full_mra,
+    random_mra,
+    articulation_chain_mra,
+    separable_mra,
+    generate_mra,
+    write_scenario,
+    main
+)
+from utils.yaml_parser import parse_mra_from_yaml
+
+class TestGenerator:
+    def test_ring(self):
+        """Test that ring neighbours share access_degree - 1 resources."""
+        mra = ring_mra(4, demand=[2, 1])
+
+        assert mra.res == {1, 2, 3, 4}
+        assert [a.acc for a in mra.agt] == [{1, 2}, {2, 3}, {3, 4}, {4, 1}]
+        assert [a.d for a in mra.agt] == [2, 1, 2, 1]
+
+    def test_full(self):
+        """Test that every agent accesses every resource."""
+        mra = full_mra(3, 5, demand=2)
+
+        assert all(a.acc == {1, 2, 3, 4, 5} and a.d == 2 for a in mra.agt)
+
+    def test_random_is_seeded(self):
+        """Test that random access sets depend only on the seed."""
+        mra = random_mra(4, 6, density=0.5, demand=(1, 3), seed=7)
+
+        assert mra == random_mra(4, 6, density=0.5, demand=(1, 3), seed=7)
+        assert all(len(a.acc) == 3 and 1 <= a.d <= 3 for a in mra.agt)
+
+    def test_articulation_chain(self):
+        """Test that consecutive clusters share exactly one resource."""
+        mra = articulation_chain_mra(3, agents_per_cluster=2, resources_per_cluster=1)
+
+        assert mra.res == {1, 2, 3, 4, 5}
+        assert [a.acc for a in mra.agt] == [{1, 2}, {1, 2}, {2, 3, 4}, {2, 3, 4}, {4, 5}, {4, 5}]
+
+    def test_separable(self):
+        """Test that clusters access disjoint resources."""
+        mra = separable_mra(2, agents_per_cluster=2, resources_per_cluster=3, demand=[3, 1])
+
+        assert [(a.d, a.acc) for a in mra.agt] == [(3, {1, 2, 3}), (1, {1, 2, 3}), (3, {4, 5, 6}), (1, {4, 5, 6})]
+
+    def test_demand_is_capped_at_access(self):
+        """Test that no agent demands more resources than it can access."""
+        mra = ring_mra(3, access_degree=2, demand=5)
+
+        assert all(a.d == 2 for a in mra.agt)
+
+    def test_generate_rejects_unknown_family(self):
+        """Test that unknown families are rejected."""
+        with pytest.raises(ValueError, match="Unknown family"):
+            generate_mra("star", num_agents=3)
+
+    def test_write_scenario(self, tmp_path):
+        """Test that generated scenarios are written in the YAML scenario format."""
+        path = str(tmp_path / "ring.yml")
+        mra = write_scenario("ring", {'num_agents': 5, 'demand': 1}, 2, 4, path)
+
+        assert parse_mra_from_yaml(path) == (mra, 2, 4)
+
+    def test_main_writes_one_scenario_per_seed(self, tmp_path):
+        """Test that the command line writes one file per seed."""
+        main(["random", "--agents", "3", "--resources", "4", "--demand", "1:2", "--seeds", "0", "1", "--output_dir", str(tmp_path)])
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "random_a3_r4_p0.5_dem1-2_s0.yml",
+            "random_a3_r4_p0.5_dem1-2_s1.yml",
+        ]
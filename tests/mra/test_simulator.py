@@ -0,0 +1,62 @@
+from array import array
+import pytest
+from mra.agent import Agent
+from mra.problem import MRA
+from mra.strategy import StrategyProfile
+
+np = pytest.importorskip("numpy")
+from mra.simulator import Simulator
+
+def h_mra() -> MRA:
+    return MRA(agt=[Agent(id=1, d=1, acc={1}), Agent(id=2, d=1, acc={1, 2})], res={1, 2})
+
+def h_alternating_profile() -> StrategyProfile:
+    # a1 requests r1 when it is free and releases it when it holds it; a2 always requests r2 when free
+    profile = StrategyProfile.for_mra(h_mra())
+    a1, a2 = profile.tables[1], profile.tables[2]
+    a1.actions[a1.index([0])] = 2       # req1
+    a1.actions[a1.index([1])] = 1       # relall
+    for r1 in (0, 1, 2):
+        a2.actions[a2.index([r1, 0])] = 4  # req2
+        a2.actions[a2.index([r1, 2])] = 0  # idle
+    return profile
+
+class TestSimulator:
+    def test_step(self):
+        """Test requests, conflicts, keeping and releasing resources (Def 13)."""
+        simulator = Simulator(h_mra())
+        states = [[0, 0], [0, 0], [1, 2], [1, 2]]
+        actions = [[2, 4], [2, 2], [0, 0], [1, 5]]  # single requests, conflict on r1, idle, relall and rel2
+
+        assert simulator.step(states, actions).tolist() == [[1, 2], [0, 0], [1, 2], [0, 0]]
+
+    def test_rollout_detects_loop_and_payoff(self):
+        """Test that a rollout finds the loop and its goal frequency."""
+        simulator = Simulator(h_mra(), h_alternating_profile())
+
+        rollout = simulator.rollout(simulator.initial_states(2))
+
+        assert rollout.states[:3, 0].tolist() == [[0, 0], [1, 2], [0, 2]]
+        assert rollout.loop_start.tolist() == [1, 1] and rollout.loop_size.tolist() == [2, 2]
+        # Loop [1, 2] -> [0, 2]: a1 reaches its goal once, a2 twice
+        assert rollout.payoff().tolist() == [1.5, 1.5]
+
+    def test_batch_of_profiles_and_replay(self):
+        """Test that trajectories run under their own profile and that traces are replayed."""
+        idle = StrategyProfile.for_mra(h_mra())
+        for table in idle.tables.values():
+            table.actions[:] = array('h', [0]) * table.num_observations
+        simulator = Simulator(h_mra(), [h_alternating_profile(), idle])
+
+        rollout = simulator.rollout([[0, 0], [0, 0]], profile_index=[0, 1])
+
+        assert rollout.loop_size.tolist() == [2, 1]
+        assert simulator.replay([[0, 0], [1, 2], [0, 2]], [[2, 4], [1, 0], [0, 0]]) == []
+        assert simulator.replay([[0, 0], [1, 0]], [[2, 4], [0, 0]]) == [0]
+
+    def test_goals_of_zero_and_unreachable_demands(self):
+        """Test that demand 0 is always a goal and a demand above the access never is (Def 19)."""
+        mra = MRA(agt=[Agent(id=1, d=0, acc={1}), Agent(id=2, d=1, acc={1}), Agent(id=3, d=2, acc={1})], res={1})
+        simulator = Simulator(mra)
+
+        assert simulator.goals([[0], [2], [3]]).tolist() == [[True, False, False], [True, True, False], [True, False, False]]
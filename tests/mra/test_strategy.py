@@ -0,0 +1,40 @@
+import pytest
+from array import array
+from mra.agent import Agent
+from mra.problem import MRA
+from mra.strategy import StrategyProfile, StrategyTable, UNDECIDED, action_name
+
+def h_mra() -> MRA:
+    return MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=1, acc={2})], res={1, 2})
+
+class TestStrategyTable:
+    def test_mixed_radix_index(self):
+        """Test that observations are indexed in mixed radix over Acc(a) and the possible owners."""
+        table = StrategyTable.for_agent(h_mra().agt[0], h_mra())
+
+        assert table.owners == [[0, 1], [0, 1, 2]]
+        assert table.num_observations == 6
+        assert [table.index(table.observation(i)) for i in range(6)] == list(range(6))
+        assert table.index({1: 1, 2: 2}) == table.index([1, 2]) == 5
+        assert table.observe([1, 2]) == 5
+        assert table.decide([0, 0]) == UNDECIDED
+
+    def test_wrong_size(self):
+        """Test that a table with the wrong number of actions is rejected."""
+        with pytest.raises(ValueError):
+            StrategyTable(1, [1], [[0, 1]], array('h', [0, 0, 0]))
+
+    def test_profile_save_load(self, tmp_path):
+        """Test that a profile round-trips through its file and decides joint actions."""
+        profile = StrategyProfile.for_mra(h_mra())
+        profile.tables[1].actions[profile.tables[1].index([0, 0])] = 2  # req1
+        profile.tables[2].actions[:] = array('h', [4, 5, 1])            # req2, rel2, relall
+
+        path = str(tmp_path / "strategy.json")
+        profile.save(path)
+        loaded = StrategyProfile.load(path)
+
+        assert loaded == profile
+        assert loaded.joint_action([0, 0]) == [2, 4]
+        assert loaded.decide(2, {2: 1}) == 5
+        assert [action_name(c) for c in (0, 1, 2, 5, UNDECIDED)] == ["idle", "relall", "req1", "rel2", "undecided"]
@@ -0,0 +1,57 @@
+import multiprocessing
+
+import pytest
+from utils import telemetry
+from utils.telemetry import configure_telemetry, emit, phase, telemetry_context, read_events, summarise_phases
+
+@pytest.fixture
+def sink(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    configure_telemetry(path)
+    yield path
+    configure_telemetry(None)
+
+def h_emit_events(worker: int, count: int):
+    with telemetry_context(worker=worker):
+        for i in range(count):
+            emit("tick", i=i, padding="x" * 512)
+
+class TestTelemetry:
+    def test_disabled_without_sink(self):
+        """Test that events are dropped when no sink is configured."""
+        configure_telemetry(None)
+        emit("tick")
+        assert not telemetry.telemetry_enabled()
+
+    def test_phase_with_context(self, sink):
+        """Test that phases carry their duration, the context and the fields added in the block."""
+        with telemetry_context(scenario_hash="abc", k=3):
+            with phase("clausify") as event:
+                event['num_clauses'] = 42
+        emit("result", status="success")
+
+        first, second = read_events(sink)
+        assert first['event'] == "phase" and first['phase'] == "clausify"
+        assert (first['scenario_hash'], first['k'], first['num_clauses']) == ("abc", 3, 42)
+        assert first['duration'] >= 0
+        assert "k" not in second and second['status'] == "success"
+
+    def test_concurrent_processes_write_whole_lines(self, sink):
+        """Test that events of several processes end up as complete, separate lines."""
+        with multiprocessing.Pool(3) as pool:
+            pool.starmap(h_emit_events, [(worker, 200) for worker in range(3)])
+
+        events = read_events(sink)
+        with open(sink) as f:
+            assert sum(1 for _ in f) == 600
+        assert len(events) == 600
+        assert sorted(sum(1 for e in events if e['worker'] == w) for w in range(3)) == [200, 200, 200]
+
+    def test_summarise_phases(self):
+        """Test that phase durations are aggregated per phase."""
+        events = [
+            {'event': 'phase', 'phase': 'solve', 'duration': 1.0},
+            {'event': 'phase', 'phase': 'solve', 'duration': 3.0},
+            {'event': 'result', 'status': 'success'},
+        ]
+        assert summarise_phases(events) == {'solve': {'count': 2, 'total': 4.0, 'max': 3.0, 'mean': 2.0}}
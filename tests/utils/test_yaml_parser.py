@@ -0,0 +1,48 @@
+import pytest
+from mra.agent import Agent
+from mra.problem import MRA
+from utils.yaml_parser import parse_mra_from_yaml, parse_legacy_mra_from_yaml, write_mra_to_yaml
+
+LEGACY_SCENARIO = """
+agents: [a1, a2]
+resources: [r1, r2, r3, r4]
+a1:
+  demand: 2
+  access: [r3, r1]
+a2:
+  demand: 1
+  access: [r3]
+k: 6
+"""
+
+class TestYamlParser:
+    def test_write_round_trip(self, tmp_path):
+        """Test that a written MRA parses back to the same problem."""
+        mra = MRA(agt=[Agent(id=1, d=1, acc={1, 2}), Agent(id=2, d=2, acc={2, 3})], res={1, 2, 3})
+        path = str(tmp_path / "scenario.yml")
+
+        write_mra_to_yaml(mra, 2, 5, path)
+        parsed, k_start, k_end = parse_mra_from_yaml(path)
+
+        assert (k_start, k_end) == (2, 5)
+        assert parsed.res == mra.res
+        assert [(a.id, a.d, a.acc) for a in parsed.agt] == [(a.id, a.d, a.acc) for a in mra.agt]
+
+    def test_parse_legacy_keeps_accessed_resources(self, tmp_path):
+        """Test that legacy scenarios only keep the resources that are accessed."""
+        path = tmp_path / "legacy.yml"
+        path.write_text(LEGACY_SCENARIO)
+
+        mra, k = parse_legacy_mra_from_yaml(str(path))
+
+        assert k == 6
+        assert mra.res == {1, 2}
+        assert [(a.id, a.d, a.acc) for a in mra.agt] == [(1, 2, {1, 2}), (2, 1, {2})]
+
+    def test_parse_legacy_requires_k(self, tmp_path):
+        """Test that a legacy scenario without an integer k is rejected."""
+        path = tmp_path / "legacy.yml"
+        path.write_text(LEGACY_SCENARIO.replace("k: 6", "k: [1, 2]"))
+
+        with pytest.raises(ValueError, match="'k'"):
+            parse_legacy_mra_from_yaml(str(path))